@@ -0,0 +1,245 @@
+"""Storing pipeline results on applications, and the durable processing queue.
+
+In the default 'sync' mode submit_application runs the ML pipeline inside the
+request. In 'queue' mode (APPLICATION_PROCESSING_MODE=queue) the upload is
+saved, the application is created in the 'processing' state and a row is
+added to the processing_tasks table; worker processes started with
+scripts/run_processing_workers.py claim those rows and finish the pipeline.
+"""
+import json
+import os
+import time
+import traceback
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from models import JobPosting, Application, ProcessingTask
+from ml_integration.pipeline import score_resume_for_job
+from ml_integration.job_profile import get_job_profile
+from extraction_pool import ExtractionError, extract_resume_file
+from score_index import record_application
+from skill_bitmap import invalidate_skill_bitmaps
+from skill_index import application_skill_fields
+from percentile_store import DISTRIBUTION_FIELDS, application_day, record_score_change, store_percentile
+
+# Processing configuration - load from environment variables
+APPLICATION_PROCESSING_MODE = os.getenv("APPLICATION_PROCESSING_MODE", "sync")  # 'sync' or 'queue'
+PROCESSING_MAX_ATTEMPTS = int(os.getenv("PROCESSING_MAX_ATTEMPTS", "3"))
+PROCESSING_STALE_SECONDS = int(os.getenv("PROCESSING_STALE_SECONDS", "600"))
+
+
+def build_application_fields(db: Session, job: JobPosting, result: Dict) -> Dict:
+    """
+    Turn a pipeline result into Application column values, including percentiles.
+
+    Args:
+        db: Database session (percentiles come from the stored score distributions)
+        job: Job the application belongs to
+        result: Output of ml_integration.pipeline.score_resume_for_job
+
+    Returns:
+        Dictionary of Application column (or relationship) -> value
+    """
+    processed_data = result['processed']
+    scores = result['scores']
+    cluster_info = result['cluster']
+    gap_analysis = result['gap']
+
+    # Calculate percentiles (against all applications, zero scores left out)
+    overall_percentile = store_percentile(db, "all", "", "final_score", scores['final_score'], exclude_zero=True)
+
+    # Calculate category percentile (against applications in same category)
+    category_percentile = store_percentile(db, "category", job.category or "", "final_score", scores['final_score'])
+
+    # NEW: Calculate component-level percentiles
+    skills_percentile = store_percentile(db, "all", "", "skills_score", scores['skills_score'], exclude_zero=True)
+    experience_percentile = store_percentile(db, "all", "", "experience_score", scores['experience_score'], exclude_zero=True)
+    education_percentile = store_percentile(db, "all", "", "education_score", scores['education_score'], exclude_zero=True)
+
+    # NEW: Prepare skills by category counts
+    skills_by_category_counts = {
+        category: len(skills_list)
+        for category, skills_list in processed_data['skills_by_category'].items()
+    }
+
+    return {
+        "resume_text": result['resume_text'],
+        # ML fields
+        "extracted_skills": json.dumps(processed_data['extracted_skills']),
+        **application_skill_fields(job.id, processed_data['extracted_skills']),
+        "num_skills": processed_data['num_skills'],
+        "skill_diversity": processed_data['skill_diversity'],
+        "experience_years": processed_data['experience_years'],
+        "education_level": processed_data['education_level'],
+        "has_certifications": processed_data['has_certifications'],
+        "has_leadership": processed_data['has_leadership'],
+        # NEW: Skills by category
+        "skills_by_category": json.dumps(skills_by_category_counts),
+        "technical_skills_count": processed_data['technical_skills_count'],
+        # Requirements check (Stage 1)
+        "meets_requirements": scores['meets_requirements'],
+        "missing_requirements": json.dumps(scores['missing_requirements']),
+        "rejection_reason": scores['rejection_reason'],
+        # Scores (Stage 2)
+        "skills_score": scores['skills_score'],
+        "experience_score": scores['experience_score'],
+        "education_score": scores['education_score'],
+        "bonus_score": scores['bonus_score'],
+        "final_score": scores['final_score'],
+        # Rankings
+        "overall_percentile": overall_percentile,
+        "category_percentile": category_percentile,
+        # NEW: Component percentiles
+        "skills_percentile": skills_percentile,
+        "experience_percentile": experience_percentile,
+        "education_percentile": education_percentile,
+        # Clustering
+        "cluster_id": cluster_info['cluster_id'],
+        "cluster_name": cluster_info['cluster_name'],
+        "cluster_description": cluster_info['cluster_description'],
+        # Skill gap
+        "matched_skills": json.dumps(gap_analysis['matched_skills']),
+        "missing_skills": json.dumps(gap_analysis['missing_skills']),
+        "skill_match_percentage": gap_analysis['overall_match_percentage'],
+        "recommendations": json.dumps(gap_analysis['recommendations']),
+        # NEW: Detailed skill gap
+        "matched_required_skills": json.dumps(gap_analysis['matched_required']),
+        "matched_preferred_skills": json.dumps(gap_analysis['matched_preferred']),
+        "missing_required_skills": json.dumps(gap_analysis['missing_required']),
+        "missing_preferred_skills": json.dumps(gap_analysis['missing_preferred']),
+        "required_match_percentage": gap_analysis['required_match_percentage'],
+        "processing_status": "completed",
+        "processing_error": None,
+        "scoring_version": job.scoring_version or 1,
+    }
+
+
+def enqueue_application(db: Session, application: Application) -> ProcessingTask:
+    """Add a processing task for an application (committed by the caller)."""
+    task = ProcessingTask(application_id=application.id)
+    db.add(task)
+    return task
+
+
+def claim_next_task(db: Session) -> Optional[ProcessingTask]:
+    """
+    Atomically claim the oldest queued task (or one whose worker died).
+
+    The conditional UPDATE only succeeds for one worker even when several
+    processes race for the same row.
+    """
+    stale_before = datetime.utcnow() - timedelta(seconds=PROCESSING_STALE_SECONDS)
+
+    candidates = db.query(ProcessingTask.id).filter(
+        (ProcessingTask.status == "queued") |
+        ((ProcessingTask.status == "running") & (ProcessingTask.locked_at < stale_before))
+    ).order_by(ProcessingTask.id).limit(10).all()
+
+    for (task_id,) in candidates:
+        now = datetime.utcnow()
+        claimed = db.query(ProcessingTask).filter(
+            ProcessingTask.id == task_id,
+            (ProcessingTask.status == "queued") |
+            ((ProcessingTask.status == "running") & (ProcessingTask.locked_at < stale_before))
+        ).update(
+            {
+                ProcessingTask.status: "running",
+                ProcessingTask.locked_at: now,
+                ProcessingTask.updated_at: now,
+                ProcessingTask.attempts: ProcessingTask.attempts + 1,
+            },
+            synchronize_session=False
+        )
+        db.commit()
+        if claimed:
+            return db.query(ProcessingTask).filter(ProcessingTask.id == task_id).first()
+
+    return None
+
+
+def process_task(db: Session, task: ProcessingTask):
+    """Run the ML pipeline for a claimed task and store the results."""
+    application = db.query(Application).filter(Application.id == task.application_id).first()
+    job = None
+    if application is not None:
+        job = db.query(JobPosting).filter(JobPosting.id == application.job_id).first()
+
+    if application is None or job is None:
+        task.status = "failed"
+        task.last_error = "Application or job no longer exists"
+        task.updated_at = datetime.utcnow()
+        db.commit()
+        return
+
+    if task.attempts > PROCESSING_MAX_ATTEMPTS:
+        # Workers kept dying on this one (it was reclaimed as stale each time)
+        task.status = "failed"
+        task.updated_at = datetime.utcnow()
+        application.processing_status = "failed"
+        application.processing_error = "Error processing resume: worker did not finish"
+        db.commit()
+        return
+
+    try:
+        resume_text = extract_resume_file(application.resume_file_path)
+        result = score_resume_for_job(resume_text, get_job_profile(job))
+        fields = build_application_fields(db, job, result)
+        old_scores = {field: getattr(application, field) for field in DISTRIBUTION_FIELDS}
+        for field, value in fields.items():
+            setattr(application, field, value)
+        record_score_change(db, job.id, job.category, old_scores, fields, application_day(application.applied_at))
+
+        task.status = "done"
+        task.last_error = None
+        task.updated_at = datetime.utcnow()
+        db.commit()
+        record_application(application)
+        invalidate_skill_bitmaps(job.id)
+
+    except ExtractionError as e:
+        # The same file would hit the same limit again, so don't retry
+        db.rollback()
+        task.status = "failed"
+        task.last_error = f"{e.code}: {e.message}"
+        task.updated_at = datetime.utcnow()
+        application.processing_status = "failed"
+        application.processing_error = f"{e.code}: {e.message}"
+        db.commit()
+
+    except Exception as e:
+        db.rollback()
+        task.last_error = f"{e}\n{traceback.format_exc()}"
+        task.updated_at = datetime.utcnow()
+
+        if task.attempts >= PROCESSING_MAX_ATTEMPTS:
+            task.status = "failed"
+            application.processing_status = "failed"
+            application.processing_error = f"Error processing resume: {str(e)}"
+        else:
+            # Leave it for another attempt
+            task.status = "queued"
+        db.commit()
+
+
+def run_worker(session_factory, poll_interval: float = 1.0, stop_event=None):
+    """
+    Process queued applications until stop_event is set.
+
+    Args:
+        session_factory: Callable returning a new Session
+        poll_interval: Seconds to sleep when the queue is empty
+        stop_event: Optional multiprocessing/threading Event to stop the loop
+    """
+    while stop_event is None or not stop_event.is_set():
+        db = session_factory()
+        try:
+            task = claim_next_task(db)
+            if task is not None:
+                process_task(db, task)
+        finally:
+            db.close()
+
+        if task is None:
+            time.sleep(poll_interval)
@@ -6,8 +6,9 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from database import get_db
+from database import get_db, get_async_db
 from models import User
 
 # Security configuration
@@ -69,11 +70,8 @@ def decode_access_token(token: str) -> dict:
         )
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get the current authenticated user from JWT token."""
+def _token_user_id(credentials: HTTPAuthorizationCredentials) -> int:
+    """User id from a bearer token (401 if the token is invalid)."""
     token = credentials.credentials
     payload = decode_access_token(token)
 
@@ -86,23 +84,42 @@ def get_current_user(
 
     # Convert to int (JWT may return as string or int)
     try:
-        user_id = int(user_id_raw)
+        return int(user_id_raw)
     except (ValueError, TypeError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token format"
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+
+def _require_user(user: Optional[User]) -> User:
+    """The token's user, or 401 if it no longer exists."""
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
-
     return user
 
 
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """Get the current authenticated user from JWT token."""
+    user_id = _token_user_id(credentials)
+    return _require_user(db.query(User).filter(User.id == user_id).first())
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """get_current_user for async endpoints (loads the user on the async session)."""
+    user_id = _token_user_id(credentials)
+    return _require_user(await db.get(User, user_id))
+
+
 def get_current_candidate(current_user: User = Depends(get_current_user)) -> User:
     """Ensure the current user is a candidate."""
     if current_user.role != "candidate":
@@ -121,3 +138,13 @@ def get_current_recruiter(current_user: User = Depends(get_current_user)) -> Use
             detail="Only recruiters can access this resource"
         )
     return current_user
+
+
+async def get_current_candidate_async(current_user: User = Depends(get_current_user_async)) -> User:
+    """get_current_candidate for async endpoints (async, so it doesn't take a threadpool slot)."""
+    return get_current_candidate(current_user)
+
+
+async def get_current_recruiter_async(current_user: User = Depends(get_current_user_async)) -> User:
+    """get_current_recruiter for async endpoints (async, so it doesn't take a threadpool slot)."""
+    return get_current_recruiter(current_user)
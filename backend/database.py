@@ -1,20 +1,135 @@
 """Database configuration and session management."""
-from sqlalchemy import create_engine
+import os
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Database configuration - load from environment variables
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./ats_database.db")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "8"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "8"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+
+# Async engine for the async endpoints; defaults to DATABASE_URL with its
+# async driver (sqlite -> sqlite+aiosqlite)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", "")
+ASYNC_DB_POOL_SIZE = int(os.getenv("ASYNC_DB_POOL_SIZE", "8"))
+ASYNC_DB_MAX_OVERFLOW = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "0"))
+
+# SQLite connection pragmas (set on every new connection)
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "10000"))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+SQLITE_MMAP_SIZE_MB = int(os.getenv("SQLITE_MMAP_SIZE_MB", "256"))
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Configure a new SQLite connection.
+
+    WAL lets readers run while a writer commits (and vice versa);
+    synchronous=NORMAL is durable across application crashes in WAL mode
+    and only fsyncs at checkpoints; busy_timeout makes a writer wait for
+    the write lock instead of failing with "database is locked".
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA journal_mode = {SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous = {SQLITE_SYNCHRONOUS}")
+        # Negative cache_size is in KiB rather than pages
+        cursor.execute(f"PRAGMA cache_size = -{SQLITE_CACHE_SIZE_KB}")
+        cursor.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE_MB * 1024 * 1024}")
+    finally:
+        cursor.close()
+
+
+def _engine_options(url, pool_size: int, max_overflow: int) -> dict:
+    """create_engine arguments shared by the sync and async engines."""
+    options = {}
+    if url.get_backend_name() == "sqlite":
+        # Sessions are used from the threadpool; the pool hands each
+        # connection to one thread at a time
+        options["connect_args"] = {"check_same_thread": False}
+    if not _is_sqlite_memory(url):
+        options.update(pool_size=pool_size, max_overflow=max_overflow, pool_timeout=DB_POOL_TIMEOUT_SECONDS)
+    return options
+
+
+def _is_sqlite_memory(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def create_db_engine(url: str = SQLALCHEMY_DATABASE_URL, **kwargs) -> Engine:
+    """
+    Create an engine for url; SQLite file databases get the pragmas above.
+
+    Args:
+        url: SQLAlchemy database URL
+        **kwargs: Extra create_engine arguments (override the defaults)
+
+    Returns:
+        Configured SQLAlchemy engine
+    """
+    url = make_url(url)
+    options = _engine_options(url, DB_POOL_SIZE, DB_MAX_OVERFLOW)
+    options.update(kwargs)
+
+    engine = create_engine(url, **options)
+    if url.get_backend_name() == "sqlite" and not _is_sqlite_memory(url):
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+def async_database_url(url: str) -> str:
+    """The async-driver form of a database URL (sqlite -> sqlite+aiosqlite)."""
+    url = make_url(url)
+    if url.drivername == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+
+def create_async_db_engine(url: str = "", **kwargs) -> AsyncEngine:
+    """
+    Create an async engine; SQLite file databases get the same pragmas.
+
+    Args:
+        url: Async SQLAlchemy database URL (default: ASYNC_DATABASE_URL, or
+            DATABASE_URL with its async driver)
+        **kwargs: Extra create_async_engine arguments (override the defaults)
+
+    Returns:
+        Configured AsyncEngine
+    """
+    url = make_url(url or ASYNC_DATABASE_URL or async_database_url(SQLALCHEMY_DATABASE_URL))
+    options = _engine_options(url, ASYNC_DB_POOL_SIZE, ASYNC_DB_MAX_OVERFLOW)
+    if "pool_size" in options:
+        # aiosqlite defaults to opening a connection (and its thread) per checkout
+        options["poolclass"] = AsyncAdaptedQueuePool
+    options.update(kwargs)
+
+    engine = create_async_engine(url, **options)
+    if url.get_backend_name() == "sqlite" and not _is_sqlite_memory(url):
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
 
-# SQLite database URL
-SQLALCHEMY_DATABASE_URL = "sqlite:///./ats_database.db"
 
 # Create SQLAlchemy engine
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
-)
+engine = create_db_engine()
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine and sessions for the async endpoints; objects stay usable
+# after commit because responses are built from them
+async_engine = create_async_db_engine()
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -28,7 +143,19 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Dependency for getting an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
-    """Initialize database tables."""
-    from models import User, JobPosting, Application
+    """Initialize database tables and the skills vocabulary."""
+    from models import (
+        User, JobPosting, Application, ApplicationResume, ProcessingTask, ScoreHistogramBucket, ScoreSketchRecord,
+        Skill, SkillVocabulary, ApplicationSkill, JobSkill
+    )
+    from skill_index import sync_skills
     Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        sync_skills(db)
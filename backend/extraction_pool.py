@@ -0,0 +1,307 @@
+"""Supervised, resource-limited subprocesses for resume text extraction.
+
+A malformed or adversarial PDF can keep PyPDF2 busy for minutes or make it
+allocate without bound. Text extraction therefore runs in a small pool of
+long-lived worker processes, each with an address-space limit
+(EXTRACTION_MEMORY_MB) and a per-document CPU-time limit
+(EXTRACTION_CPU_SECONDS), plus a wall-clock deadline enforced by the parent
+(EXTRACTION_TIMEOUT_SECONDS). A worker that exceeds a limit is killed and
+replaced; the caller gets an ExtractionError whose code ("extraction_timeout",
+"extraction_memory_exceeded", ...) is passed on to the API client.
+"""
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: only the wall-clock deadline applies
+    resource = None
+
+from ml_integration.resume_parser import extract_text_from_file
+
+# Extraction configuration - load from environment variables
+EXTRACTION_ISOLATION = os.getenv("EXTRACTION_ISOLATION", "1") != "0"  # 0 = extract in-process
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", "2"))
+EXTRACTION_CPU_SECONDS = int(os.getenv("EXTRACTION_CPU_SECONDS", "20"))
+EXTRACTION_MEMORY_MB = int(os.getenv("EXTRACTION_MEMORY_MB", "1024"))
+EXTRACTION_TIMEOUT_SECONDS = float(os.getenv("EXTRACTION_TIMEOUT_SECONDS", "30"))
+EXTRACTION_MAX_DOCUMENTS = int(os.getenv("EXTRACTION_MAX_DOCUMENTS", "200"))  # recycle workers after N documents
+
+
+class ExtractionError(Exception):
+    """Extraction was aborted by the supervisor (limit exceeded, worker crashed, pool busy)."""
+
+    def __init__(self, code: str, message: str, status_code: int = 422):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status_code = status_code
+
+    def to_detail(self) -> Dict[str, str]:
+        """Structured error body for HTTPException.detail."""
+        return {"error": self.code, "message": self.message}
+
+
+def _worker_main(conn, cpu_seconds: int, memory_mb: int):
+    """Serve (fn, args) requests from the parent until told to stop."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Spawned workers start with unconfigured logging (page timings are logged here)
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+
+    if resource is not None and memory_mb:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_mb * 1024 * 1024, hard))
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+
+        fn, args = request
+        if resource is not None and cpu_seconds:
+            # RLIMIT_CPU counts the whole process lifetime, so move the soft
+            # limit to "CPU used so far + budget" for every document;
+            # exceeding it delivers SIGXCPU, which terminates the worker
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            used = int(usage.ru_utime + usage.ru_stime) + 1
+            _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+            resource.setrlimit(resource.RLIMIT_CPU, (used + cpu_seconds, hard))
+
+        try:
+            conn.send(("ok", fn(*args)))
+        except MemoryError:
+            # The heap may be fragmented or near the limit; let the parent replace us
+            conn.send(("memory", None))
+            return
+        except Exception as e:
+            conn.send(("error", str(e)))
+
+
+class _Worker:
+    """One extraction subprocess and the parent's end of its pipe."""
+
+    def __init__(self, ctx, cpu_seconds: int, memory_mb: int):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, cpu_seconds, memory_mb),
+            name="extraction-worker",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.documents = 0
+
+    def kill(self):
+        """Terminate the process immediately."""
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        """Ask the process to exit, killing it if it doesn't."""
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+
+class ExtractionPool:
+    """Fixed number of supervised extraction subprocesses."""
+
+    def __init__(
+        self,
+        workers: int,
+        cpu_seconds: int,
+        memory_mb: int,
+        timeout_seconds: float,
+        max_documents: int = 0
+    ):
+        self.workers = max(1, workers)
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self.timeout_seconds = timeout_seconds
+        self.max_documents = max_documents
+        self._ctx = multiprocessing.get_context("spawn")
+        self._slots = threading.BoundedSemaphore(self.workers)
+        self._lock = threading.Lock()
+        self._idle: List[_Worker] = []
+        self._counters = {
+            "documents": 0,
+            "timeouts": 0,
+            "memory_kills": 0,
+            "crashes": 0,
+            "recycled": 0,
+            "busy_rejections": 0,
+        }
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _checkout(self) -> _Worker:
+        """Take an idle live worker, or start a new one."""
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.is_alive():
+                    return worker
+                worker.kill()
+        return _Worker(self._ctx, self.cpu_seconds, self.memory_mb)
+
+    def _checkin(self, worker: _Worker):
+        """Return a worker to the idle list, recycling it after max_documents."""
+        if self.max_documents and worker.documents >= self.max_documents:
+            worker.stop()
+            self._count("recycled")
+            return
+        with self._lock:
+            self._idle.append(worker)
+
+    def run(self, fn: Callable, *args):
+        """
+        Run fn(*args) in a supervised worker and return its result.
+
+        fn must be importable by the worker (a module-level function).
+
+        Raises:
+            ExtractionError: Limit exceeded, worker crashed, or no worker became free in time
+            ValueError: fn raised an ordinary exception (message preserved)
+        """
+        if not self._slots.acquire(timeout=self.timeout_seconds):
+            self._count("busy_rejections")
+            raise ExtractionError(
+                "extraction_busy",
+                "All resume extraction workers are busy, please retry shortly",
+                status_code=503
+            )
+
+        try:
+            worker = self._checkout()
+            worker.documents += 1
+            self._count("documents")
+            started = time.monotonic()
+
+            try:
+                worker.conn.send((fn, args))
+                finished = worker.conn.poll(self.timeout_seconds)
+                outcome, payload = worker.conn.recv() if finished else ("timeout", None)
+            except (EOFError, OSError):
+                # The worker died mid-document (e.g. SIGXCPU or the OOM killer)
+                worker.process.join(timeout=1)
+                outcome = "cpu" if worker.process.exitcode == -getattr(signal, "SIGXCPU", -1) else "crash"
+                payload = None
+
+            if outcome == "ok":
+                self._checkin(worker)
+                return payload
+            if outcome == "error":
+                self._checkin(worker)
+                raise ValueError(payload)
+
+            worker.kill()
+            if outcome in ("timeout", "cpu"):
+                self._count("timeouts")
+                elapsed = time.monotonic() - started
+                raise ExtractionError(
+                    "extraction_timeout",
+                    f"Resume text extraction was stopped after {elapsed:.1f}s; "
+                    "the file may be malformed or too complex"
+                )
+            if outcome == "memory":
+                self._count("memory_kills")
+                raise ExtractionError(
+                    "extraction_memory_exceeded",
+                    f"Resume text extraction exceeded the {self.memory_mb} MB memory limit"
+                )
+            self._count("crashes")
+            raise ExtractionError(
+                "extraction_failed",
+                "Resume text extraction worker crashed on this file"
+            )
+        finally:
+            self._slots.release()
+
+    def extract_file(self, file_path: str) -> str:
+        """Extract resume text from a stored PDF/DOCX in a supervised worker."""
+        return self.run(extract_text_from_file, str(file_path))
+
+    def stats(self) -> Dict:
+        """Supervisor counters for monitoring."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["idle_workers"] = len(self._idle)
+        stats.update({
+            "max_workers": self.workers,
+            "cpu_seconds": self.cpu_seconds,
+            "memory_mb": self.memory_mb,
+            "timeout_seconds": self.timeout_seconds,
+        })
+        return stats
+
+    def shutdown(self):
+        """Stop every idle worker."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+
+_extraction_pool: Optional[ExtractionPool] = None
+_extraction_pool_lock = threading.Lock()
+
+
+def get_extraction_pool() -> ExtractionPool:
+    """Get the process-wide extraction pool (configured from the environment)."""
+    global _extraction_pool
+
+    if _extraction_pool is None:
+        with _extraction_pool_lock:
+            if _extraction_pool is None:
+                _extraction_pool = ExtractionPool(
+                    EXTRACTION_WORKERS,
+                    EXTRACTION_CPU_SECONDS,
+                    EXTRACTION_MEMORY_MB,
+                    EXTRACTION_TIMEOUT_SECONDS,
+                    EXTRACTION_MAX_DOCUMENTS
+                )
+
+    return _extraction_pool
+
+
+def extract_resume_file(file_path: str) -> str:
+    """
+    Extract text from a stored resume, isolated unless EXTRACTION_ISOLATION=0.
+
+    The worker reads the file itself, so the document never has to be held
+    in (or piped through) the API process.
+
+    Args:
+        file_path: Path of the PDF/DOCX file
+
+    Returns:
+        Extracted text
+
+    Raises:
+        ExtractionError: The document exceeded a resource limit
+    """
+    if not EXTRACTION_ISOLATION:
+        return extract_text_from_file(str(file_path))
+    return get_extraction_pool().extract_file(file_path)
+
+
+def shutdown_extraction_pool():
+    """Stop the extraction workers, if any were started."""
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown()
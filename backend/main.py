@@ -1,14 +1,21 @@
 """Main FastAPI application for ATS backend."""
+import logging
 import os
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from database import init_db
+from database import async_engine, init_db
+from ml_integration.resume_cache import get_resume_cache
+from ml_executor import ml_executor
+from extraction_pool import get_extraction_pool, shutdown_extraction_pool
 
 # Import routers
 from routers import auth, jobs, applications, recommendations
 
+# Application log level (resume extraction reports page counts and timings at INFO)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+
 # Create FastAPI app
 app = FastAPI(
     title="Intelligent ATS API",
@@ -30,7 +37,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Async (aiosqlite) versions of the job listing, applicant listings, /my and
+# status updates; included first so they take over those paths
+ASYNC_DB_ENDPOINTS = os.getenv("ASYNC_DB_ENDPOINTS", "1") == "1"
+
 # Include routers
+if ASYNC_DB_ENDPOINTS:
+    app.include_router(jobs.async_router)
+    app.include_router(applications.async_router)
 app.include_router(auth.router)
 app.include_router(jobs.router)
 app.include_router(applications.router)
@@ -51,6 +65,14 @@ def startup_event():
     print("✓ API docs available at http://localhost:8000/docs")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the ML and extraction worker pools and close async connections."""
+    ml_executor.shutdown()
+    shutdown_extraction_pool()
+    await async_engine.dispose()
+
+
 @app.get("/")
 def root():
     """Root endpoint."""
@@ -67,6 +89,24 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics/resume-cache")
+def resume_cache_metrics():
+    """Hit/miss counters of the resume processing cache."""
+    return get_resume_cache().stats()
+
+
+@app.get("/metrics/ml-executor")
+def ml_executor_metrics():
+    """Load of the resume parsing / ML executor."""
+    return ml_executor.stats()
+
+
+@app.get("/metrics/extraction")
+def extraction_metrics():
+    """Timeouts, memory kills and recycling of the resume extraction workers."""
+    return get_extraction_pool().stats()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
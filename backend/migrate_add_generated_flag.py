@@ -0,0 +1,43 @@
+"""Migration script to add the is_generated flag to applications."""
+import sqlite3
+from pathlib import Path
+
+# Database path
+DB_PATH = Path(__file__).parent / "ats_database.db"
+
+def migrate():
+    """Add applications.is_generated and flag the existing generate-random applications."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        # Check if column already exists
+        cursor.execute("PRAGMA table_info(applications)")
+        columns = [row[1] for row in cursor.fetchall()]
+
+        if 'is_generated' not in columns:
+            print("Adding applications.is_generated column...")
+            cursor.execute("ALTER TABLE applications ADD COLUMN is_generated BOOLEAN DEFAULT 0")
+
+            # Before the flag, generate-random was only recognisable by its
+            # bare file names; uploads are stored under uploads/resumes/
+            cursor.execute(
+                "UPDATE applications SET is_generated = 1 "
+                "WHERE resume_file_path LIKE 'test\\_resume\\_%' ESCAPE '\\'"
+            )
+            print(f"✓ Added applications.is_generated column ({cursor.rowcount} generated applications)")
+        else:
+            print("✓ applications.is_generated column already exists")
+
+        conn.commit()
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,31 @@
+"""Migration script to add the composite indexes on applications and job_postings."""
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from models import JobPosting, Application
+
+# Database path
+DB_PATH = Path(__file__).parent / "ats_database.db"
+
+def migrate():
+    """Create the indexes declared in models.py that the database doesn't have yet."""
+    engine = create_engine(f"sqlite:///{DB_PATH}")
+
+    try:
+        with engine.begin() as conn:
+            for table in (JobPosting.__table__, Application.__table__):
+                for index in sorted(table.indexes, key=lambda index: index.name):
+                    index.create(bind=conn, checkfirst=True)
+                    print(f"✓ {index.name}")
+
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        raise
+    finally:
+        engine.dispose()
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,47 @@
+"""Migration script to add background-processing fields to the applications table."""
+import sqlite3
+from pathlib import Path
+
+# Database path
+DB_PATH = Path(__file__).parent / "ats_database.db"
+
+def migrate():
+    """Add processing_status and processing_error columns to applications table."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        # Check if columns already exist
+        cursor.execute("PRAGMA table_info(applications)")
+        columns = [row[1] for row in cursor.fetchall()]
+
+        # Add processing_status if it doesn't exist (existing rows are complete)
+        if 'processing_status' not in columns:
+            print("Adding processing_status column...")
+            cursor.execute("ALTER TABLE applications ADD COLUMN processing_status TEXT DEFAULT 'completed'")
+            print("✓ Added processing_status column")
+        else:
+            print("✓ processing_status column already exists")
+
+        # Add processing_error if it doesn't exist
+        if 'processing_error' not in columns:
+            print("Adding processing_error column...")
+            cursor.execute("ALTER TABLE applications ADD COLUMN processing_error TEXT")
+            print("✓ Added processing_error column")
+        else:
+            print("✓ processing_error column already exists")
+
+        # processing_tasks is a new table and is created by init_db()
+
+        conn.commit()
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,46 @@
+"""Migration script to add and fill the score_histogram table (stored score distributions)."""
+import sqlite3
+from pathlib import Path
+
+from percentile_store import REBUILD_STATEMENTS
+
+# Database path
+DB_PATH = Path(__file__).parent / "ats_database.db"
+
+def migrate():
+    """Create score_histogram and fill it from the existing application scores."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        print("Creating score_histogram table...")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS score_histogram (
+                scope VARCHAR NOT NULL,
+                scope_key VARCHAR NOT NULL,
+                field VARCHAR NOT NULL,
+                bucket INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (scope, scope_key, field, bucket)
+            )
+        """)
+
+        # Safe to re-run: the distributions are rebuilt from scratch
+        print("Filling score distributions from applications...")
+        for statement in REBUILD_STATEMENTS:
+            cursor.execute(statement)
+        cursor.execute("SELECT COUNT(*) FROM score_histogram")
+        print(f"✓ Stored {cursor.fetchone()[0]} score buckets")
+
+        conn.commit()
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,39 @@
+"""Migration script to add the score_sketches table (per-day score distributions)."""
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models import ScoreSketchRecord
+from percentile_store import rebuild_score_distributions
+
+# Database path
+DB_PATH = Path(__file__).parent / "ats_database.db"
+
+def migrate():
+    """Create score_sketches and fill it (and score_histogram) from the existing scores."""
+    engine = create_engine(f"sqlite:///{DB_PATH}")
+    db = sessionmaker(bind=engine)()
+
+    try:
+        print("Creating score_sketches table...")
+        ScoreSketchRecord.__table__.create(bind=engine, checkfirst=True)
+
+        # Safe to re-run: the distributions are rebuilt from scratch
+        print("Filling score distributions from applications...")
+        rebuild_score_distributions(db)
+        sketch_count = db.query(ScoreSketchRecord).count()
+        print(f"✓ Stored {sketch_count} day sketches")
+
+        db.commit()
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,38 @@
+"""Migration script to add scoring_version columns to job_postings and applications."""
+import sqlite3
+from pathlib import Path
+
+# Database path
+DB_PATH = Path(__file__).parent / "ats_database.db"
+
+def migrate():
+    """Add scoring_version to job_postings and applications tables."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        for table in ("job_postings", "applications"):
+            # Check if column already exists
+            cursor.execute(f"PRAGMA table_info({table})")
+            columns = [row[1] for row in cursor.fetchall()]
+
+            # Existing scores were computed against the current (first) version
+            if 'scoring_version' not in columns:
+                print(f"Adding {table}.scoring_version column...")
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN scoring_version INTEGER DEFAULT 1")
+                print(f"✓ Added {table}.scoring_version column")
+            else:
+                print(f"✓ {table}.scoring_version column already exists")
+
+        conn.commit()
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
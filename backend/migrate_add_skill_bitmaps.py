@@ -0,0 +1,53 @@
+"""Migration script to add applications.skill_bitmap and fill it from the extracted skills."""
+import sqlite3
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from skill_index import rebuild_skill_index
+
+# Database path
+DB_PATH = Path(__file__).parent / "ats_database.db"
+
+def migrate(chunk_size: int = 5000):
+    """Add the skill_bitmap column, encode every application's skills and record the vocabulary version."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA table_info(applications)")
+        columns = [row[1] for row in cursor.fetchall()]
+
+        if 'skill_bitmap' not in columns:
+            print("Adding applications.skill_bitmap column...")
+            cursor.execute("ALTER TABLE applications ADD COLUMN skill_bitmap BLOB")
+            print("✓ Added applications.skill_bitmap column")
+        else:
+            print("✓ applications.skill_bitmap column already exists")
+        conn.commit()
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    engine = create_engine(f"sqlite:///{DB_PATH}")
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    try:
+        print("Encoding skill bitmaps...")
+        with Session() as db:
+            counts = rebuild_skill_index(db, chunk_size)
+        print(f"✓ Encoded {counts['applications']} applications")
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        raise
+    finally:
+        engine.dispose()
+
+if __name__ == "__main__":
+    migrate()
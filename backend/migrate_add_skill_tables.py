@@ -0,0 +1,42 @@
+"""Migration script to add the skill tables (skills, skill_vocabulary, application_skills, job_skills) and backfill them."""
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models import Skill, SkillVocabulary, ApplicationSkill, JobSkill
+from skill_index import backfill_skill_links, sync_skills
+
+# Database path
+DB_PATH = Path(__file__).parent / "ats_database.db"
+
+def migrate():
+    """Create the skill tables, load the skills vocabulary and link existing applications and jobs."""
+    engine = create_engine(f"sqlite:///{DB_PATH}")
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    try:
+        print("Creating skill tables...")
+        for table in (Skill.__table__, SkillVocabulary.__table__, ApplicationSkill.__table__, JobSkill.__table__):
+            table.create(bind=engine, checkfirst=True)
+            print(f"✓ {table.name}")
+
+        with Session() as db:
+            print("Loading skills vocabulary...")
+            print(f"✓ {sync_skills(db, rebuild=False)['skills']} skills added or updated")
+
+            print("Backfilling skill links from the JSON columns...")
+            counts = backfill_skill_links(db)
+            print(f"✓ {counts['application_skills']} skills of {counts['applications']} applications")
+            print(f"✓ {counts['job_skills']} skills of {counts['jobs']} jobs")
+
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        raise
+    finally:
+        engine.dispose()
+
+if __name__ == "__main__":
+    migrate()
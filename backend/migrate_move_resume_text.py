@@ -0,0 +1,56 @@
+"""Migration script to move applications.resume_text into the application_resumes table."""
+import sqlite3
+from pathlib import Path
+
+# Database path
+DB_PATH = Path(__file__).parent / "ats_database.db"
+
+def migrate():
+    """Copy resume text to application_resumes and drop it from applications."""
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        print("Creating application_resumes table...")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS application_resumes (
+                application_id INTEGER NOT NULL,
+                resume_text TEXT NOT NULL,
+                PRIMARY KEY (application_id),
+                FOREIGN KEY(application_id) REFERENCES applications (id) ON DELETE CASCADE
+            )
+        """)
+
+        cursor.execute("PRAGMA table_info(applications)")
+        columns = [row[1] for row in cursor.fetchall()]
+
+        if 'resume_text' in columns:
+            print("Copying resume text...")
+            cursor.execute("""
+                INSERT OR IGNORE INTO application_resumes (application_id, resume_text)
+                SELECT id, COALESCE(resume_text, '') FROM applications
+            """)
+            print(f"✓ Copied {cursor.rowcount} resumes")
+
+            print("Dropping applications.resume_text column...")
+            cursor.execute("ALTER TABLE applications DROP COLUMN resume_text")
+            print("✓ Dropped applications.resume_text column")
+        else:
+            print("✓ applications.resume_text already moved")
+
+        conn.commit()
+
+        # Give the pages the text occupied back to the file
+        print("Vacuuming database...")
+        conn.execute("VACUUM")
+        print("\n✓ Migration completed successfully!")
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
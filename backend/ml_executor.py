@@ -0,0 +1,145 @@
+"""Bounded executor for CPU-heavy resume parsing and ML work.
+
+Async endpoints hand their PDF parsing / NLP / scoring work to this executor
+instead of running it on the event loop. The number of jobs running at once
+(ML_MAX_WORKERS) and waiting behind them (ML_MAX_QUEUE) is capped; once both
+are full, new work is rejected with 503 so a burst of uploads cannot pile up
+unbounded work or starve cheap endpoints.
+"""
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional
+
+from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
+
+from ml_integration.extract_skills import process_resume
+from ml_integration.resume_cache import get_resume_cache, resume_cache_key
+
+# Executor configuration - load from environment variables
+ML_EXECUTOR_KIND = os.getenv("ML_EXECUTOR_KIND", "process")  # 'process' or 'thread'
+ML_MAX_WORKERS = int(os.getenv("ML_MAX_WORKERS", str(os.cpu_count() or 2)))
+ML_MAX_QUEUE = int(os.getenv("ML_MAX_QUEUE", "32"))
+
+
+class BoundedExecutor:
+    """Thread or process pool with a hard cap on in-flight work."""
+
+    def __init__(self, max_workers: int, max_queue: int, kind: str = "process"):
+        if kind not in ("process", "thread"):
+            raise ValueError(f"Unsupported executor kind: {kind}")
+
+        self.kind = kind
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._rejected = 0
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        """Create the pool lazily (after the server has forked its workers)."""
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    # 'spawn' avoids inheriting the parent's DB connections
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="ml-worker"
+                    )
+            return self._executor
+
+    async def run(self, fn: Callable, *args, **kwargs):
+        """
+        Run fn(*args, **kwargs) on the pool and await its result.
+
+        Raises:
+            HTTPException: 503 when the pool and its queue are full
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy processing other resumes, please retry shortly",
+                headers={"Retry-After": "5"}
+            )
+
+        try:
+            executor = self._get_executor()
+            with self._lock:
+                self._in_flight += 1
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
+            except BrokenProcessPool:
+                # A worker died (e.g. killed by the OS); start a fresh pool next time
+                self._discard(executor)
+                raise
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+        finally:
+            self._slots.release()
+
+    def _discard(self, executor: Executor):
+        """Forget a broken pool so the next call creates a new one."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    def stats(self) -> Dict:
+        """Current load of the executor."""
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self):
+        """Stop the pool, waiting for running work to finish."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+ml_executor = BoundedExecutor(ML_MAX_WORKERS, ML_MAX_QUEUE, ML_EXECUTOR_KIND)
+
+
+async def process_resume_on_executor(resume_text: str) -> Dict:
+    """
+    Memoized process_resume for async endpoints.
+
+    The resume cache is read and written here, in the API process, and only
+    misses run process_resume on the executor. With ML_EXECUTOR_KIND=process
+    each pool worker would otherwise keep its own cache (and counters), so
+    hits were split across workers and invisible to GET /metrics/resume-cache.
+
+    Raises:
+        HTTPException: 503 when the pool and its queue are full
+    """
+    cache = get_resume_cache()
+    key = resume_cache_key(resume_text)
+
+    result = await run_in_threadpool(cache.get, key)
+    if result is None:
+        result = await ml_executor.run(process_resume, resume_text)
+        await run_in_threadpool(cache.put, key, result)
+
+    return result
@@ -0,0 +1,201 @@
+"""
+Vectorized two-stage scoring of many candidates against one job.
+
+score_batch mirrors calculate_final_score (Stage 1 requirements check,
+Stage 2 component scores, weighted final score) but works on columnar NumPy
+arrays, so a whole applicant pool is scored in one pass instead of one
+Python call per candidate. The results are identical to the scalar
+functions in scoring.py, including their rounding.
+"""
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .scoring import SCORING_CONFIG, education_level_of
+
+# Display names of the education levels returned by education_level_of
+EDUCATION_LEVEL_NAMES = ["Not Specified", "Diploma", "Bachelor's", "Master's", "PhD"]
+
+
+def round_scores(values: np.ndarray) -> np.ndarray:
+    """Round to 2 decimals exactly like Python's round(x, 2)."""
+    rounded = np.round(values, 2)
+    # np.round scales by 100 before rounding, which can tip values sitting on
+    # a .xx5 boundary the other way; redo those few with the builtin
+    scaled = values * 100
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(value, 2) for value in values[near_tie].tolist()]
+    return rounded
+
+
+class CandidateBatch:
+    """
+    Columnar candidate attributes for batch scoring.
+
+    skills is an N x V boolean membership matrix over the lower-cased skills
+    that occur in the batch; skill_index maps a lower-cased skill to its column.
+    """
+
+    def __init__(
+        self,
+        skill_lists: List[List[str]],
+        experience: Iterable[float],
+        education: Iterable[str],
+        has_certifications: Iterable[bool],
+        has_leadership: Iterable[bool],
+        skill_diversity: Iterable[float]
+    ):
+        self.skill_index: Dict[str, int] = {}
+        rows, cols = [], []
+        for row, skills in enumerate(skill_lists):
+            for skill in skills:
+                rows.append(row)
+                cols.append(self.skill_index.setdefault(skill.lower(), len(self.skill_index)))
+
+        self.skills = np.zeros((len(skill_lists), len(self.skill_index)), dtype=bool)
+        self.skills[rows, cols] = True
+        # Length of each extracted list (duplicates included), as len() in the scalar path
+        self.num_listed_skills = np.array([len(skills) for skills in skill_lists], dtype=np.int64)
+
+        self.experience = np.asarray(list(experience), dtype=np.float64)
+        # Education as free text ("Master's") or as education_level_of codes
+        self.education_level = np.array(
+            [e if isinstance(e, (int, np.integer)) else education_level_of(e)[0] for e in education],
+            dtype=np.int64
+        )
+        self.has_certifications = np.asarray(list(has_certifications), dtype=bool)
+        self.has_leadership = np.asarray(list(has_leadership), dtype=bool)
+        self.skill_diversity = np.asarray(list(skill_diversity), dtype=np.float64)
+
+    @classmethod
+    def from_processed(cls, processed: List[Dict]) -> "CandidateBatch":
+        """Build a batch from process_resume outputs."""
+        return cls(
+            skill_lists=[p['extracted_skills'] for p in processed],
+            experience=[p['experience_years'] for p in processed],
+            education=[p['education_level'] for p in processed],
+            has_certifications=[p['has_certifications'] for p in processed],
+            has_leadership=[p['has_leadership'] for p in processed],
+            skill_diversity=[p['skill_diversity'] for p in processed]
+        )
+
+    def __len__(self) -> int:
+        return len(self.num_listed_skills)
+
+    def has_all(self, skills_lower: Iterable[str]) -> np.ndarray:
+        """Rows that have every one of the given (lower-cased) skills."""
+        columns = []
+        for skill in set(skills_lower):
+            column = self.skill_index.get(skill)
+            if column is None:
+                # Nobody in the batch has it
+                return np.zeros(len(self), dtype=bool)
+            columns.append(column)
+        return self.skills[:, columns].all(axis=1)
+
+    def count_of(self, skills_lower: Iterable[str]) -> np.ndarray:
+        """Number of distinct given (lower-cased) skills each row has."""
+        columns = sorted({self.skill_index[s] for s in set(skills_lower) if s in self.skill_index})
+        if not columns:
+            return np.zeros(len(self), dtype=np.int64)
+        return self.skills[:, columns].sum(axis=1)
+
+
+def score_batch(
+    batch: CandidateBatch,
+    job_required_skills: List[str],
+    job_preferred_skills: List[str],
+    job_min_experience: int,
+    job_min_education: str = "none",
+    job_certifications_required: bool = False,
+    job_leadership_required: bool = False,
+    weights: Optional[Dict[str, float]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Two-stage scoring of every candidate in the batch against one job.
+
+    Args:
+        batch: Candidates as columnar arrays
+        Job requirements and weights as in calculate_final_score
+
+    Returns:
+        Dictionary of length-N arrays: meets_requirements (bool), final_score,
+        skills_score, experience_score, education_score and bonus_score
+        (0 for candidates that fail Stage 1)
+    """
+    # Use default weights if not provided
+    if weights is None:
+        weights = SCORING_CONFIG["weights"]
+
+    education_hierarchy = SCORING_CONFIG.get("education_hierarchy", {})
+
+    # ========== STAGE 1: REQUIREMENTS CHECK (PASS/FAIL) ==========
+    meets = ~(batch.experience < job_min_experience)
+
+    if job_required_skills:
+        meets &= batch.has_all(s.lower() for s in job_required_skills)
+
+    if job_min_education and job_min_education != "none":
+        meets &= batch.education_level >= education_hierarchy.get(job_min_education, 0)
+
+    if job_certifications_required:
+        meets &= batch.has_certifications
+
+    if job_leadership_required:
+        meets &= batch.has_leadership
+
+    # ========== STAGE 2: COMPONENT SCORING (0-100 EACH) ==========
+    # Skills: preferred match (80 points) + diversity (20 points)
+    preferred_skills_lower = [s.lower() for s in job_preferred_skills] if job_preferred_skills else []
+    if preferred_skills_lower:
+        preferred_score = batch.count_of(preferred_skills_lower) / len(preferred_skills_lower) * 80
+    else:
+        preferred_score = np.minimum(80, batch.num_listed_skills * 4)
+    skills_score = round_scores(np.minimum(100, preferred_score + batch.skill_diversity * 20))
+
+    # Experience: piecewise in the years beyond the minimum
+    beyond = batch.experience - job_min_experience
+    experience_score = np.select(
+        [beyond <= 0, beyond <= 2, beyond <= 5],
+        [70, 70 + (beyond * 15), 100 - ((beyond - 2) * 3)],
+        np.maximum(70, 85 - ((beyond - 5) * 3))
+    )
+    experience_score = round_scores(np.minimum(100, np.maximum(0, experience_score)))
+
+    # Education: levels above the minimum
+    min_level = education_hierarchy.get(job_min_education, 0) if job_min_education else 0
+    levels_above_min = batch.education_level - min_level
+    if min_level == 0:
+        at_minimum = np.array(
+            [SCORING_CONFIG["education_scores"].get(name, 40) for name in EDUCATION_LEVEL_NAMES],
+            dtype=np.float64
+        )[batch.education_level]
+    else:
+        at_minimum = np.full(len(batch), 70.0)
+    education_score = np.select(
+        [levels_above_min == 0, levels_above_min == 1, levels_above_min >= 2],
+        [at_minimum, 85.0, 100.0],
+        0.0
+    )
+
+    # Bonus: 50 points each for certifications and leadership
+    bonus_score = batch.has_certifications * 50.0 + batch.has_leadership * 50.0
+
+    # ========== STAGE 3: WEIGHTED FINAL SCORE ==========
+    final_score = round_scores(
+        skills_score * weights.get("skills", 0.4) +
+        experience_score * weights.get("experience", 0.3) +
+        education_score * weights.get("education", 0.2) +
+        bonus_score * (weights.get("certification", 0.05) + weights.get("leadership", 0.05))
+    )
+
+    # Rejected candidates score 0 everywhere
+    return {
+        "meets_requirements": meets,
+        "final_score": np.where(meets, final_score, 0.0),
+        "skills_score": np.where(meets, skills_score, 0.0),
+        "experience_score": np.where(meets, experience_score, 0.0),
+        "education_score": np.where(meets, education_score, 0.0),
+        "bonus_score": np.where(meets, bonus_score, 0.0),
+    }
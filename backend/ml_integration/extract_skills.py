@@ -1,7 +1,14 @@
 """Skill extraction from resume text using NLP."""
+import math
+import os
 import re
-from typing import List, Tuple
-from .skills_database import SKILLS_DATABASE, get_all_skills, categorize_skill
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+from .skills_database import SKILLS_DATABASE, categorize_skill
+from .skill_matcher import get_skill_matcher
+
+# Bump whenever extraction logic changes so memoized results are recomputed
+EXTRACTOR_VERSION = "2"
 
 
 def extract_skills_from_text(resume_text: str) -> Tuple[List[str], dict]:
@@ -18,37 +25,12 @@ def extract_skills_from_text(resume_text: str) -> Tuple[List[str], dict]:
     extracted_skills = []
     skills_by_category = {category: [] for category in SKILLS_DATABASE.keys()}
 
-    # Get all possible skills
-    all_skills = get_all_skills()
-
-    # Special patterns for skills with special characters
-    # Word boundaries \b don't work well with special chars like +, #, and .
-    # Also handle variations like "NextJS" vs "Next.js"
-    special_patterns = {
-        'c++': r'\bc\+\+(?!\w)',
-        'c#': r'\bc#(?!\w)',
-        'asp.net': r'\basp\.net\b',
-        '.net': r'\.net\b',
-        'next.js': r'\b(?:next\.js|nextjs)\b',  # Matches both "Next.js" and "NextJS"
-        'node.js': r'\b(?:node\.js|nodejs)\b',  # Matches both "Node.js" and "NodeJS"
-        'vue.js': r'\b(?:vue\.js|vuejs)\b',     # Matches both "Vue.js" and "VueJS"
-    }
-
-    # Extract skills using case-insensitive matching
-    for skill in all_skills:
-        skill_lower = skill.lower()
-
-        # Use special pattern if available, otherwise use standard word boundary
-        if skill_lower in special_patterns:
-            pattern = special_patterns[skill_lower]
-        else:
-            # Create a pattern that matches the skill as a whole word
-            pattern = r'\b' + re.escape(skill_lower) + r'\b'
-
-        if re.search(pattern, resume_text_lower):
-            extracted_skills.append(skill)
-            category = categorize_skill(skill)
-            skills_by_category[category].append(skill)
+    # One pass over the text finds every skill (including special spellings
+    # like "NextJS" or "C++"); the matcher is compiled once per database version
+    for skill in get_skill_matcher().match(resume_text_lower):
+        extracted_skills.append(skill)
+        category = categorize_skill(skill)
+        skills_by_category[category].append(skill)
 
     # Remove duplicates while preserving order
     extracted_skills = list(dict.fromkeys(extracted_skills))
@@ -220,3 +202,62 @@ def process_resume(resume_text: str) -> dict:
         'has_certifications': has_certs,
         'has_leadership': has_lead
     }
+
+
+def _init_resume_worker():
+    """Compile the skill matcher once per worker process."""
+    get_skill_matcher()
+
+
+def resume_process_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Process pool for process_resumes whose workers compile the skill matcher once.
+
+    Create one per run and pass it to every process_resumes call (use it as
+    a context manager to shut it down), so batch jobs don't pay for process
+    start-up and imports on every batch.
+    """
+    return ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1, initializer=_init_resume_worker)
+
+
+def process_resumes(
+    resume_texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    executor: Optional[Executor] = None
+) -> List[dict]:
+    """
+    Process many resumes, fanning the work out across a process pool.
+
+    Each worker runs the full process_resume pipeline (skills, experience,
+    education, certifications, leadership). Texts are dispatched in chunks to
+    keep inter-process overhead low, and results come back in input order.
+
+    Args:
+        resume_texts: Resume texts to process
+        workers: Number of worker processes (defaults to the CPU count);
+                 1 processes everything serially in this process
+        chunksize: Texts sent to a worker per dispatch (defaults to about
+                   four chunks per worker)
+        executor: Pool to run on (see resume_process_pool), left running for
+                  the next call; without one a pool is started and shut down here
+
+    Returns:
+        List of process_resume results, one per input text
+    """
+    texts = list(resume_texts)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(texts)))
+
+    if workers == 1:
+        return [process_resume(text) for text in texts]
+
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(texts) / (workers * 4)))
+
+    if executor is not None:
+        return list(executor.map(process_resume, texts, chunksize=chunksize))
+
+    with resume_process_pool(workers) as executor:
+        return list(executor.map(process_resume, texts, chunksize=chunksize))
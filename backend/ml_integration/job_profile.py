@@ -0,0 +1,180 @@
+"""Precompiled, cached scoring view of a job posting.
+
+Every scoring path used to json.loads the job's skill lists and
+requirements, lower-case / normalize the skills and rebuild the weights
+dict for every candidate it scored. JobScoringProfile does that once per
+job; get_job_profile caches profiles by job id and recompiles when the
+scoring-relevant columns change (update_job_posting also invalidates
+explicitly).
+"""
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from .scoring import SCORING_CONFIG
+from .skills_database import normalize_skill
+
+JOB_PROFILE_CACHE_SIZE = 1024
+
+# JobPosting weight columns, in the order of the scoring weight keys
+WEIGHT_KEYS = ("skills", "experience", "education", "certification", "leadership")
+DEFAULT_WEIGHTS = (0.40, 0.30, 0.20, 0.05, 0.05)
+
+
+def _parse_json(value, default):
+    """Parse a JSON column, falling back to default for empty/invalid values."""
+    if not value:
+        return default
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return default
+
+
+class JobScoringProfile:
+    """
+    Immutable scoring inputs of one job posting.
+
+    Built from the raw column values (the same values form the cache
+    fingerprint), so a profile can also be pickled to a worker process.
+    """
+
+    __slots__ = (
+        'job_id', 'source',
+        'required_skills', 'preferred_skills',
+        'required_skills_lower', 'preferred_skills_lower',
+        'required_skills_normalized', 'preferred_skills_normalized',
+        'min_experience', 'min_education', 'min_education_level',
+        'certifications_required', 'leadership_required',
+        'weights', 'weights_vector',
+    )
+
+    def __init__(
+        self,
+        job_id: int,
+        required_skills_json: Optional[str],
+        preferred_skills_json: Optional[str],
+        requirements_json: Optional[str],
+        min_experience: Optional[int],
+        weights: Tuple[Optional[float], ...]
+    ):
+        required_skills = tuple(_parse_json(required_skills_json, []))
+        preferred_skills = tuple(_parse_json(preferred_skills_json, []))
+        requirements = _parse_json(requirements_json, {})
+        min_education = requirements.get('min_education', 'none')
+
+        # Missing weights fall back to the column defaults
+        weights_vector = tuple(
+            default if weight is None else weight
+            for weight, default in zip(weights, DEFAULT_WEIGHTS)
+        )
+
+        values = {
+            'job_id': job_id,
+            'source': (job_id, required_skills_json, preferred_skills_json,
+                       requirements_json, min_experience, tuple(weights)),
+            # Original casing (display, skill gap)
+            'required_skills': required_skills,
+            'preferred_skills': preferred_skills,
+            # Lower-cased for exact matching; preferred keeps duplicates
+            # because the scoring denominator counts them
+            'required_skills_lower': tuple(s.lower() for s in required_skills),
+            'preferred_skills_lower': tuple(s.lower() for s in preferred_skills),
+            # normalize_skill form ("Next.js" -> "nextjs") for fuzzy matching
+            'required_skills_normalized': tuple(normalize_skill(s) for s in required_skills),
+            'preferred_skills_normalized': tuple(normalize_skill(s) for s in preferred_skills),
+            'min_experience': min_experience or 0,
+            'min_education': min_education,
+            'min_education_level': SCORING_CONFIG.get("education_hierarchy", {}).get(min_education, 0),
+            'certifications_required': requirements.get('certifications_required', False),
+            'leadership_required': requirements.get('leadership_required', False),
+            'weights': dict(zip(WEIGHT_KEYS, weights_vector)),
+            'weights_vector': weights_vector,
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_job(cls, job) -> "JobScoringProfile":
+        """Compile the profile of a JobPosting row."""
+        return cls(*job_profile_source(job))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("JobScoringProfile is immutable")
+
+    def __reduce__(self):
+        return (self.__class__, self.source)
+
+    def scoring_kwargs(self, normalized: bool = False) -> Dict:
+        """
+        Job arguments for calculate_final_score / score_batch.
+
+        Args:
+            normalized: Use normalize_skill forms of the skill lists
+                (to match candidate skills normalized the same way)
+        """
+        return {
+            "job_required_skills": list(self.required_skills_normalized if normalized else self.required_skills),
+            "job_preferred_skills": list(self.preferred_skills_normalized if normalized else self.preferred_skills),
+            "job_min_experience": self.min_experience,
+            "job_min_education": self.min_education,
+            "job_certifications_required": self.certifications_required,
+            "job_leadership_required": self.leadership_required,
+            "weights": dict(self.weights),
+        }
+
+
+def job_profile_source(job) -> Tuple:
+    """Scoring-relevant column values of a JobPosting (the cache fingerprint)."""
+    return (
+        job.id,
+        job.required_skills,
+        job.preferred_skills,
+        job.requirements,
+        job.min_experience,
+        (job.weight_skills, job.weight_experience, job.weight_education,
+         job.weight_certifications, job.weight_leadership),
+    )
+
+
+_profile_cache: "OrderedDict[int, JobScoringProfile]" = OrderedDict()
+_profile_cache_lock = threading.Lock()
+
+
+def get_job_profile(job) -> JobScoringProfile:
+    """
+    Get the compiled profile of a job, compiling it on first use.
+
+    A cached profile is only reused while the job's scoring columns are
+    unchanged, so edits made by another process are picked up as well.
+
+    Args:
+        job: JobPosting row
+
+    Returns:
+        JobScoringProfile for the job's current values
+    """
+    source = job_profile_source(job)
+
+    with _profile_cache_lock:
+        profile = _profile_cache.get(job.id)
+        if profile is not None and profile.source == source:
+            _profile_cache.move_to_end(job.id)
+            return profile
+
+    profile = JobScoringProfile(*source)
+
+    with _profile_cache_lock:
+        _profile_cache[job.id] = profile
+        _profile_cache.move_to_end(job.id)
+        while len(_profile_cache) > JOB_PROFILE_CACHE_SIZE:
+            _profile_cache.popitem(last=False)
+
+    return profile
+
+
+def invalidate_job_profile(job_id: int):
+    """Drop the cached profile of a job (call after changing the posting)."""
+    with _profile_cache_lock:
+        _profile_cache.pop(job_id, None)
@@ -0,0 +1,71 @@
+"""Resume pipeline after text extraction: NLP, scoring, clustering, skill gap.
+
+Everything here is plain CPU work on plain data (no database sessions), so
+it can run on a worker thread or in a separate process. Text extraction
+itself runs in the supervised workers of extraction_pool.
+"""
+from typing import Dict, Optional
+
+from .job_profile import JobScoringProfile
+from .resume_cache import process_resume_cached
+from .scoring import calculate_final_score
+from .clustering import assign_cluster
+from .skill_gap import analyze_skill_gap
+
+
+def score_resume_for_job(
+    resume_text: str,
+    profile: JobScoringProfile,
+    processed_data: Optional[Dict] = None
+) -> Dict:
+    """
+    Run NLP extraction, two-stage scoring, clustering and skill gap analysis.
+
+    Args:
+        resume_text: Extracted resume text
+        profile: Compiled scoring profile of the job (see job_profile.get_job_profile)
+        processed_data: process_resume output when the caller already has it
+            (async endpoints look it up in the API process's cache)
+
+    Returns:
+        Dictionary with resume_text, processed, scores, cluster and gap entries
+    """
+    # Process resume with ML (memoized on the resume text)
+    if processed_data is None:
+        processed_data = process_resume_cached(resume_text)
+
+    # TWO-STAGE SCORING: Requirements check → Ranking
+    scores = calculate_final_score(
+        # Candidate attributes
+        candidate_skills=processed_data['extracted_skills'],
+        candidate_experience=processed_data['experience_years'],
+        candidate_education=processed_data['education_level'],
+        candidate_has_certifications=processed_data['has_certifications'],
+        candidate_has_leadership=processed_data['has_leadership'],
+        candidate_skill_diversity=processed_data['skill_diversity'],
+        # Job requirements (hard filters) and weights for ranking
+        **profile.scoring_kwargs()
+    )
+
+    # Assign cluster
+    cluster_info = assign_cluster(
+        experience_years=processed_data['experience_years'],
+        num_skills=processed_data['num_skills'],
+        skill_diversity=processed_data['skill_diversity']
+    )
+
+    # Skill gap analysis
+    gap_analysis = analyze_skill_gap(
+        candidate_skills=processed_data['extracted_skills'],
+        required_skills=list(profile.required_skills),
+        preferred_skills=list(profile.preferred_skills)
+    )
+
+    return {
+        "resume_text": resume_text,
+        "processed": processed_data,
+        "scores": scores,
+        "cluster": cluster_info,
+        "gap": gap_analysis
+    }
+
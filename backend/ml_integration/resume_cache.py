@@ -0,0 +1,219 @@
+"""Content-hash memoization of process_resume results.
+
+Results are keyed by the SHA-256 of the extracted resume text plus the
+extractor / skills-database version, so the same resume submitted to several
+jobs (or analyzed and then submitted) is only run through NLP once.
+
+Two tiers:
+  - an in-process LRU bounded by entry count
+  - a persistent SQLite table shared by all workers on the host, pruned of
+    entries older than max_disk_age_days and of the oldest entries beyond
+    max_disk_entries
+"""
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional
+
+from .extract_skills import EXTRACTOR_VERSION, process_resume
+from .skills_database import SKILLS_DATABASE_VERSION
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / "resume_cache.db"
+
+
+def extractor_version() -> str:
+    """Version component of the cache key."""
+    # Experience extraction counts "present" ranges up to the current year,
+    # so results are only reused within the same calendar year
+    return f"{EXTRACTOR_VERSION}:{SKILLS_DATABASE_VERSION}:{datetime.now().year}"
+
+
+def resume_cache_key(resume_text: str) -> str:
+    """Cache key for a resume text under the current extractor version."""
+    digest = hashlib.sha256(resume_text.encode("utf-8")).hexdigest()
+    return f"{digest}:{extractor_version()}"
+
+
+class ResumeCache:
+    """Two-tier (LRU + SQLite) cache of process_resume output."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_entries: int = 1024,
+        max_disk_entries: int = 50000,
+        max_disk_age_days: float = 90,
+        prune_every: int = 100
+    ):
+        """
+        Args:
+            db_path: SQLite file of the persistent tier (None for memory only)
+            max_entries: Entries kept in the LRU tier
+            max_disk_entries: Rows kept in the SQLite tier (newest first)
+            max_disk_age_days: Rows older than this are dropped from the SQLite tier
+            prune_every: Prune the SQLite tier after this many writes
+        """
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_age_days = max_disk_age_days
+        self.prune_every = prune_every
+        self._memory: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "disk_evictions": 0,
+        }
+
+        self._conn = None
+        if db_path:
+            self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS resume_cache ("
+                " cache_key TEXT PRIMARY KEY,"
+                " result TEXT NOT NULL,"
+                " created_at TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_resume_cache_created_at ON resume_cache (created_at)"
+            )
+            self._conn.commit()
+            self.prune()
+
+    def _remember(self, key: str, result: dict):
+        """Insert into the LRU tier, evicting the least recently used entries."""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def get(self, key: str) -> Optional[dict]:
+        """Look up a cached result, promoting disk hits into memory."""
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return copy.deepcopy(result)
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT result FROM resume_cache WHERE cache_key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    result = json.loads(row[0])
+                    self._remember(key, result)
+                    self._counters["disk_hits"] += 1
+                    return copy.deepcopy(result)
+
+            self._counters["misses"] += 1
+            return None
+
+    def put(self, key: str, result: dict):
+        """Store a result in both tiers."""
+        with self._lock:
+            self._remember(key, copy.deepcopy(result))
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO resume_cache (cache_key, result, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(result), datetime.utcnow().isoformat())
+                )
+                self._conn.commit()
+                self._writes_since_prune += 1
+                if self._writes_since_prune >= self.prune_every:
+                    self._prune()
+
+    def _prune(self) -> int:
+        """Drop expired rows and the oldest rows beyond max_disk_entries (lock held)."""
+        self._writes_since_prune = 0
+        cutoff = (datetime.utcnow() - timedelta(days=self.max_disk_age_days)).isoformat()
+        deleted = self._conn.execute("DELETE FROM resume_cache WHERE created_at < ?", (cutoff,)).rowcount
+        deleted += self._conn.execute(
+            "DELETE FROM resume_cache WHERE cache_key IN ("
+            " SELECT cache_key FROM resume_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,)
+        ).rowcount
+        self._conn.commit()
+        self._counters["disk_evictions"] += deleted
+        return deleted
+
+    def prune(self) -> int:
+        """
+        Bound the SQLite tier now (also done every prune_every writes).
+
+        Returns:
+            Number of rows deleted
+        """
+        if self._conn is None:
+            return 0
+        with self._lock:
+            return self._prune()
+
+    def clear(self):
+        """Drop every cached entry (both tiers)."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM resume_cache")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for monitoring."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["hits"] = stats["memory_hits"] + stats["disk_hits"]
+            stats["memory_entries"] = len(self._memory)
+            stats["max_entries"] = self.max_entries
+            stats["max_disk_entries"] = self.max_disk_entries
+        return stats
+
+
+_resume_cache: Optional[ResumeCache] = None
+_resume_cache_lock = threading.Lock()
+
+
+def get_resume_cache() -> ResumeCache:
+    """Get the process-wide resume cache (configured from the environment)."""
+    global _resume_cache
+
+    if _resume_cache is None:
+        with _resume_cache_lock:
+            if _resume_cache is None:
+                db_path = os.getenv("RESUME_CACHE_PATH", str(DEFAULT_CACHE_PATH))
+                _resume_cache = ResumeCache(
+                    db_path=db_path or None,
+                    max_entries=int(os.getenv("RESUME_CACHE_MAX_ENTRIES", "1024")),
+                    max_disk_entries=int(os.getenv("RESUME_CACHE_MAX_DISK_ENTRIES", "50000")),
+                    max_disk_age_days=float(os.getenv("RESUME_CACHE_MAX_AGE_DAYS", "90"))
+                )
+
+    return _resume_cache
+
+
+def process_resume_cached(resume_text: str) -> dict:
+    """
+    Memoized process_resume.
+
+    Returns the cached result when this exact text has already been processed
+    by the current extractor version; otherwise runs process_resume and
+    stores the output.
+    """
+    cache = get_resume_cache()
+    key = resume_cache_key(resume_text)
+
+    result = cache.get(key)
+    if result is None:
+        result = process_resume(resume_text)
+        cache.put(key, result)
+
+    return result
@@ -1,9 +1,161 @@
 """Resume text extraction from PDF and DOCX files."""
+import logging
+import multiprocessing
 import os
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, List, Optional, Tuple
 import PyPDF2
 from docx import Document
 
+logger = logging.getLogger(__name__)
+
+# PDF extraction configuration - load from environment variables
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "0")) or None  # 0 = no page cap
+PDF_EARLY_EXIT_CHARS = int(os.getenv("PDF_EARLY_EXIT_CHARS", "0")) or None  # 0 = read every page
+PDF_PARALLEL_WORKERS = int(os.getenv("PDF_PARALLEL_WORKERS", "0"))  # 0/1 = serial extraction
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8"))  # shorter PDFs stay serial
+PDF_PAGES_PER_SHARD = int(os.getenv("PDF_PAGES_PER_SHARD", "4"))
+
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+
+def _get_page_pool(workers: int) -> ProcessPoolExecutor:
+    """Lazily create the process pool used for page-parallel extraction."""
+    global _page_pool
+
+    with _page_pool_lock:
+        if _page_pool is None:
+            _page_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _page_pool
+
+
+def _extract_page_range(file_path: str, start: int, end: int) -> List[Tuple[int, str, float]]:
+    """Extract pages [start, end) of a PDF file; returns (page_index, text, seconds) tuples."""
+    # Shards get the path rather than the document: the reader only loads
+    # the cross-reference table and the pages it is asked for
+    pdf_reader = PyPDF2.PdfReader(file_path)
+    results = []
+    for index in range(start, end):
+        page_start = time.perf_counter()
+        text = pdf_reader.pages[index].extract_text()
+        results.append((index, text, time.perf_counter() - page_start))
+    return results
+
+
+def extract_pdf_pages(
+    file_path: str,
+    max_pages: Optional[int] = PDF_MAX_PAGES,
+    min_chars: Optional[int] = PDF_EARLY_EXIT_CHARS,
+    workers: int = PDF_PARALLEL_WORKERS
+) -> Dict:
+    """
+    Extract PDF text page by page, optionally sharding pages across processes.
+
+    Long CVs (publication lists, portfolios) are split into shards of
+    PDF_PAGES_PER_SHARD pages that worker processes extract in parallel.
+    Pages are always assembled in document order. Inside a daemonic process
+    (an isolated extraction_pool worker) pages are extracted serially.
+
+    Args:
+        file_path: Path to the PDF file
+        max_pages: Only read the first max_pages pages (None = all)
+        min_chars: Stop once this many characters have been collected (None = never)
+        workers: Worker processes for page-parallel mode (0 or 1 = serial)
+
+    Returns:
+        Dictionary with text, total_pages, pages_extracted, truncated,
+        truncated_by ('max_pages', 'min_chars' or None), seconds and
+        page_timings (list of {"page", "seconds"})
+    """
+    started = time.perf_counter()
+    file_path = str(file_path)
+    pdf_reader = PyPDF2.PdfReader(file_path)
+    total_pages = len(pdf_reader.pages)
+    page_count = min(total_pages, max_pages) if max_pages else total_pages
+
+    pages = []
+    page_timings = []
+    collected_chars = 0
+    stopped_early = False
+
+    def collect(batch: List[Tuple[int, str, float]]) -> bool:
+        """Append extracted pages; True once enough text has been collected."""
+        nonlocal collected_chars
+        for index, text, seconds in batch:
+            pages.append(text)
+            page_timings.append({"page": index + 1, "seconds": round(seconds, 4)})
+            collected_chars += len(text)
+            if min_chars and collected_chars >= min_chars:
+                return True
+        return False
+
+    if multiprocessing.current_process().daemon:
+        # Daemonic processes can't have children, and shards started from a
+        # supervised worker would escape its CPU / memory limits
+        workers = 0
+
+    if workers > 1 and page_count >= PDF_PARALLEL_MIN_PAGES:
+        executor = _get_page_pool(workers)
+        futures = [
+            executor.submit(_extract_page_range, file_path, start, min(start + PDF_PAGES_PER_SHARD, page_count))
+            for start in range(0, page_count, PDF_PAGES_PER_SHARD)
+        ]
+        try:
+            for future in futures:
+                if collect(future.result()):
+                    stopped_early = True
+                    break
+        finally:
+            # Early exit (or an error): drop shards that have not started yet
+            for future in futures:
+                future.cancel()
+    else:
+        for index in range(page_count):
+            page_start = time.perf_counter()
+            text = pdf_reader.pages[index].extract_text()
+            if collect([(index, text, time.perf_counter() - page_start)]):
+                stopped_early = True
+                break
+
+    truncated = len(pages) < total_pages
+    truncated_by = None
+    if truncated:
+        truncated_by = "min_chars" if stopped_early else "max_pages"
+
+    return {
+        "text": "\n".join(pages).strip(),
+        "total_pages": total_pages,
+        "pages_extracted": len(pages),
+        "truncated": truncated,
+        "truncated_by": truncated_by,
+        "seconds": round(time.perf_counter() - started, 4),
+        "page_timings": page_timings,
+    }
+
+
+def _log_pdf_extraction(file_path: str, result: Dict):
+    """Report page counts, early exit and page timings of a PDF extraction."""
+    slowest = max(result["page_timings"], key=lambda timing: timing["seconds"], default=None)
+    logger.info(
+        "Extracted %d of %d pages of %s in %.3fs%s%s",
+        result["pages_extracted"], result["total_pages"], os.path.basename(file_path), result["seconds"],
+        f" (stopped at {result['truncated_by']})" if result["truncated"] else "",
+        f"; slowest page {slowest['page']} took {slowest['seconds']:.3f}s" if slowest else ""
+    )
+    logger.debug("Page timings of %s: %s", file_path, result["page_timings"])
+
+
+def _read_docx_text(stream: BinaryIO) -> str:
+    """Extract text from an open binary DOCX stream."""
+    doc = Document(stream)
+    return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
+
 
 def extract_text_from_pdf(file_path: str) -> str:
     """
@@ -16,14 +168,11 @@ def extract_text_from_pdf(file_path: str) -> str:
         Extracted text as a string
     """
     try:
-        text = ""
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-        return text.strip()
+        result = extract_pdf_pages(file_path)
     except Exception as e:
         raise Exception(f"Error extracting text from PDF: {str(e)}")
+    _log_pdf_extraction(file_path, result)
+    return result["text"]
 
 
 def extract_text_from_docx(file_path: str) -> str:
@@ -37,9 +186,8 @@ def extract_text_from_docx(file_path: str) -> str:
         Extracted text as a string
     """
     try:
-        doc = Document(file_path)
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        return text.strip()
+        with open(file_path, 'rb') as file:
+            return _read_docx_text(file)
     except Exception as e:
         raise Exception(f"Error extracting text from DOCX: {str(e)}")
 
@@ -71,13 +219,47 @@ def extract_text_from_file(file_path: str) -> str:
         raise ValueError(f"Unsupported file type: {file_extension}. Only PDF and DOCX are supported.")
 
 
-def validate_resume_file(filename: str, max_size_mb: int = 5) -> Optional[str]:
+# Leading bytes of each accepted file type ('.doc' uploads are parsed as
+# DOCX, but legacy OLE files are let through to fail with a parse error)
+RESUME_MAGIC_BYTES = {
+    '.pdf': (b'%PDF-',),
+    '.docx': (b'PK\x03\x04',),
+    '.doc': (b'PK\x03\x04', b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'),
+}
+
+
+def sniff_resume_type(filename: str, head: bytes) -> Optional[str]:
+    """
+    Check that the first bytes of an upload match its file extension.
+
+    Args:
+        filename: Name of the file
+        head: First chunk of the file contents
+
+    Returns:
+        Error message if the content doesn't look like the declared type, None if valid
+    """
+    file_extension = os.path.splitext(filename)[1].lower()
+    signatures = RESUME_MAGIC_BYTES.get(file_extension, ())
+
+    if file_extension == '.pdf':
+        # Readers accept the header anywhere in the first KiB
+        if any(signature in head[:1024] for signature in signatures):
+            return None
+    elif any(head.startswith(signature) for signature in signatures):
+        return None
+
+    return f"File content does not match its {file_extension or 'missing'} extension"
+
+
+def validate_resume_file(filename: str, max_size_mb: int = 5, file_size: Optional[int] = None) -> Optional[str]:
     """
     Validate resume file.
 
     Args:
         filename: Name of the file
         max_size_mb: Maximum file size in MB
+        file_size: Size of the file in bytes, if already known
 
     Returns:
         Error message if invalid, None if valid
@@ -89,4 +271,7 @@ def validate_resume_file(filename: str, max_size_mb: int = 5) -> Optional[str]:
     if file_extension not in allowed_extensions:
         return f"Invalid file type. Allowed types: {', '.join(allowed_extensions)}"
 
+    if file_size is not None and file_size > max_size_mb * 1024 * 1024:
+        return f"File too large. Maximum size is {max_size_mb} MB"
+
     return None  # Valid
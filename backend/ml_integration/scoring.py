@@ -50,6 +50,29 @@ except FileNotFoundError:
     }
 
 
+def education_level_of(candidate_education: str) -> Tuple[int, str]:
+    """
+    Map a free-text education level to its hierarchy level and display name.
+
+    Args:
+        candidate_education: Candidate's education level (e.g. "Master's")
+
+    Returns:
+        Tuple of (level 0-4, name used in education_scores)
+    """
+    candidate_edu_lower = candidate_education.lower() if candidate_education else ""
+    if "phd" in candidate_edu_lower or "doctorate" in candidate_edu_lower:
+        return 4, "PhD"
+    elif "master" in candidate_edu_lower:
+        return 3, "Master's"
+    elif "bachelor" in candidate_edu_lower:
+        return 2, "Bachelor's"
+    elif "diploma" in candidate_edu_lower or "associate" in candidate_edu_lower:
+        return 1, "Diploma"
+    else:
+        return 0, "Not Specified"
+
+
 def check_requirements(
     candidate_skills: List[str],
     candidate_experience: float,
@@ -107,18 +130,7 @@ def check_requirements(
         education_hierarchy = SCORING_CONFIG.get("education_hierarchy", {})
 
         # Map candidate education to hierarchy level
-        candidate_edu_level = 0
-        candidate_edu_lower = candidate_education.lower() if candidate_education else ""
-        if "phd" in candidate_edu_lower or "doctorate" in candidate_edu_lower:
-            candidate_edu_level = 4
-        elif "master" in candidate_edu_lower:
-            candidate_edu_level = 3
-        elif "bachelor" in candidate_edu_lower:
-            candidate_edu_level = 2
-        elif "diploma" in candidate_edu_lower or "associate" in candidate_edu_lower:
-            candidate_edu_level = 1
-        else:
-            candidate_edu_level = 0
+        candidate_edu_level, _ = education_level_of(candidate_education)
 
         required_edu_level = education_hierarchy.get(job_min_education, 0)
 
@@ -257,22 +269,7 @@ def calculate_education_score(
     education_hierarchy = SCORING_CONFIG.get("education_hierarchy", {})
 
     # Map candidate education to level
-    candidate_edu_lower = candidate_education.lower() if candidate_education else ""
-    if "phd" in candidate_edu_lower or "doctorate" in candidate_edu_lower:
-        candidate_level = 4
-        candidate_name = "PhD"
-    elif "master" in candidate_edu_lower:
-        candidate_level = 3
-        candidate_name = "Master's"
-    elif "bachelor" in candidate_edu_lower:
-        candidate_level = 2
-        candidate_name = "Bachelor's"
-    elif "diploma" in candidate_edu_lower or "associate" in candidate_edu_lower:
-        candidate_level = 1
-        candidate_name = "Diploma"
-    else:
-        candidate_level = 0
-        candidate_name = "Not Specified"
+    candidate_level, candidate_name = education_level_of(candidate_education)
 
     # Get minimum required level
     min_level = education_hierarchy.get(min_education, 0) if min_education else 0
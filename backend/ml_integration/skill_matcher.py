@@ -0,0 +1,126 @@
+"""Single-pass skill matcher compiled from the skills database.
+
+Instead of running one ``re.search`` per known skill, every surface form of
+every skill is folded into a single trie-shaped regular expression. One scan
+of the resume text then finds all skills, so the cost of extraction depends
+on the length of the resume rather than on the size of the skills list.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from .skills_database import SKILLS_REGISTRY, SkillsRegistry
+
+# Word boundaries \b don't work well with special chars like +, #, and .
+# Each entry lists the accepted spellings of a skill together with whether
+# it needs a leading word boundary and which trailing assertion it uses.
+# Also handles variations like "NextJS" vs "Next.js".
+SPECIAL_PATTERNS = {
+    'c++': (['c++'], True, r'(?!\w)'),
+    'c#': (['c#'], True, r'(?!\w)'),
+    'asp.net': (['asp.net'], True, r'\b'),
+    '.net': (['.net'], False, r'\b'),
+    'next.js': (['next.js', 'nextjs'], True, r'\b'),  # Matches both "Next.js" and "NextJS"
+    'node.js': (['node.js', 'nodejs'], True, r'\b'),  # Matches both "Node.js" and "NodeJS"
+    'vue.js': (['vue.js', 'vuejs'], True, r'\b'),     # Matches both "Vue.js" and "VueJS"
+}
+
+_TERMINAL = ''
+
+
+def _surface_forms(skill_lower: str) -> Tuple[List[str], bool, str]:
+    """Return (spellings, needs_leading_boundary, trailing_assertion) for a skill."""
+    if skill_lower in SPECIAL_PATTERNS:
+        return SPECIAL_PATTERNS[skill_lower]
+    return [skill_lower], True, r'\b'
+
+
+def _trie_to_regex(node: dict) -> str:
+    """Render a character trie as a regex, trying longer spellings first."""
+    branches = []
+    for char in sorted(k for k in node if k != _TERMINAL):
+        branches.append(re.escape(char) + _trie_to_regex(node[char]))
+    if _TERMINAL in node:
+        branches.append(node[_TERMINAL])
+    if len(branches) == 1:
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')'
+
+
+class SkillMatcher:
+    """Finds every skill of a skills database in one pass over the text."""
+
+    def __init__(self, registry: SkillsRegistry):
+        self.all_skills = registry.all_skills
+
+        # Spelling -> indices into all_skills (duplicated names map to several)
+        self._spelling_to_indices: Dict[str, List[int]] = {}
+        # Spelling -> standalone pattern, used to confirm overlapping matches
+        self._spelling_patterns: Dict[str, re.Pattern] = {}
+        tries = {True: {}, False: {}}
+
+        for index, skill in enumerate(self.all_skills):
+            spellings, leading, trailing = _surface_forms(skill.lower())
+            for spelling in spellings:
+                self._spelling_to_indices.setdefault(spelling, []).append(index)
+                if spelling in self._spelling_patterns:
+                    continue
+                self._spelling_patterns[spelling] = re.compile(
+                    (r'\b' if leading else '') + re.escape(spelling) + trailing
+                )
+                node = tries[leading]
+                for char in spelling:
+                    node = node.setdefault(char, {})
+                node[_TERMINAL] = trailing
+
+        alternatives = []
+        if tries[True]:
+            alternatives.append(r'\b' + _trie_to_regex(tries[True]))
+        if tries[False]:
+            alternatives.append(_trie_to_regex(tries[False]))
+        self._pattern = re.compile('|'.join(alternatives) or r'(?!)')
+
+        # Shorter spellings that can match at the same position as a longer
+        # one (e.g. "react" inside "react native"); the combined pattern only
+        # reports the longest match per position, so these are re-checked.
+        self._shorter_spellings: Dict[str, List[str]] = {
+            spelling: [
+                other for other in self._spelling_patterns
+                if other != spelling and spelling.startswith(other)
+            ]
+            for spelling in self._spelling_patterns
+        }
+
+    def match_indices(self, text_lower: str) -> List[int]:
+        """Return sorted indices into ``all_skills`` of skills found in the text."""
+        found = set()
+        pos = 0
+        search = self._pattern.search
+        while True:
+            match = search(text_lower, pos)
+            if match is None:
+                break
+            start = match.start()
+            spelling = match.group()
+            found.update(self._spelling_to_indices[spelling])
+            for shorter in self._shorter_spellings[spelling]:
+                if self._spelling_patterns[shorter].match(text_lower, start):
+                    found.update(self._spelling_to_indices[shorter])
+            # Resume right after the match start so overlapping skills
+            # (e.g. "testing" inside "unit testing") are still found
+            pos = start + 1
+        return sorted(found)
+
+    def match(self, text_lower: str) -> List[str]:
+        """Return matched skills in database order (duplicates included)."""
+        return [self.all_skills[i] for i in self.match_indices(text_lower)]
+
+
+@lru_cache(maxsize=4)
+def _compile_skill_matcher(version: str) -> SkillMatcher:
+    return SkillMatcher(SKILLS_REGISTRY)
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """Get the matcher for the current skills database (compiled once per version)."""
+    return _compile_skill_matcher(SKILLS_REGISTRY.version)
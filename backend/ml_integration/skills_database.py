@@ -1,4 +1,8 @@
 """Skills database for NLP extraction and matching."""
+import hashlib
+import json
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 
 SKILLS_DATABASE = {
     "programming_languages": [
@@ -47,22 +51,140 @@ SKILLS_DATABASE = {
 }
 
 
-def get_all_skills():
-    """Get a flat list of all skills."""
-    all_skills = []
-    for category, skills in SKILLS_DATABASE.items():
-        all_skills.extend(skills)
-    return all_skills
+# Stable id of every canonical skill; keys application_skills, job_skills
+# and the bits of Application.skill_bitmap. Append-only: give a new skill
+# the next unused id, and never renumber or reuse the id of a removed one.
+SKILL_IDS = {
+    "Python": 1, "Java": 2, "JavaScript": 3, "C++": 4, "C#": 5, "Go": 6, "Rust": 7, "Ruby": 8,
+    "PHP": 9, "Swift": 10, "Kotlin": 11, "TypeScript": 12, "Scala": 13, "R": 14, "MATLAB": 15,
+    "Perl": 16, "HTML": 17, "CSS": 18, "React": 19, "Vue.js": 20, "Angular": 21, "Node.js": 22,
+    "Express": 23, "Django": 24, "Flask": 25, "Spring Boot": 26, "ASP.NET": 27, "GraphQL": 28,
+    "REST APIs": 29, "Webpack": 30, "Next.js": 31, "Nuxt.js": 32, "Redux": 33, "jQuery": 34,
+    "SQL": 35, "MySQL": 36, "PostgreSQL": 37, "MongoDB": 38, "Oracle": 39, "SQL Server": 40,
+    "Redis": 41, "Cassandra": 42, "DynamoDB": 43, "Firebase": 44, "SQLite": 45, "MariaDB": 46,
+    "Elasticsearch": 47, "Machine Learning": 48, "Deep Learning": 49, "NLP": 50,
+    "Computer Vision": 51, "Statistics": 52, "Data Analysis": 53, "Pandas": 54, "NumPy": 55,
+    "Scikit-learn": 56, "TensorFlow": 57, "PyTorch": 58, "Keras": 59, "Jupyter": 60,
+    "Matplotlib": 61, "Seaborn": 62, "SciPy": 63, "Feature Engineering": 64, "MLOps": 65,
+    "AWS": 66, "Azure": 67, "GCP": 68, "Docker": 69, "Kubernetes": 70, "Jenkins": 71,
+    "Terraform": 72, "Ansible": 73, "CI/CD": 74, "DevOps": 75, "Linux": 76, "Bash": 77, "Git": 78,
+    "GitHub": 79, "GitLab": 80, "Prometheus": 81, "Grafana": 82, "Microservices": 83,
+    "React Native": 84, "Flutter": 85, "Android Studio": 86, "Xcode": 87, "Mobile UI": 88,
+    "API Integration": 89, "UI Design": 90, "UX Design": 91, "Figma": 92, "Adobe XD": 93,
+    "Sketch": 94, "Photoshop": 95, "Illustrator": 96, "InVision": 97, "Prototyping": 98,
+    "Wireframing": 99, "User Testing": 100, "Design Systems": 101, "Accessibility": 102,
+    "Responsive Design": 103, "Animation": 104, "Communication": 105, "Leadership": 106,
+    "Problem Solving": 107, "Teamwork": 108, "Project Management": 109, "Agile": 110, "Scrum": 111,
+    "Time Management": 112, "Testing": 113, "Unit Testing": 114, "Integration Testing": 115,
+    "Debugging": 116, "Performance Optimization": 117, "Security": 118, "Cryptography": 119,
+    "Algorithms": 120, "Data Structures": 121, "OOP": 122, "Design Patterns": 123,
+    "System Design": 124,
+}
+
+
+def normalize_skill(skill: str) -> str:
+    """Normalize skill for matching (remove dots, spaces, lowercase)"""
+    return skill.lower().replace('.', '').replace(' ', '').replace('-', '')
+
+
+class SkillsRegistry:
+    """
+    Immutable, precomputed view of a skills database.
+
+    Holds the flat skill list (in database order, duplicates included), a
+    normalized-name -> canonical-name map, a skill -> category map and the
+    index range of every category inside the flat list.
+
+    Skills listed under several categories (e.g. Swift, Kotlin, Firebase)
+    resolve to the FIRST category they appear in, in database order.
+
+    Every canonical skill also has a stable integer id, taken from skill_ids
+    (SKILL_IDS), that keys the relational skill tables and skill bitmaps.
+    version changes whenever the vocabulary, its categories or its ids do.
+    """
+
+    __slots__ = (
+        'all_skills', 'canonical_names', 'skill_to_category', 'category_ranges',
+        'skill_names', 'skill_ids', 'version'
+    )
+
+    def __init__(self, skills_database: Dict[str, List[str]], skill_ids: Dict[str, int]):
+        all_skills = []
+        canonical_names = {}
+        skill_to_category = {}
+        category_ranges = {}
+
+        for category, skills in skills_database.items():
+            start = len(all_skills)
+            for skill in skills:
+                all_skills.append(skill)
+                canonical_names.setdefault(normalize_skill(skill), skill)
+                skill_to_category.setdefault(skill, category)
+            category_ranges[category] = (start, len(all_skills))
+
+        # Distinct canonical names, in first-appearance order
+        skill_names = tuple(dict.fromkeys(canonical_names.values()))
+        missing = [name for name in skill_names if name not in skill_ids]
+        if missing:
+            raise ValueError(f"Skills without an id in SKILL_IDS: {', '.join(missing)}")
+        if len(set(skill_ids.values())) != len(skill_ids) or min(skill_ids.values()) < 1:
+            raise ValueError("SKILL_IDS must give every skill a distinct id >= 1")
+        skill_ids = {name: skill_ids[name] for name in skill_names}
+
+        payload = json.dumps([skills_database, skill_ids]).encode('utf-8')
+
+        object.__setattr__(self, 'all_skills', tuple(all_skills))
+        object.__setattr__(self, 'canonical_names', MappingProxyType(canonical_names))
+        object.__setattr__(self, 'skill_to_category', MappingProxyType(skill_to_category))
+        object.__setattr__(self, 'category_ranges', MappingProxyType(category_ranges))
+        object.__setattr__(self, 'skill_names', skill_names)
+        object.__setattr__(self, 'skill_ids', MappingProxyType(skill_ids))
+        object.__setattr__(self, 'version', hashlib.sha256(payload).hexdigest()[:12])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("SkillsRegistry is immutable")
+
+    def skills_in_category(self, category: str) -> Tuple[str, ...]:
+        """Skills of a category, sliced from the flat list."""
+        if category not in self.category_ranges:
+            return ()
+        start, end = self.category_ranges[category]
+        return self.all_skills[start:end]
+
+    def category_of(self, skill: str, default: str = "other_technical") -> str:
+        """Category of an exactly-named skill."""
+        return self.skill_to_category.get(skill, default)
+
+    def canonical(self, skill: str) -> Optional[str]:
+        """Canonical database spelling of a skill name, or None if unknown."""
+        return self.canonical_names.get(normalize_skill(skill))
+
+    def skill_id(self, skill: str) -> Optional[int]:
+        """Canonical id of a skill name (any spelling), or None if unknown."""
+        canonical = self.canonical(skill)
+        return None if canonical is None else self.skill_ids[canonical]
+
+
+# Built once at import; SKILLS_DATABASE is treated as read-only from here on
+SKILLS_REGISTRY = SkillsRegistry(SKILLS_DATABASE, SKILL_IDS)
+SKILLS_DATABASE_VERSION = SKILLS_REGISTRY.version
+
+
+def get_skills_registry() -> SkillsRegistry:
+    """Get the precomputed registry for SKILLS_DATABASE."""
+    return SKILLS_REGISTRY
+
+
+def get_all_skills() -> Tuple[str, ...]:
+    """Get a flat list of all skills (precomputed, read-only)."""
+    return SKILLS_REGISTRY.all_skills
 
 
-def get_skills_by_category(category):
+def get_skills_by_category(category) -> Tuple[str, ...]:
     """Get skills for a specific category."""
-    return SKILLS_DATABASE.get(category, [])
+    return SKILLS_REGISTRY.skills_in_category(category)
 
 
-def categorize_skill(skill):
+def categorize_skill(skill) -> str:
     """Find which category a skill belongs to."""
-    for category, skills in SKILLS_DATABASE.items():
-        if skill in skills:
-            return category
-    return "other_technical"
+    return SKILLS_REGISTRY.category_of(skill)
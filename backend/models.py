@@ -1,5 +1,6 @@
 """SQLAlchemy database models."""
-from sqlalchemy import Column, Integer, String, Text, Float, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, Float, Boolean, ForeignKey, DateTime, LargeBinary, Index, text
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -29,6 +30,12 @@ class User(Base):
 class JobPosting(Base):
     """Job posting model created by recruiters."""
     __tablename__ = "job_postings"
+    __table_args__ = (
+        # Candidate job board: active jobs, newest first
+        Index("ix_job_postings_status_created_at", "status", "created_at"),
+        # Recruiter dashboard: own jobs, optionally by status
+        Index("ix_job_postings_recruiter_id_status", "recruiter_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     recruiter_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -53,25 +60,40 @@ class JobPosting(Base):
     weight_certifications = Column(Float, default=0.05)
     weight_leadership = Column(Float, default=0.05)
 
+    # Bumped whenever requirements/weights change; applications scored
+    # against an older version are re-scored in the background
+    scoring_version = Column(Integer, default=1)
+
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     recruiter = relationship("User", back_populates="job_postings")
     applications = relationship("Application", back_populates="job")
+    # Canonical required/preferred skills (skill_index.job_skill_links)
+    skill_links = relationship("JobSkill", cascade="all, delete-orphan")
 
 
 class Application(Base):
     """Application model linking candidates to jobs."""
     __tablename__ = "applications"
+    __table_args__ = (
+        # Ranked listings, score indexes and per-job counts
+        Index("ix_applications_job_id_final_score", "job_id", text("final_score DESC")),
+        # A candidate's own applications, newest first
+        Index("ix_applications_candidate_id_applied_at", "candidate_id", text("applied_at DESC")),
+        # Duplicate-application check
+        Index("ix_applications_job_id_candidate_id", "job_id", "candidate_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("job_postings.id"), nullable=False)
     candidate_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     resume_file_path = Column(String, nullable=False)
-    resume_text = Column(Text, nullable=False)
 
     # ML-Generated Fields
     extracted_skills = Column(Text)  # JSON array
+    # Canonical skills as a fixed-width bitset (skill_bitmap.encode_skill_bitmap)
+    skill_bitmap = Column(LargeBinary)
     num_skills = Column(Integer)
     skill_diversity = Column(Float)
     experience_years = Column(Float)
@@ -125,6 +147,151 @@ class Application(Base):
     status = Column(String, default="pending")  # 'pending', 'reviewed', 'shortlisted', 'rejected'
     applied_at = Column(DateTime, default=datetime.utcnow)
 
+    # Background processing (queue mode): 'processing', 'completed' or 'failed'
+    processing_status = Column(String, default="completed")
+    processing_error = Column(Text)
+
+    # JobPosting.scoring_version the scores were computed against
+    scoring_version = Column(Integer, default=1)
+
+    # Test data from generate-random, scored on normalize_skill forms of the skills
+    is_generated = Column(Boolean, default=False)
+
     # Relationships
     job = relationship("JobPosting", back_populates="applications")
     candidate = relationship("User", back_populates="applications")
+    resume = relationship("ApplicationResume", uselist=False, cascade="all, delete-orphan")
+    # Canonical extracted skills (skill_index.application_skill_fields)
+    skill_links = relationship("ApplicationSkill", cascade="all, delete-orphan")
+
+    # Resume text lives in application_resumes and is only loaded when read
+    # (detail view, re-processing); Application(resume_text=...) creates the row
+    resume_text = association_proxy(
+        "resume", "resume_text", creator=lambda resume_text: ApplicationResume(resume_text=resume_text)
+    )
+
+
+class ApplicationResume(Base):
+    """
+    Extracted resume text of an application.
+
+    Kept out of the applications table so that scoring, percentile and
+    listing queries don't read large text through its row's overflow pages.
+    """
+    __tablename__ = "application_resumes"
+
+    application_id = Column(Integer, ForeignKey("applications.id", ondelete="CASCADE"), primary_key=True)
+    resume_text = Column(Text, nullable=False)
+
+
+class Skill(Base):
+    """A canonical skill of SKILLS_DATABASE; id is its stable SKILL_IDS id, never reassigned."""
+    __tablename__ = "skills"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, nullable=False)
+    category = Column(String, nullable=False)
+
+
+class SkillVocabulary(Base):
+    """
+    SkillsRegistry.version the skill links were last built from (one row).
+
+    skill_index.sync_skills rebuilds the links when the registry's version
+    differs, e.g. after skills or spellings were added.
+    """
+    __tablename__ = "skill_vocabulary"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(String, nullable=False)
+    synced_at = Column(DateTime, default=datetime.utcnow)
+
+
+class ApplicationSkill(Base):
+    """
+    One canonical skill extracted from an application's resume.
+
+    Mirrors Application.extracted_skills (which stays the source for
+    responses) so skill filters and counts are index lookups instead of
+    json.loads over every row. job_id is copied from the application so a
+    job's applicants with a skill are one range of the job/skill index.
+    """
+    __tablename__ = "application_skills"
+    __table_args__ = (
+        # Applicants of a job with a skill; per-job skill counts
+        Index("ix_application_skills_job_id_skill_id", "job_id", "skill_id", "application_id"),
+        # Applicants with a skill across all jobs
+        Index("ix_application_skills_skill_id", "skill_id", "application_id"),
+    )
+
+    application_id = Column(Integer, ForeignKey("applications.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), primary_key=True)
+    job_id = Column(Integer, ForeignKey("job_postings.id"), nullable=False)
+
+
+class JobSkill(Base):
+    """
+    One canonical required or preferred skill of a job posting.
+
+    Mirrors JobPosting.required_skills / preferred_skills; skills that are
+    not in SKILLS_DATABASE only live in the JSON columns. An application's
+    matched / missing skills are the job's skills joined (or anti-joined)
+    with its application_skills.
+    """
+    __tablename__ = "job_skills"
+    __table_args__ = (
+        # Jobs requiring / preferring a skill
+        Index("ix_job_skills_skill_id_kind", "skill_id", "kind", "job_id"),
+    )
+
+    job_id = Column(Integer, ForeignKey("job_postings.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), primary_key=True)
+    kind = Column(String, primary_key=True)  # 'required' or 'preferred'
+
+
+class ProcessingTask(Base):
+    """Durable work item that finishes the ML pipeline for a queued application."""
+    __tablename__ = "processing_tasks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    application_id = Column(Integer, ForeignKey("applications.id"), nullable=False, unique=True)
+    status = Column(String, default="queued", index=True)  # 'queued', 'running', 'done', 'failed'
+    attempts = Column(Integer, default=0)
+    last_error = Column(Text)
+    locked_at = Column(DateTime)  # When a worker claimed the task
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+class ScoreHistogramBucket(Base):
+    """
+    Number of applications with one score in one pool.
+
+    Pools are scope 'all' (scope_key ''), 'job' (job id) or 'category'
+    (job category); bucket is the score in hundredths (scores are stored
+    rounded to 2 decimals, so buckets are exact).
+    """
+    __tablename__ = "score_histogram"
+
+    scope = Column(String, primary_key=True)
+    scope_key = Column(String, primary_key=True)
+    field = Column(String, primary_key=True)  # 'final_score', 'skills_score', ...
+    bucket = Column(Integer, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class ScoreSketchRecord(Base):
+    """
+    Serialized ScoreSketch of the scores of one pool's applications on one day.
+
+    Merging the sketches of a range of days gives the distribution for that
+    time window (see percentile_store.window_sketch).
+    """
+    __tablename__ = "score_sketches"
+
+    scope = Column(String, primary_key=True)
+    scope_key = Column(String, primary_key=True)
+    field = Column(String, primary_key=True)
+    day = Column(String, primary_key=True)  # 'YYYY-MM-DD' of Application.applied_at
+    sketch = Column(LargeBinary, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
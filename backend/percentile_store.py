@@ -0,0 +1,414 @@
+"""Persistent score distributions for percentile rankings.
+
+build_application_fields used to load every application (resume text
+included) three times per submission just to rank one score. The
+score_histogram table instead keeps, per pool and score field, how many
+applications have each score. Pools are every application ('all'), one
+job ('job') and one job category ('category').
+
+Scores are stored rounded to 2 decimals, so a bucket of hundredths holds
+exactly one score value and percentiles are exact. Every write that adds
+or changes application scores applies the matching +1/-1 bucket deltas in
+the same transaction: each is one primary-key upsert. A percentile is one
+indexed range sum over at most 10,001 buckets, whatever the number of
+applications.
+
+The same deltas also update score_sketches: one serialized ScoreSketch per
+pool, field and application day. Merging the days of a window gives that
+window's distribution. With PERCENTILE_WINDOW_DAYS set, stored percentiles
+rank against the last N days instead of all time.
+"""
+import os
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import and_, bindparam, case, func, text, tuple_
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from models import ScoreHistogramBucket, ScoreSketchRecord
+from ml_integration.score_sketch import ScoreSketch, score_bucket
+
+# Percentile configuration - load from environment variables
+PERCENTILE_WINDOW_DAYS = int(os.getenv("PERCENTILE_WINDOW_DAYS", "0"))  # 0 = all time
+
+# Score fields with a distribution per pool
+DISTRIBUTION_FIELDS = ("final_score", "skills_score", "experience_score", "education_score")
+
+_POOL_SQL = [
+    ("'all', ''", ""),
+    ("'job', CAST(a.job_id AS TEXT)", ""),
+    ("'category', COALESCE(j.category, '')", "JOIN job_postings j ON j.id = a.job_id"),
+]
+
+# SQL that rebuilds the all-time histograms from the applications table
+REBUILD_STATEMENTS = ["DELETE FROM score_histogram"] + [
+    f"""
+    INSERT INTO score_histogram (scope, scope_key, field, bucket, count)
+    SELECT {scope_sql}, '{field}', CAST(ROUND(a.{field} * 100) AS INTEGER) AS bucket, COUNT(*)
+    FROM applications a {join_sql}
+    WHERE a.{field} IS NOT NULL
+    GROUP BY 1, 2, 3, 4
+    """
+    for field in DISTRIBUTION_FIELDS
+    for scope_sql, join_sql in _POOL_SQL
+]
+
+# Per-day bucket counts the daily sketches are rebuilt from
+SKETCH_REBUILD_QUERIES = [
+    f"""
+    SELECT {scope_sql}, '{field}', COALESCE(date(a.applied_at), ''),
+           CAST(ROUND(a.{field} * 100) AS INTEGER) AS bucket, COUNT(*)
+    FROM applications a {join_sql}
+    WHERE a.{field} IS NOT NULL
+    GROUP BY 1, 2, 3, 4, 5
+    """
+    for field in DISTRIBUTION_FIELDS
+    for scope_sql, join_sql in _POOL_SQL
+]
+
+Pool = Tuple[str, str]
+
+
+def application_pools(job_id: int, category: Optional[str]) -> List[Pool]:
+    """(scope, scope_key) of every pool an application of this job belongs to."""
+    return [("all", ""), ("job", str(job_id)), ("category", category or "")]
+
+
+def application_day(applied_at: Optional[datetime]) -> str:
+    """Sketch day ('YYYY-MM-DD') of an application's applied_at ('' when unknown)."""
+    return applied_at.date().isoformat() if applied_at else ""
+
+
+def score_deltas(
+    job_id: int,
+    category: Optional[str],
+    old_scores: Optional[Dict],
+    new_scores: Optional[Dict],
+    day: Optional[str] = None
+) -> Counter:
+    """
+    Bucket count changes for one application's scores changing.
+
+    Args:
+        job_id: Job the application belongs to
+        category: That job's category
+        old_scores: Score field -> value before the change (None for a new application)
+        new_scores: Score field -> value after the change (None for a removed one)
+        day: application_day of the application (default: today, for a new one)
+
+    Returns:
+        Counter of (scope, scope_key, field, day, bucket) -> count delta
+    """
+    if day is None:
+        day = application_day(datetime.utcnow())
+    deltas = Counter()
+    for field in DISTRIBUTION_FIELDS:
+        old = old_scores.get(field) if old_scores else None
+        new = new_scores.get(field) if new_scores else None
+        if old is not None and new is not None and score_bucket(old) == score_bucket(new):
+            continue
+        for scope, scope_key in application_pools(job_id, category):
+            if old is not None:
+                deltas[(scope, scope_key, field, day, score_bucket(old))] -= 1
+            if new is not None:
+                deltas[(scope, scope_key, field, day, score_bucket(new))] += 1
+    return deltas
+
+
+def batch_score_deltas(
+    job_id: int,
+    category: Optional[str],
+    old_columns: Dict[str, List[Optional[float]]],
+    new_columns: Dict[str, List[Optional[float]]],
+    days: List[str]
+) -> Counter:
+    """
+    score_deltas summed over many applications of the same job.
+
+    Args:
+        job_id: Job the applications belong to
+        category: That job's category
+        old_columns: Score field -> scores before the change (None entries skipped)
+        new_columns: Score field -> scores after the change, in the same order
+        days: application_day of each application, in the same order
+
+    Returns:
+        Counter of (scope, scope_key, field, day, bucket) -> count delta
+    """
+    deltas = Counter()
+    pools = application_pools(job_id, category)
+    for field in DISTRIBUTION_FIELDS:
+        for sign, values in ((-1, old_columns.get(field, [])), (1, new_columns.get(field, []))):
+            per_day_bucket = Counter(
+                (day, score_bucket(value)) for day, value in zip(days, values) if value is not None
+            )
+            for (day, bucket), count in per_day_bucket.items():
+                for scope, scope_key in pools:
+                    deltas[(scope, scope_key, field, day, bucket)] += sign * count
+    return deltas
+
+
+def apply_score_deltas(db: Session, deltas: Counter):
+    """
+    Add bucket count changes to the stored distributions (committed by the caller).
+
+    Args:
+        db: Database session
+        deltas: Output of score_deltas (several can be added together)
+    """
+    histogram_deltas = Counter()
+    sketch_deltas = defaultdict(Counter)
+    for (scope, scope_key, field, day, bucket), delta in deltas.items():
+        if delta:
+            histogram_deltas[(scope, scope_key, field, bucket)] += delta
+            sketch_deltas[(scope, scope_key, field, day)][bucket] += delta
+
+    rows = [
+        {"scope": scope, "scope_key": scope_key, "field": field, "bucket": bucket, "count": delta}
+        for (scope, scope_key, field, bucket), delta in histogram_deltas.items()
+        if delta
+    ]
+    if rows:
+        # executemany INSERT ... ON CONFLICT DO UPDATE SET count = count + delta
+        statement = insert(ScoreHistogramBucket)
+        db.execute(statement.on_conflict_do_update(
+            index_elements=["scope", "scope_key", "field", "bucket"],
+            set_={"count": ScoreHistogramBucket.count + statement.excluded.count}
+        ), rows)
+
+        emptied = [row for row in rows if row["count"] < 0]
+        if emptied:
+            # Drop buckets that are now empty
+            db.execute(ScoreHistogramBucket.__table__.delete().where(and_(
+                ScoreHistogramBucket.scope == bindparam("b_scope"),
+                ScoreHistogramBucket.scope_key == bindparam("b_scope_key"),
+                ScoreHistogramBucket.field == bindparam("b_field"),
+                ScoreHistogramBucket.bucket == bindparam("b_bucket"),
+                ScoreHistogramBucket.count <= 0
+            )), [{f"b_{key}": row[key] for key in ("scope", "scope_key", "field", "bucket")} for row in emptied])
+
+    if sketch_deltas:
+        # Read-modify-write of the day sketches. The histogram upsert above
+        # already took SQLite's write lock, so no other writer interleaves.
+        _update_sketches(db, sketch_deltas)
+
+
+def _update_sketches(db: Session, sketch_deltas: Dict[Tuple[str, str, str, str], Counter]):
+    """Apply per-bucket deltas to the stored day sketches."""
+    keys = list(sketch_deltas)
+    key_columns = (ScoreSketchRecord.scope, ScoreSketchRecord.scope_key, ScoreSketchRecord.field, ScoreSketchRecord.day)
+    stored = {}
+    for start in range(0, len(keys), 200):
+        for scope, scope_key, field, day, data in db.query(*key_columns, ScoreSketchRecord.sketch).filter(
+            tuple_(*key_columns).in_(keys[start:start + 200])
+        ).all():
+            stored[(scope, scope_key, field, day)] = ScoreSketch.from_bytes(data)
+
+    upserts, deletes = [], []
+    for key, bucket_deltas in sketch_deltas.items():
+        sketch = stored.get(key) or ScoreSketch()
+        sketch.add_buckets(bucket_deltas)
+        scope, scope_key, field, day = key
+        if sketch.counts:
+            upserts.append({"scope": scope, "scope_key": scope_key, "field": field, "day": day,
+                            "sketch": sketch.to_bytes(), "count": len(sketch)})
+        elif key in stored:
+            deletes.append({"b_scope": scope, "b_scope_key": scope_key, "b_field": field, "b_day": day})
+
+    if upserts:
+        statement = insert(ScoreSketchRecord)
+        db.execute(statement.on_conflict_do_update(
+            index_elements=["scope", "scope_key", "field", "day"],
+            set_={"sketch": statement.excluded.sketch, "count": statement.excluded.count}
+        ), upserts)
+    if deletes:
+        db.execute(ScoreSketchRecord.__table__.delete().where(and_(
+            ScoreSketchRecord.scope == bindparam("b_scope"),
+            ScoreSketchRecord.scope_key == bindparam("b_scope_key"),
+            ScoreSketchRecord.field == bindparam("b_field"),
+            ScoreSketchRecord.day == bindparam("b_day"),
+        )), deletes)
+
+
+def record_score_change(
+    db: Session,
+    job_id: int,
+    category: Optional[str],
+    old_scores: Optional[Dict],
+    new_scores: Optional[Dict],
+    day: Optional[str] = None
+):
+    """Apply one application's score change to the distributions (committed by the caller)."""
+    apply_score_deltas(db, score_deltas(job_id, category, old_scores, new_scores, day))
+
+
+def move_job_distribution(db: Session, job_id: int, old_category: Optional[str], new_category: Optional[str]):
+    """
+    Move a job's applications from one category pool to another (committed by the caller).
+
+    The job's day sketches already hold exactly the counts to move.
+    """
+    deltas = Counter()
+    for field, day, data in db.query(
+        ScoreSketchRecord.field, ScoreSketchRecord.day, ScoreSketchRecord.sketch
+    ).filter(
+        ScoreSketchRecord.scope == "job",
+        ScoreSketchRecord.scope_key == str(job_id)
+    ).all():
+        for bucket, count in ScoreSketch.from_bytes(data).counts.items():
+            deltas[("category", old_category or "", field, day, bucket)] -= count
+            deltas[("category", new_category or "", field, day, bucket)] += count
+    apply_score_deltas(db, deltas)
+
+
+def window_sketch(
+    db: Session,
+    scope: str,
+    scope_key: str,
+    field: str,
+    start_day: Optional[date] = None,
+    end_day: Optional[date] = None
+) -> ScoreSketch:
+    """
+    Merged sketch of a pool's scores for applications made in a window.
+
+    Args:
+        db: Database session
+        scope: 'all', 'job' or 'category'
+        scope_key: '' for 'all', the job id or the category
+        field: Score field
+        start_day: First day included (None: no lower bound)
+        end_day: Last day included (None: no upper bound)
+
+    Returns:
+        ScoreSketch of the window
+    """
+    query = db.query(ScoreSketchRecord.sketch).filter(
+        ScoreSketchRecord.scope == scope,
+        ScoreSketchRecord.scope_key == scope_key,
+        ScoreSketchRecord.field == field
+    )
+    if start_day is not None:
+        query = query.filter(ScoreSketchRecord.day >= start_day.isoformat())
+    if end_day is not None:
+        query = query.filter(ScoreSketchRecord.day <= end_day.isoformat())
+
+    sketch = ScoreSketch()
+    for (data,) in query.all():
+        sketch.merge(ScoreSketch.from_bytes(data))
+    return sketch
+
+
+def _window_start_day() -> Optional[date]:
+    """First application day of the PERCENTILE_WINDOW_DAYS pool (None: all time)."""
+    if PERCENTILE_WINDOW_DAYS > 0:
+        return datetime.utcnow().date() - timedelta(days=PERCENTILE_WINDOW_DAYS - 1)
+    return None
+
+
+def pool_sketch(db: Session, scope: str, scope_key: str, field: str) -> ScoreSketch:
+    """Sketch of the pool stored percentiles rank against (PERCENTILE_WINDOW_DAYS or all time)."""
+    start_day = _window_start_day()
+    if start_day is not None:
+        return window_sketch(db, scope, scope_key, field, start_day=start_day)
+
+    return ScoreSketch(dict(db.query(ScoreHistogramBucket.bucket, ScoreHistogramBucket.count).filter(
+        ScoreHistogramBucket.scope == scope,
+        ScoreHistogramBucket.scope_key == scope_key,
+        ScoreHistogramBucket.field == field
+    ).all()))
+
+
+def store_percentile(
+    db: Session,
+    scope: str,
+    scope_key: str,
+    field: str,
+    score: float,
+    exclude_zero: bool = False
+) -> float:
+    """
+    calculate_percentile of a score against a stored pool.
+
+    Args:
+        db: Database session
+        scope: 'all', 'job' or 'category'
+        scope_key: '' for 'all', the job id or the category
+        field: Score field of the distribution
+        score: Score to rank
+        exclude_zero: Leave zero scores out of the pool
+
+    Returns:
+        Percentile (0-100), 50.0 for an empty pool
+    """
+    if PERCENTILE_WINDOW_DAYS > 0:
+        return pool_sketch(db, scope, scope_key, field).percentile(score, exclude_zero)
+
+    # All time: one range sum over the histogram, no sketch needed
+    bucket = score_bucket(score)
+    filters = [
+        ScoreHistogramBucket.scope == scope,
+        ScoreHistogramBucket.scope_key == scope_key,
+        ScoreHistogramBucket.field == field,
+    ]
+    if exclude_zero:
+        filters.append(ScoreHistogramBucket.bucket != 0)
+
+    below_count, total = db.query(
+        func.sum(case((ScoreHistogramBucket.bucket < bucket, ScoreHistogramBucket.count), else_=0)),
+        func.sum(ScoreHistogramBucket.count)
+    ).filter(*filters).one()
+
+    if not total:
+        return 50.0
+    return round(below_count / total * 100, 2)
+
+
+def store_percentiles(
+    db: Session,
+    scope: str,
+    scope_key: str,
+    field: str,
+    scores: Iterable[float],
+    exclude_zero: bool = False,
+    days: Optional[Iterable[str]] = None
+) -> np.ndarray:
+    """
+    store_percentile for many scores: the pool is read once.
+
+    Args:
+        days: application_day of each score, for scores whose applications
+            are already in the stored pool (re-scoring). Each is then ranked
+            without its own entry, like store_percentile ranks a submission
+            before it is added.
+    """
+    in_pool = None
+    if days is not None:
+        # Outside the window an application isn't part of the pool anyway
+        start_day = _window_start_day()
+        in_pool = [start_day is None or day >= start_day.isoformat() for day in days]
+    return pool_sketch(db, scope, scope_key, field).percentiles(scores, exclude_zero, in_pool)
+
+
+def rebuild_score_distributions(db: Session):
+    """Recompute every distribution from the applications table (committed by the caller)."""
+    db.flush()
+    for statement in REBUILD_STATEMENTS:
+        db.execute(text(statement))
+
+    sketches = defaultdict(dict)
+    for query in SKETCH_REBUILD_QUERIES:
+        for scope, scope_key, field, day, bucket, count in db.execute(text(query)).all():
+            sketches[(scope, scope_key, field, day)][bucket] = count
+
+    db.execute(ScoreSketchRecord.__table__.delete())
+    rows = []
+    for (scope, scope_key, field, day), counts in sketches.items():
+        sketch = ScoreSketch(counts)
+        rows.append({"scope": scope, "scope_key": scope_key, "field": field, "day": day,
+                     "sketch": sketch.to_bytes(), "count": len(sketch)})
+    if rows:
+        db.execute(insert(ScoreSketchRecord), rows)
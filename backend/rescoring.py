@@ -0,0 +1,293 @@
+"""Re-scoring a job's applications after its requirements or weights change.
+
+update_job_posting bumps JobPosting.scoring_version whenever a scoring
+column changes and schedules rescore_job_in_background. The re-score reads
+the job's applications in id-ordered chunks (only the columns scoring needs),
+scores each chunk with the vectorized batch scorer, moves the scores in the
+stored distributions (percentile_store), recomputes the stored percentiles
+and writes everything back with executemany UPDATEs in a single
+transaction. Each application records the scoring_version it was scored
+against, so readers can tell current scores from stale ones.
+
+Skills are matched the way each application was first scored: raw for
+uploads, normalize_skill forms for generate-random's test applications
+(Application.is_generated). A background re-score that raises is retried
+RESCORE_MAX_ATTEMPTS times, then logged; its applications keep their old
+scoring_version.
+"""
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from models import JobPosting, Application
+from ml_integration.batch_scoring import CandidateBatch, score_batch
+from ml_integration.job_profile import get_job_profile
+from ml_integration.scoring import check_requirements
+from ml_integration.skill_gap import analyze_skill_gap
+from ml_integration.skills_database import normalize_skill
+from score_index import record_application_scores
+from percentile_store import (
+    DISTRIBUTION_FIELDS, application_day, apply_score_deltas, batch_score_deltas, store_percentiles
+)
+
+# Re-scoring configuration - load from environment variables
+RESCORE_CHUNK_SIZE = int(os.getenv("RESCORE_CHUNK_SIZE", "5000"))
+RESCORE_MAX_ATTEMPTS = int(os.getenv("RESCORE_MAX_ATTEMPTS", "3"))
+RESCORE_RETRY_SECONDS = float(os.getenv("RESCORE_RETRY_SECONDS", "5"))
+
+logger = logging.getLogger(__name__)
+
+SCORE_FIELDS = ("final_score", "skills_score", "experience_score", "education_score", "bonus_score")
+
+
+def _iter_application_chunks(db: Session, job_id: int, chunk_size: int):
+    """Yield the scoring inputs of a job's completed applications, chunk by chunk."""
+    last_id = 0
+    while True:
+        rows = db.query(
+            Application.id,
+            Application.extracted_skills,
+            Application.experience_years,
+            Application.education_level,
+            Application.has_certifications,
+            Application.has_leadership,
+            Application.skill_diversity,
+            Application.is_generated,
+            # Current scores, to move them in the stored distributions
+            Application.final_score,
+            Application.skills_score,
+            Application.experience_score,
+            Application.education_score,
+            Application.applied_at,
+        ).filter(
+            Application.job_id == job_id,
+            Application.id > last_id,
+            # Queued / failed applications have nothing to re-score yet
+            or_(Application.processing_status == "completed", Application.processing_status.is_(None))
+        ).order_by(Application.id).limit(chunk_size).all()
+
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+def _experience(row) -> float:
+    """Stored experience_years, 0.0 when missing."""
+    return row.experience_years if row.experience_years is not None else 0.0
+
+
+def _uses_normalized_skills(row) -> bool:
+    """Whether the application was first scored on normalize_skill forms (generate-random's are)."""
+    return bool(row.is_generated)
+
+
+def _score_chunk(rows, match_lists: List[List[str]], normalized: List[bool], kwargs_by_mode: Dict) -> Dict:
+    """Score a chunk with score_batch, one batch per matching mode, in row order."""
+    columns = {"meets_requirements": np.zeros(len(rows), dtype=bool)}
+    columns.update({field: np.zeros(len(rows)) for field in SCORE_FIELDS})
+
+    for mode, job_kwargs in kwargs_by_mode.items():
+        indexes = [i for i, row_mode in enumerate(normalized) if row_mode == mode]
+        if not indexes:
+            continue
+        batch = CandidateBatch(
+            skill_lists=[match_lists[i] for i in indexes],
+            experience=[_experience(rows[i]) for i in indexes],
+            education=[rows[i].education_level for i in indexes],
+            has_certifications=[bool(rows[i].has_certifications) for i in indexes],
+            has_leadership=[bool(rows[i].has_leadership) for i in indexes],
+            skill_diversity=[rows[i].skill_diversity or 0 for i in indexes]
+        )
+        scores = score_batch(batch, **job_kwargs)
+        for field in columns:
+            columns[field][indexes] = scores[field]
+
+    return columns
+
+
+def rescore_job_applications(db: Session, job: JobPosting, chunk_size: int = RESCORE_CHUNK_SIZE) -> Dict:
+    """
+    Re-score every application of a job against its current requirements.
+
+    Args:
+        db: Database session
+        job: Job whose applications are re-scored
+        chunk_size: Applications read and scored per batch
+
+    Returns:
+        Dictionary with job_id, scoring_version, rescored count, seconds and
+        superseded (True if the job changed again before the write committed)
+    """
+    started = time.perf_counter()
+    profile = get_job_profile(job)
+    scoring_version = job.scoring_version or 1
+    # Keyed by "uses normalized skills"
+    kwargs_by_mode = {False: profile.scoring_kwargs(), True: profile.scoring_kwargs(normalized=True)}
+
+    mappings: List[Dict] = []
+    new_scores = {field: [] for field in SCORE_FIELDS}
+    old_scores = {field: [] for field in DISTRIBUTION_FIELDS}
+    days = []
+
+    for rows in _iter_application_chunks(db, job.id, chunk_size):
+        normalized = [_uses_normalized_skills(row) for row in rows]
+        match_lists = []
+        for row, row_normalized in zip(rows, normalized):
+            skills = json.loads(row.extracted_skills) if row.extracted_skills else []
+            match_lists.append([normalize_skill(s) for s in skills] if row_normalized else skills)
+        scores = _score_chunk(rows, match_lists, normalized, kwargs_by_mode)
+
+        meets_column = scores["meets_requirements"].tolist()
+        score_columns = {field: scores[field].tolist() for field in SCORE_FIELDS}
+        for field in SCORE_FIELDS:
+            new_scores[field].extend(score_columns[field])
+        for field in DISTRIBUTION_FIELDS:
+            old_scores[field].extend(getattr(row, field) for row in rows)
+        days.extend(application_day(row.applied_at) for row in rows)
+
+        for i, row in enumerate(rows):
+            candidate_skills = match_lists[i]
+            job_kwargs = kwargs_by_mode[normalized[i]]
+
+            if meets_column[i]:
+                missing, rejection_reason = [], ""
+            else:
+                # Only rejected candidates need the human-readable reasons
+                _, missing, rejection_reason = check_requirements(
+                    candidate_skills=candidate_skills,
+                    candidate_experience=_experience(row),
+                    candidate_education=row.education_level,
+                    candidate_has_certifications=bool(row.has_certifications),
+                    candidate_has_leadership=bool(row.has_leadership),
+                    job_required_skills=job_kwargs["job_required_skills"],
+                    job_min_experience=job_kwargs["job_min_experience"],
+                    job_min_education=job_kwargs["job_min_education"],
+                    job_certifications_required=job_kwargs["job_certifications_required"],
+                    job_leadership_required=job_kwargs["job_leadership_required"]
+                )
+
+            gap_analysis = analyze_skill_gap(
+                candidate_skills=candidate_skills,
+                required_skills=job_kwargs["job_required_skills"],
+                preferred_skills=job_kwargs["job_preferred_skills"]
+            )
+
+            mapping = {
+                "id": row.id,
+                "meets_requirements": meets_column[i],
+                "missing_requirements": json.dumps(missing),
+                "rejection_reason": rejection_reason,
+                "matched_skills": json.dumps(gap_analysis['matched_skills']),
+                "missing_skills": json.dumps(gap_analysis['missing_skills']),
+                "skill_match_percentage": gap_analysis['overall_match_percentage'],
+                "recommendations": json.dumps(gap_analysis['recommendations']),
+                "matched_required_skills": json.dumps(gap_analysis['matched_required']),
+                "matched_preferred_skills": json.dumps(gap_analysis['matched_preferred']),
+                "missing_required_skills": json.dumps(gap_analysis['missing_required']),
+                "missing_preferred_skills": json.dumps(gap_analysis['missing_preferred']),
+                "required_match_percentage": gap_analysis['required_match_percentage'],
+                "scoring_version": scoring_version,
+            }
+            for field in SCORE_FIELDS:
+                mapping[field] = score_columns[field][i]
+            mappings.append(mapping)
+
+    if mappings:
+        # Move the job's scores in the stored distributions, then rank against
+        # them without each application's own score, as build_application_fields
+        # ranks a submission (same pools: zero scores are left out of the
+        # overall/component pools, kept in the category pool)
+        apply_score_deltas(db, batch_score_deltas(job.id, job.category, old_scores, new_scores, days))
+
+        percentile_columns = {}
+        for field, percentile_field in [
+            ("final_score", "overall_percentile"),
+            ("skills_score", "skills_percentile"),
+            ("experience_score", "experience_percentile"),
+            ("education_score", "education_percentile"),
+        ]:
+            percentile_columns[percentile_field] = store_percentiles(
+                db, "all", "", field, new_scores[field], exclude_zero=True, days=days
+            ).tolist()
+        percentile_columns["category_percentile"] = store_percentiles(
+            db, "category", job.category or "", "final_score", new_scores["final_score"], days=days
+        ).tolist()
+
+        for i, mapping in enumerate(mappings):
+            for percentile_field, values in percentile_columns.items():
+                mapping[percentile_field] = values[i]
+
+    # Don't overwrite the work of a newer re-score if the job changed meanwhile
+    current_version = db.query(JobPosting.scoring_version).filter(JobPosting.id == job.id).scalar()
+    if (current_version or 1) != scoring_version:
+        db.rollback()
+        return {
+            "job_id": job.id,
+            "scoring_version": scoring_version,
+            "rescored": 0,
+            "seconds": round(time.perf_counter() - started, 3),
+            "superseded": True,
+        }
+
+    # executemany UPDATE ... WHERE id = ?, all chunks in one transaction
+    for start in range(0, len(mappings), chunk_size):
+        db.execute(update(Application), mappings[start:start + chunk_size])
+    db.commit()
+    record_application_scores(job.id, {
+        mapping["id"]: mapping["final_score"] for mapping in mappings
+    })
+
+    return {
+        "job_id": job.id,
+        "scoring_version": scoring_version,
+        "rescored": len(mappings),
+        "seconds": round(time.perf_counter() - started, 3),
+        "superseded": False,
+    }
+
+
+def rescore_job_in_background(job_id: int, session_factory=None) -> Optional[Dict]:
+    """
+    Background-task entry point: re-score a job with its own session.
+
+    A failed attempt (e.g. the database is locked) is rolled back and retried
+    after RESCORE_RETRY_SECONDS, up to RESCORE_MAX_ATTEMPTS times.
+
+    Args:
+        job_id: Job whose applications are re-scored
+        session_factory: Session factory (defaults to database.SessionLocal)
+
+    Returns:
+        The rescore_job_applications result, None if the job is gone or every attempt failed
+    """
+    if session_factory is None:
+        from database import SessionLocal
+        session_factory = SessionLocal
+
+    for attempt in range(1, RESCORE_MAX_ATTEMPTS + 1):
+        db = session_factory()
+        try:
+            job = db.query(JobPosting).filter(JobPosting.id == job_id).first()
+            if job is None:
+                return None
+            return rescore_job_applications(db, job)
+        except Exception:
+            db.rollback()
+            if attempt == RESCORE_MAX_ATTEMPTS:
+                logger.exception(
+                    "Re-scoring job %s failed after %d attempts; its applications keep their old scoring_version",
+                    job_id, attempt
+                )
+                return None
+            logger.warning("Re-scoring job %s failed (attempt %d), retrying", job_id, attempt, exc_info=True)
+        finally:
+            db.close()
+        time.sleep(RESCORE_RETRY_SECONDS)
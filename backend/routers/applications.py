@@ -1,38 +1,61 @@
 """Applications router for candidates and recruiters."""
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from typing import List, Optional
+import base64
+from datetime import datetime
 import json
 import os
 from pathlib import Path
 
-from database import get_db
-from models import User, JobPosting, Application
+from database import get_db, get_async_db
+from models import User, JobPosting, Application, ApplicationResume, ProcessingTask
 from schemas import (
-    ApplicationResponse, ApplicationDetailResponse, ApplicationStatusUpdate
+    ApplicationResponse, ApplicationDetailResponse, ApplicationStatusUpdate,
+    ApplicationProcessingStatus, ApplicationListItem, ApplicationPage, JobSkillCount
+)
+from auth import (
+    get_current_user, get_current_candidate, get_current_recruiter,
+    get_current_candidate_async, get_current_recruiter_async
+)
+from ml_executor import ml_executor, process_resume_on_executor
+from extraction_pool import ExtractionError, extract_resume_file
+from upload_streaming import stream_upload_to_file
+from score_index import (
+    SortedScoreIndex, get_job_score_index, get_job_score_index_async, record_application, record_application_scores
+)
+from percentile_store import application_day, record_score_change, store_percentile
+from skill_bitmap import (
+    SkillBitmapIndex, SkillQueryError, get_job_skill_bitmaps, get_job_skill_bitmaps_async, invalidate_skill_bitmaps
+)
+from skill_index import application_skill_fields, applications_with_skills, job_skill_counts, resolve_skill_names
+from application_processing import (
+    APPLICATION_PROCESSING_MODE, build_application_fields, enqueue_application
 )
-from auth import get_current_user, get_current_candidate, get_current_recruiter
 
 # ML imports
-from ml_integration.resume_parser import extract_text_from_file, validate_resume_file
 from ml_integration.extract_skills import process_resume
-from ml_integration.scoring import calculate_final_score, calculate_percentile
+from ml_integration.pipeline import score_resume_for_job
+from ml_integration.job_profile import get_job_profile
+from ml_integration.scoring import calculate_final_score
 from ml_integration.clustering import assign_cluster
 from ml_integration.skill_gap import analyze_skill_gap
-from ml_integration.skills_database import get_all_skills
+from ml_integration.skills_database import get_skills_registry, normalize_skill
 
 router = APIRouter(prefix="/api/applications", tags=["Applications"])
 
+# Async (AsyncSession) versions of the hot endpoints; main.py includes this
+# router ahead of router when ASYNC_DB_ENDPOINTS is on
+async_router = APIRouter(prefix="/api/applications", tags=["Applications"])
+
 # Use absolute path for upload directory
 UPLOAD_DIR = Path(__file__).parent.parent / "uploads" / "resumes"
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def normalize_skill(skill: str) -> str:
-    """Normalize skill for matching (remove dots, spaces, lowercase)"""
-    return skill.lower().replace('.', '').replace(' ', '').replace('-', '')
-
-
 def map_to_skills_database(skills: List[str]) -> List[str]:
     """
     Map job skills to proper SKILLS_DATABASE format for resume generation.
@@ -42,17 +65,14 @@ def map_to_skills_database(skills: List[str]) -> List[str]:
 
     Example: "python" or "nextjs" -> "Python", "Next.js"
     """
-    all_db_skills = get_all_skills()
-
-    # Create normalized -> proper casing mapping
-    skill_map = {normalize_skill(s): s for s in all_db_skills}
+    registry = get_skills_registry()
 
     mapped_skills = []
     for skill in skills:
-        normalized = normalize_skill(skill)
-        if normalized in skill_map:
+        canonical = registry.canonical(skill)
+        if canonical is not None:
             # Use proper casing from database
-            mapped_skills.append(skill_map[normalized])
+            mapped_skills.append(canonical)
         else:
             # Keep original if not in database
             mapped_skills.append(skill)
@@ -87,25 +107,16 @@ def generate_random_resume_text(job: JobPosting) -> str:
     """
     import random
 
-    # Parse job requirements
-    required_skills = json.loads(job.required_skills) if job.required_skills else []
-    preferred_skills = json.loads(job.preferred_skills) if job.preferred_skills else []
+    # Parsed job requirements
+    profile = get_job_profile(job)
 
     # Map skills to SKILLS_DATABASE format so process_resume can extract them
-    required_skills = map_to_skills_database(required_skills)
-    preferred_skills = map_to_skills_database(preferred_skills)
-
-    # Parse requirements JSON for hard filters
-    requirements_data = {}
-    if job.requirements:
-        try:
-            requirements_data = json.loads(job.requirements)
-        except json.JSONDecodeError:
-            requirements_data = {}
+    required_skills = map_to_skills_database(profile.required_skills)
+    preferred_skills = map_to_skills_database(profile.preferred_skills)
 
-    job_min_education = requirements_data.get('min_education', 'none')
-    job_certifications_required = requirements_data.get('certifications_required', False)
-    job_leadership_required = requirements_data.get('leadership_required', False)
+    job_min_education = profile.min_education
+    job_certifications_required = profile.certifications_required
+    job_leadership_required = profile.leadership_required
 
     # Generic skill pool for padding
     generic_skills = [
@@ -293,14 +304,8 @@ EDUCATION
     return resume_text.strip()
 
 
-@router.post("", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
-async def submit_application(
-    job_id: int = Form(...),
-    resume_file: UploadFile = File(...),
-    current_user: User = Depends(get_current_candidate),
-    db: Session = Depends(get_db)
-):
-    """Submit a job application with resume upload (candidates only)."""
+def _get_open_job_for_candidate(db: Session, job_id: int, candidate_id: int) -> JobPosting:
+    """Validate the job is open and the candidate has not applied yet."""
     # Validate job exists and is active
     job = db.query(JobPosting).filter(JobPosting.id == job_id).first()
     if not job:
@@ -318,7 +323,7 @@ async def submit_application(
     # Check if already applied
     existing_application = db.query(Application).filter(
         Application.job_id == job_id,
-        Application.candidate_id == current_user.id
+        Application.candidate_id == candidate_id
     ).first()
 
     if existing_application:
@@ -327,218 +332,215 @@ async def submit_application(
             detail="You have already applied to this job"
         )
 
-    # Validate file
-    validation_error = validate_resume_file(resume_file.filename)
-    if validation_error:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=validation_error
-        )
+    return job
+
+
+def _remove_resume_file(file_path: Path):
+    """Delete a stored resume if it exists."""
+    if file_path.exists():
+        os.remove(file_path)
+
+
+def _store_application(
+    db: Session,
+    job: JobPosting,
+    candidate_id: int,
+    file_path: Path,
+    result: dict
+) -> Application:
+    """Compute percentiles for a scored resume and insert the application."""
+    fields = build_application_fields(db, job, result)
+    new_application = Application(
+        job_id=job.id,
+        candidate_id=candidate_id,
+        resume_file_path=str(file_path),
+        applied_at=datetime.utcnow(),
+        **fields
+    )
+
+    db.add(new_application)
+    record_score_change(
+        db, job.id, job.category, None, fields, application_day(new_application.applied_at)
+    )
+    db.commit()
+    db.refresh(new_application)
+    record_application(new_application)
+    invalidate_skill_bitmaps(job.id)
+
+    return new_application
+
+
+def _queue_application(
+    db: Session,
+    job: JobPosting,
+    candidate_id: int,
+    file_path: Path
+) -> Application:
+    """Insert an application in the 'processing' state and enqueue its ML work."""
+    new_application = Application(
+        job_id=job.id,
+        candidate_id=candidate_id,
+        resume_file_path=str(file_path),
+        resume_text="",
+        processing_status="processing"
+    )
+    db.add(new_application)
+    db.flush()
+
+    enqueue_application(db, new_application)
+    db.commit()
+    db.refresh(new_application)
 
-    # Save resume file
-    file_extension = os.path.splitext(resume_file.filename)[1]
-    file_path = UPLOAD_DIR / f"user_{current_user.id}_job_{job_id}{file_extension}"
+    return new_application
 
-    with open(file_path, "wb") as f:
-        content = await resume_file.read()
-        f.write(content)
 
-    try:
-        # Extract text from resume
-        resume_text = extract_text_from_file(str(file_path))
-
-        # Process resume with ML
-        processed_data = process_resume(resume_text)
-
-        # Parse job requirements
-        required_skills = json.loads(job.required_skills) if job.required_skills else []
-        preferred_skills = json.loads(job.preferred_skills) if job.preferred_skills else []
-
-        # Parse requirements JSON for hard filters
-        requirements_data = {}
-        if job.requirements:
-            try:
-                requirements_data = json.loads(job.requirements)
-            except json.JSONDecodeError:
-                requirements_data = {}
-
-        job_min_education = requirements_data.get('min_education', 'none')
-        job_certifications_required = requirements_data.get('certifications_required', False)
-        job_leadership_required = requirements_data.get('leadership_required', False)
-
-        # Calculate scores using job-specific requirements
-        weights = {
-            "skills": job.weight_skills,
-            "experience": job.weight_experience,
-            "education": job.weight_education,
-            "certification": job.weight_certifications,
-            "leadership": job.weight_leadership
-        }
+@router.post("", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
+async def submit_application(
+    response: Response,
+    job_id: int = Form(...),
+    resume_file: UploadFile = File(...),
+    current_user: User = Depends(get_current_candidate),
+    db: Session = Depends(get_db)
+):
+    """
+    Submit a job application with resume upload (candidates only).
 
-        # TWO-STAGE SCORING: Requirements check → Ranking
-        scores = calculate_final_score(
-            # Candidate attributes
-            candidate_skills=processed_data['extracted_skills'],
-            candidate_experience=processed_data['experience_years'],
-            candidate_education=processed_data['education_level'],
-            candidate_has_certifications=processed_data['has_certifications'],
-            candidate_has_leadership=processed_data['has_leadership'],
-            candidate_skill_diversity=processed_data['skill_diversity'],
-            # Job requirements (hard filters)
-            job_required_skills=required_skills,
-            job_preferred_skills=preferred_skills,
-            job_min_experience=job.min_experience or 0,
-            job_min_education=job_min_education,
-            job_certifications_required=job_certifications_required,
-            job_leadership_required=job_leadership_required,
-            # Weights for ranking
-            weights=weights
-        )
+    Database work runs on the threadpool, text extraction runs in a
+    supervised, resource-limited worker and ML runs on the bounded ML
+    executor, so the event loop stays free for other requests.
 
-        # Assign cluster
-        cluster_info = assign_cluster(
-            experience_years=processed_data['experience_years'],
-            num_skills=processed_data['num_skills'],
-            skill_diversity=processed_data['skill_diversity']
-        )
+    With APPLICATION_PROCESSING_MODE=queue the application is stored in the
+    'processing' state and 202 is returned immediately; poll
+    GET /api/applications/{id}/processing for progress.
+    """
+    job = await run_in_threadpool(_get_open_job_for_candidate, db, job_id, current_user.id)
 
-        # Calculate percentiles (against all applications)
-        all_scores = [app.final_score for app in db.query(Application).all() if app.final_score]
-        overall_percentile = calculate_percentile(scores['final_score'], all_scores)
-
-        # Calculate category percentile (against applications in same category)
-        category_scores = [
-            app.final_score for app in db.query(Application)
-            .join(JobPosting)
-            .filter(JobPosting.category == job.category, Application.final_score.isnot(None))
-            .all()
-        ]
-        category_percentile = calculate_percentile(scores['final_score'], category_scores)
-
-        # NEW: Calculate component-level percentiles
-        all_apps = db.query(Application).all()
-        skills_scores = [app.skills_score for app in all_apps if app.skills_score]
-        experience_scores = [app.experience_score for app in all_apps if app.experience_score]
-        education_scores = [app.education_score for app in all_apps if app.education_score]
-
-        skills_percentile = calculate_percentile(scores['skills_score'], skills_scores)
-        experience_percentile = calculate_percentile(scores['experience_score'], experience_scores)
-        education_percentile = calculate_percentile(scores['education_score'], education_scores)
-
-        # Skill gap analysis
-        required_skills = json.loads(job.required_skills)
-        preferred_skills = json.loads(job.preferred_skills)
-        gap_analysis = analyze_skill_gap(
-            candidate_skills=processed_data['extracted_skills'],
-            required_skills=required_skills,
-            preferred_skills=preferred_skills
-        )
+    # Stream the resume to disk in chunks (type sniffed, size enforced as it arrives)
+    file_extension = os.path.splitext(resume_file.filename)[1]
+    file_path = UPLOAD_DIR / f"user_{current_user.id}_job_{job_id}{file_extension}"
+    await stream_upload_to_file(resume_file, file_path)
 
-        # NEW: Prepare skills by category counts
-        skills_by_category_counts = {
-            category: len(skills_list)
-            for category, skills_list in processed_data['skills_by_category'].items()
-        }
+    if APPLICATION_PROCESSING_MODE == "queue":
+        try:
+            new_application = await run_in_threadpool(
+                _queue_application, db, job, current_user.id, file_path
+            )
+        except Exception as e:
+            _remove_resume_file(file_path)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error queueing application: {str(e)}"
+            )
+        response.status_code = status.HTTP_202_ACCEPTED
+        return ApplicationResponse.model_validate(new_application)
 
-        # Create application
-        new_application = Application(
-            job_id=job_id,
-            candidate_id=current_user.id,
-            resume_file_path=str(file_path),
-            resume_text=resume_text,
-            # ML fields
-            extracted_skills=json.dumps(processed_data['extracted_skills']),
-            num_skills=processed_data['num_skills'],
-            skill_diversity=processed_data['skill_diversity'],
-            experience_years=processed_data['experience_years'],
-            education_level=processed_data['education_level'],
-            has_certifications=processed_data['has_certifications'],
-            has_leadership=processed_data['has_leadership'],
-            # NEW: Skills by category
-            skills_by_category=json.dumps(skills_by_category_counts),
-            technical_skills_count=processed_data['technical_skills_count'],
-            # Requirements check (Stage 1)
-            meets_requirements=scores['meets_requirements'],
-            missing_requirements=json.dumps(scores['missing_requirements']),
-            rejection_reason=scores['rejection_reason'],
-            # Scores (Stage 2)
-            skills_score=scores['skills_score'],
-            experience_score=scores['experience_score'],
-            education_score=scores['education_score'],
-            bonus_score=scores['bonus_score'],
-            final_score=scores['final_score'],
-            # Rankings
-            overall_percentile=overall_percentile,
-            category_percentile=category_percentile,
-            # NEW: Component percentiles
-            skills_percentile=skills_percentile,
-            experience_percentile=experience_percentile,
-            education_percentile=education_percentile,
-            # Clustering
-            cluster_id=cluster_info['cluster_id'],
-            cluster_name=cluster_info['cluster_name'],
-            cluster_description=cluster_info['cluster_description'],
-            # Skill gap
-            matched_skills=json.dumps(gap_analysis['matched_skills']),
-            missing_skills=json.dumps(gap_analysis['missing_skills']),
-            skill_match_percentage=gap_analysis['overall_match_percentage'],
-            recommendations=json.dumps(gap_analysis['recommendations']),
-            # NEW: Detailed skill gap
-            matched_required_skills=json.dumps(gap_analysis['matched_required']),
-            matched_preferred_skills=json.dumps(gap_analysis['matched_preferred']),
-            missing_required_skills=json.dumps(gap_analysis['missing_required']),
-            missing_preferred_skills=json.dumps(gap_analysis['missing_preferred']),
-            required_match_percentage=gap_analysis['required_match_percentage']
-        )
+    try:
+        # Extract text from the stored file (killed if it exceeds its CPU/memory limits)
+        resume_text = await run_in_threadpool(extract_resume_file, file_path)
 
-        db.add(new_application)
-        db.commit()
-        db.refresh(new_application)
+        # Process resume (cached in this process), score, cluster and analyze skill gap
+        processed = await process_resume_on_executor(resume_text)
+        profile = get_job_profile(job)
+        result = await ml_executor.run(score_resume_for_job, resume_text, profile, processed)
+
+        new_application = await run_in_threadpool(
+            _store_application, db, job, current_user.id, file_path, result
+        )
 
         return ApplicationResponse.model_validate(new_application)
 
+    except HTTPException:
+        _remove_resume_file(file_path)
+        raise
+    except ExtractionError as e:
+        _remove_resume_file(file_path)
+        raise HTTPException(status_code=e.status_code, detail=e.to_detail())
     except Exception as e:
         # Clean up file if processing failed
-        if file_path.exists():
-            os.remove(file_path)
+        _remove_resume_file(file_path)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing resume: {str(e)}"
         )
 
 
+def _my_applications(candidate_id: int) -> Select:
+    """
+    Statement for a candidate's applications with job titles and ranks.
+
+    One statement loads the applications, their job titles and each
+    application's rank within its job (window functions over the jobs the
+    candidate applied to), instead of a job lookup and a score scan per row.
+    Rows are (application, job title, scores below, pool size).
+    """
+    candidate_job_ids = select(Application.job_id).where(
+        Application.candidate_id == candidate_id
+    )
+
+    # Scores strictly below each application's, per job: RANK() - 1
+    # (ties share the lowest rank), over the same pool calculate_percentile uses
+    ranked = select(
+        Application.id.label("application_id"),
+        (func.rank().over(partition_by=Application.job_id, order_by=Application.final_score) - 1).label("below_count")
+    ).where(
+        Application.job_id.in_(candidate_job_ids),
+        Application.final_score.isnot(None)
+    ).subquery()
+
+    pool_sizes = select(
+        Application.job_id,
+        func.count(Application.id).label("pool_size")
+    ).where(
+        Application.job_id.in_(candidate_job_ids),
+        Application.final_score.isnot(None)
+    ).group_by(Application.job_id).subquery()
+
+    return select(
+        Application, JobPosting.title, ranked.c.below_count, pool_sizes.c.pool_size
+    ).outerjoin(
+        JobPosting, JobPosting.id == Application.job_id
+    ).outerjoin(
+        ranked, ranked.c.application_id == Application.id
+    ).outerjoin(
+        pool_sizes, pool_sizes.c.job_id == Application.job_id
+    ).where(
+        Application.candidate_id == candidate_id
+    ).order_by(Application.applied_at.desc())
+
+
+def _my_application_responses(rows) -> List[ApplicationResponse]:
+    """Responses for _my_applications rows."""
+    results = []
+    for app, job_title, below_count, pool_size in rows:
+        app_response = ApplicationResponse.model_validate(app)
+        app_response.job_title = job_title
+        # Same result as calculate_percentile(app.final_score or 0, job scores);
+        # an unscored application ranks as 0, with no score below it
+        if pool_size:
+            app_response.overall_percentile = round((below_count or 0) / pool_size * 100, 2)
+        else:
+            app_response.overall_percentile = 50.0
+        results.append(app_response)
+
+    return results
+
+
 @router.get("/my", response_model=List[ApplicationResponse])
 def get_my_applications(
     current_user: User = Depends(get_current_candidate),
     db: Session = Depends(get_db)
 ):
-    """Get all applications for the current candidate."""
-    applications = db.query(Application).filter(
-        Application.candidate_id == current_user.id
-    ).order_by(Application.applied_at.desc()).all()
+    """Get all applications for the current candidate (one query)."""
+    return _my_application_responses(db.execute(_my_applications(current_user.id)).all())
 
-    # Calculate dynamic percentiles for each application
-    results = []
-    for app in applications:
-        # Get job title for display
-        job = db.query(JobPosting).filter(JobPosting.id == app.job_id).first()
-        job_title = job.title if job else None
-
-        # Get all applications for the same job to calculate percentile
-        all_applications = db.query(Application).filter(
-            Application.job_id == app.job_id
-        ).all()
-        all_scores = [a.final_score for a in all_applications if a.final_score is not None]
-        dynamic_percentile = calculate_percentile(app.final_score or 0, all_scores)
-
-        # Create response with dynamic percentile and job title
-        app_response = ApplicationResponse.model_validate(app)
-        app_data = app_response.model_dump()
-        app_data['overall_percentile'] = dynamic_percentile
-        app_data['job_title'] = job_title
-        results.append(ApplicationResponse(**app_data))
 
-    return results
+@async_router.get("/my", response_model=List[ApplicationResponse])
+async def get_my_applications_async(
+    current_user: User = Depends(get_current_candidate_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """get_my_applications on the async session."""
+    return _my_application_responses((await db.execute(_my_applications(current_user.id))).all())
 
 
 @router.get("/{application_id}", response_model=ApplicationDetailResponse)
@@ -589,11 +591,7 @@ def get_application_details(
             )
 
     # Calculate dynamic percentile based on all applications for this job
-    all_applications = db.query(Application).filter(
-        Application.job_id == application.job_id
-    ).all()
-    all_scores = [app.final_score for app in all_applications if app.final_score is not None]
-    dynamic_percentile = calculate_percentile(application.final_score or 0, all_scores)
+    dynamic_percentile = get_job_score_index(db, application.job_id).percentile(application.final_score or 0)
 
     # Build detailed response with all fields
     response_data = {
@@ -609,47 +607,115 @@ def get_application_details(
     return ApplicationDetailResponse(**response_data)
 
 
-@router.get("/job/{job_id}", response_model=List[ApplicationDetailResponse])
-def get_applications_for_job(
-    job_id: int,
-    current_user: User = Depends(get_current_recruiter),
+@router.get("/{application_id}/processing", response_model=ApplicationProcessingStatus)
+def get_application_processing_status(
+    application_id: int,
+    current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all applications for a specific job (recruiters only)."""
-    # Verify job exists and belongs to recruiter
-    job = db.query(JobPosting).filter(JobPosting.id == job_id).first()
+    """Get the background processing state of an application."""
+    application = db.query(Application).filter(
+        Application.id == application_id
+    ).first()
 
+    if not application:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
+        )
+
+    if current_user.role == "candidate":
+        # Candidates can only see their own applications
+        if application.candidate_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to view this application"
+            )
+    else:
+        # Recruiters can only see applications for their jobs
+        job = db.query(JobPosting).filter(JobPosting.id == application.job_id).first()
+        if not job or job.recruiter_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to view this application"
+            )
+
+    task = db.query(ProcessingTask).filter(
+        ProcessingTask.application_id == application.id
+    ).first()
+
+    return ApplicationProcessingStatus(
+        application_id=application.id,
+        processing_status=application.processing_status or "completed",
+        processing_error=application.processing_error,
+        attempts=task.attempts if task else 0,
+        queued_at=task.created_at if task else None,
+        updated_at=task.updated_at if task else None
+    )
+
+
+def _check_recruiter_job(job: Optional[JobPosting], recruiter: User) -> JobPosting:
+    """Check that a loaded job exists and belongs to the recruiter."""
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found"
         )
 
-    if job.recruiter_id != current_user.id:
+    if job.recruiter_id != recruiter.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to view applications for this job"
         )
 
-    # Get all applications
-    applications = db.query(Application).filter(
+    return job
+
+
+def _get_recruiter_job(db: Session, job_id: int, recruiter: User) -> JobPosting:
+    """Load a job, checking that it exists and belongs to the recruiter."""
+    return _check_recruiter_job(db.query(JobPosting).filter(JobPosting.id == job_id).first(), recruiter)
+
+
+def _candidates(candidate_ids) -> Select:
+    """Statement loading candidates by id (name and email only)."""
+    return select(User.id, User.full_name, User.email).where(User.id.in_(set(candidate_ids)))
+
+
+def _load_candidates(db: Session, candidate_ids) -> dict:
+    """Candidates by id, loaded in one query (name and email only)."""
+    return {candidate.id: candidate for candidate in db.execute(_candidates(candidate_ids))}
+
+
+async def _load_candidates_async(db: AsyncSession, candidate_ids) -> dict:
+    """_load_candidates on the async session."""
+    return {candidate.id: candidate for candidate in await db.execute(_candidates(candidate_ids))}
+
+
+def _job_applications(job_id: int) -> Select:
+    """Statement loading a job's applications, best first, with their resume text (one more query)."""
+    return select(Application).options(selectinload(Application.resume)).where(
         Application.job_id == job_id
-    ).order_by(Application.final_score.desc()).all()
+    ).order_by(Application.final_score.desc())
+
 
-    # Calculate dynamic percentiles
-    all_scores = [app.final_score for app in applications if app.final_score is not None]
+def _application_details(
+    job: JobPosting,
+    applications: List[Application],
+    job_scores: SortedScoreIndex,
+    candidates: dict
+) -> List[ApplicationDetailResponse]:
+    """Detailed responses for a job's applications, with dynamic percentiles."""
+    # Calculate dynamic percentiles (one bisect per application)
+    dynamic_percentiles = job_scores.percentiles(app.final_score or 0 for app in applications)
 
     # Build detailed responses
     results = []
-    for app in applications:
-        candidate = db.query(User).filter(User.id == app.candidate_id).first()
+    for app, dynamic_percentile in zip(applications, dynamic_percentiles):
+        candidate = candidates.get(app.candidate_id)
         if not candidate:
             # Skip applications with missing candidate data
             continue
 
-        # Calculate dynamic percentile for this application
-        dynamic_percentile = calculate_percentile(app.final_score or 0, all_scores)
-
         # Build response with all fields properly
         response_data = {
             **ApplicationResponse.model_validate(app).model_dump(),
@@ -666,18 +732,344 @@ def get_applications_for_job(
     return results
 
 
-@router.put("/{application_id}/status", response_model=ApplicationResponse)
-def update_application_status(
-    application_id: int,
-    status_update: ApplicationStatusUpdate,
+@router.get("/job/{job_id}", response_model=List[ApplicationDetailResponse])
+def get_applications_for_job(
+    job_id: int,
     current_user: User = Depends(get_current_recruiter),
     db: Session = Depends(get_db)
 ):
-    """Update application status (recruiters only)."""
-    application = db.query(Application).filter(
-        Application.id == application_id
-    ).first()
+    """
+    Get all applications for a specific job (recruiters only).
+
+    Large requisitions should use GET /job/{job_id}/page instead.
+    """
+    job = _get_recruiter_job(db, job_id, current_user)
+
+    applications = db.execute(_job_applications(job_id)).scalars().all()
+    job_scores = get_job_score_index(db, job_id)
+    candidates = _load_candidates(db, (app.candidate_id for app in applications))
+
+    return _application_details(job, applications, job_scores, candidates)
+
+
+@async_router.get("/job/{job_id}", response_model=List[ApplicationDetailResponse])
+async def get_applications_for_job_async(
+    job_id: int,
+    current_user: User = Depends(get_current_recruiter_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """get_applications_for_job on the async session."""
+    job = _check_recruiter_job(await db.get(JobPosting, job_id), current_user)
+
+    applications = (await db.execute(_job_applications(job_id))).scalars().all()
+    job_scores = await get_job_score_index_async(db, job_id)
+    candidates = await _load_candidates_async(db, (app.candidate_id for app in applications))
+
+    return _application_details(job, applications, job_scores, candidates)
+
+
+# Fields of a listing row that are read straight from the applications table
+_APPLICATION_COLUMNS = {column.name for column in Application.__table__.columns}
+_LISTING_FIELDS = set(ApplicationListItem.model_fields)
+# Returned when ?fields= is not given: everything but the resume text
+_DEFAULT_LISTING_FIELDS = _LISTING_FIELDS - {"resume_text"}
+
+
+def _encode_cursor(final_score, application_id: int) -> str:
+    """Opaque keyset cursor for the row after (final_score, id)."""
+    return base64.urlsafe_b64encode(json.dumps([final_score, application_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str):
+    """(final_score, id) of a cursor from _encode_cursor."""
+    try:
+        final_score, application_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if final_score is not None:
+            final_score = float(final_score)
+        return final_score, int(application_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def _listing_fields(fields: Optional[str]) -> set:
+    """Response fields requested with ?fields= (400 for unknown ones), plus id."""
+    requested = _DEFAULT_LISTING_FIELDS if fields is None else {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - _LISTING_FIELDS
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return requested | {"id"}
+
+
+def _skill_filter(skills: Optional[str]) -> Optional[List[int]]:
+    """Canonical ids of the comma-separated ?skills= names (400 for unknown ones)."""
+    if skills is None:
+        return None
+    skill_ids, unknown = resolve_skill_names(s.strip() for s in skills.split(",") if s.strip())
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown skills: {', '.join(unknown)}"
+        )
+    return skill_ids
+
+
+def _match_skill_query(bitmaps: SkillBitmapIndex, skill_query: str) -> List[int]:
+    """Ids of the applications matching ?skill_query= (400 for invalid queries)."""
+    try:
+        return bitmaps.match(skill_query).tolist()
+    except SkillQueryError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+def _application_page_query(
+    job_id: int,
+    requested: set,
+    job_scores: SortedScoreIndex,
+    limit: int,
+    cursor: Optional[str],
+    skill_ids: Optional[List[int]],
+    matched_ids: Optional[List[int]],
+    status_filter: Optional[str],
+    cluster_id: Optional[int],
+    meets_requirements: Optional[bool],
+    min_score: Optional[float],
+    max_score: Optional[float],
+    min_percentile: Optional[float],
+    max_percentile: Optional[float]
+) -> Optional[Select]:
+    """
+    Statement for one page of a job's applications (limit + 1 rows).
 
+    Returns:
+        The statement, or None when no score is in the percentile range or
+        no application matches the skill query
+    """
+    # Always read what ordering, percentiles and candidate lookups need
+    column_names = (requested & _APPLICATION_COLUMNS) | {"id", "final_score", "candidate_id"}
+    columns = [getattr(Application, name) for name in sorted(column_names)]
+    if "resume_text" in requested:
+        columns.append(ApplicationResume.resume_text)
+    statement = select(*columns).where(Application.job_id == job_id)
+    if "resume_text" in requested:
+        statement = statement.outerjoin(Application.resume)
+
+    if skill_ids:
+        # Resolved on the job/skill index of application_skills
+        statement = statement.where(Application.id.in_(applications_with_skills(job_id, skill_ids)))
+    if matched_ids is not None:
+        if not matched_ids:
+            return None
+        # Up to the whole pool: one JSON parameter instead of one per id
+        matched = func.json_each(json.dumps(matched_ids)).table_valued("value")
+        statement = statement.where(Application.id.in_(select(matched.c.value)))
+    if status_filter is not None:
+        statement = statement.where(Application.status == status_filter)
+    if cluster_id is not None:
+        statement = statement.where(Application.cluster_id == cluster_id)
+    if meets_requirements is not None:
+        statement = statement.where(Application.meets_requirements == meets_requirements)
+    if min_score is not None:
+        statement = statement.where(Application.final_score >= min_score)
+    if max_score is not None:
+        statement = statement.where(Application.final_score <= max_score)
+
+    if min_percentile is not None or max_percentile is not None:
+        min_p = min_percentile if min_percentile is not None else 0.0
+        max_p = max_percentile if max_percentile is not None else 100.0
+        bounds = job_scores.score_bounds(min_p, max_p)
+        if bounds is None:
+            return None
+
+        # Unscored applications rank like a score of 0
+        scored_filters = [Application.final_score.isnot(None)]
+        if bounds[0] is not None:
+            scored_filters.append(Application.final_score > bounds[0])
+        if bounds[1] is not None:
+            scored_filters.append(Application.final_score <= bounds[1])
+        if min_p <= job_scores.percentile(0) <= max_p:
+            statement = statement.where(or_(and_(*scored_filters), Application.final_score.is_(None)))
+        else:
+            statement = statement.where(*scored_filters)
+
+    if cursor is not None:
+        # Rows after the cursor in (final_score DESC, id DESC) order; SQLite
+        # sorts NULL scores last in descending order
+        after_score, after_id = _decode_cursor(cursor)
+        if after_score is None:
+            statement = statement.where(Application.final_score.is_(None), Application.id < after_id)
+        else:
+            statement = statement.where(or_(
+                Application.final_score < after_score,
+                and_(Application.final_score == after_score, Application.id < after_id),
+                Application.final_score.is_(None)
+            ))
+
+    return statement.order_by(Application.final_score.desc(), Application.id.desc()).limit(limit + 1)
+
+
+def _split_page(rows: list, limit: int):
+    """The first limit rows and the cursor of the next page (None on the last page)."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, _encode_cursor(rows[-1].final_score, rows[-1].id)
+
+
+def _application_page(
+    job: JobPosting,
+    rows: list,
+    next_cursor: Optional[str],
+    requested: set,
+    job_scores: SortedScoreIndex,
+    candidates: dict,
+    limit: int
+) -> ApplicationPage:
+    """Listing items with only the requested fields."""
+    percentiles = job_scores.percentiles(row.final_score or 0 for row in rows)
+
+    items = []
+    for row, dynamic_percentile in zip(rows, percentiles):
+        values = row._asdict()
+        candidate = candidates.get(row.candidate_id)
+        values.update({
+            "job_title": job.title,
+            "job_category": job.category,
+            "candidate_name": candidate.full_name if candidate else None,
+            "candidate_email": candidate.email if candidate else None,
+            "overall_percentile": dynamic_percentile,  # Override with dynamic value
+        })
+        item = ApplicationListItem.model_validate(values)
+        items.append(item.model_dump(include=requested))
+
+    return ApplicationPage(items=items, next_cursor=next_cursor, limit=limit)
+
+
+@router.get("/job/{job_id}/page", response_model=ApplicationPage)
+def get_application_page_for_job(
+    job_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    cluster_id: Optional[int] = None,
+    meets_requirements: Optional[bool] = None,
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    min_percentile: Optional[float] = None,
+    max_percentile: Optional[float] = None,
+    skills: Optional[str] = None,
+    skill_query: Optional[str] = None,
+    current_user: User = Depends(get_current_recruiter),
+    db: Session = Depends(get_db)
+):
+    """
+    One page of a job's applications, best scores first (recruiters only).
+
+    Keyset pagination on (final_score, id): pass next_cursor back as cursor
+    for the following page; unscored applications come last. fields is a
+    comma-separated list of response fields (default: all but resume_text);
+    only the needed columns are read and candidates are loaded in one query
+    per page. Percentile filters use the same dynamic per-job percentile
+    that is returned as overall_percentile. skills is a comma-separated list
+    of skills every returned applicant has (e.g. skills=Python,Docker);
+    skill_query is a boolean expression over skills, evaluated on the job's
+    skill bitmaps (e.g. Python AND (Docker OR Kubernetes) AND NOT PHP).
+    """
+    job = _get_recruiter_job(db, job_id, current_user)
+    requested = _listing_fields(fields)
+    skill_ids = _skill_filter(skills)
+    matched_ids = None
+    if skill_query is not None:
+        matched_ids = _match_skill_query(get_job_skill_bitmaps(db, job_id), skill_query)
+    job_scores = get_job_score_index(db, job_id)
+
+    statement = _application_page_query(
+        job_id, requested, job_scores, limit, cursor, skill_ids, matched_ids, status_filter, cluster_id,
+        meets_requirements, min_score, max_score, min_percentile, max_percentile
+    )
+    if statement is None:
+        return ApplicationPage(items=[], next_cursor=None, limit=limit)
+    rows, next_cursor = _split_page(db.execute(statement).all(), limit)
+
+    candidates = {}
+    if requested & {"candidate_name", "candidate_email"}:
+        candidates = _load_candidates(db, (row.candidate_id for row in rows))
+
+    return _application_page(job, rows, next_cursor, requested, job_scores, candidates, limit)
+
+
+@async_router.get("/job/{job_id}/page", response_model=ApplicationPage)
+async def get_application_page_for_job_async(
+    job_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    cluster_id: Optional[int] = None,
+    meets_requirements: Optional[bool] = None,
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    min_percentile: Optional[float] = None,
+    max_percentile: Optional[float] = None,
+    skills: Optional[str] = None,
+    skill_query: Optional[str] = None,
+    current_user: User = Depends(get_current_recruiter_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """get_application_page_for_job on the async session."""
+    job = _check_recruiter_job(await db.get(JobPosting, job_id), current_user)
+    requested = _listing_fields(fields)
+    skill_ids = _skill_filter(skills)
+    matched_ids = None
+    if skill_query is not None:
+        matched_ids = _match_skill_query(await get_job_skill_bitmaps_async(db, job_id), skill_query)
+    job_scores = await get_job_score_index_async(db, job_id)
+
+    statement = _application_page_query(
+        job_id, requested, job_scores, limit, cursor, skill_ids, matched_ids, status_filter, cluster_id,
+        meets_requirements, min_score, max_score, min_percentile, max_percentile
+    )
+    if statement is None:
+        return ApplicationPage(items=[], next_cursor=None, limit=limit)
+    rows, next_cursor = _split_page((await db.execute(statement)).all(), limit)
+
+    candidates = {}
+    if requested & {"candidate_name", "candidate_email"}:
+        candidates = await _load_candidates_async(db, (row.candidate_id for row in rows))
+
+    return _application_page(job, rows, next_cursor, requested, job_scores, candidates, limit)
+
+
+@router.get("/job/{job_id}/skills", response_model=List[JobSkillCount])
+def get_skill_counts_for_job(
+    job_id: int,
+    current_user: User = Depends(get_current_recruiter),
+    db: Session = Depends(get_db)
+):
+    """
+    How many of a job's applicants have each skill, most common first (recruiters only).
+
+    Counted on the application_skills index; job_requirement tells whether
+    the job requires or prefers the skill.
+    """
+    _get_recruiter_job(db, job_id, current_user)
+    return [
+        JobSkillCount(skill=row.name, category=row.category, applicants=row.applicants, job_requirement=row.kind)
+        for row in db.execute(job_skill_counts(job_id))
+    ]
+
+
+def _check_status_update(application: Optional[Application], job: Optional[JobPosting], recruiter: User):
+    """Check that the application exists and belongs to one of the recruiter's jobs."""
     if not application:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -685,23 +1077,60 @@ def update_application_status(
         )
 
     # Verify recruiter owns the job
-    job = db.query(JobPosting).filter(JobPosting.id == application.job_id).first()
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Associated job posting not found"
         )
 
-    if job.recruiter_id != current_user.id:
+    if job.recruiter_id != recruiter.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to update this application"
         )
 
+
+@router.put("/{application_id}/status", response_model=ApplicationResponse)
+def update_application_status(
+    application_id: int,
+    status_update: ApplicationStatusUpdate,
+    current_user: User = Depends(get_current_recruiter),
+    db: Session = Depends(get_db)
+):
+    """Update application status (recruiters only)."""
+    application = db.query(Application).filter(
+        Application.id == application_id
+    ).first()
+    job = db.query(JobPosting).filter(JobPosting.id == application.job_id).first() if application else None
+    _check_status_update(application, job, current_user)
+
     # Update status
     application.status = status_update.status
     db.commit()
     db.refresh(application)
+    # The score doesn't move, but re-record it so an index that missed the
+    # application (scored by a queue worker in another process) picks it up
+    record_application(application)
+
+    return ApplicationResponse.model_validate(application)
+
+
+@async_router.put("/{application_id}/status", response_model=ApplicationResponse)
+async def update_application_status_async(
+    application_id: int,
+    status_update: ApplicationStatusUpdate,
+    current_user: User = Depends(get_current_recruiter_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """update_application_status on the async session."""
+    application = await db.get(Application, application_id)
+    job = await db.get(JobPosting, application.job_id) if application else None
+    _check_status_update(application, job, current_user)
+
+    application.status = status_update.status
+    await db.commit()
+    # The session doesn't expire on commit, so application holds what was written
+    record_application(application)
 
     return ApplicationResponse.model_validate(application)
 
@@ -737,6 +1166,7 @@ def generate_random_applications(
         )
 
     created_applications = []
+    profile = get_job_profile(job)
 
     try:
         for i in range(count):
@@ -746,35 +1176,8 @@ def generate_random_applications(
             # Process resume with ML
             processed_data = process_resume(resume_text)
 
-            # Parse job requirements
-            required_skills = json.loads(job.required_skills) if job.required_skills else []
-            preferred_skills = json.loads(job.preferred_skills) if job.preferred_skills else []
-
-            # Parse requirements JSON for hard filters
-            requirements_data = {}
-            if job.requirements:
-                try:
-                    requirements_data = json.loads(job.requirements)
-                except json.JSONDecodeError:
-                    requirements_data = {}
-
-            job_min_education = requirements_data.get('min_education', 'none')
-            job_certifications_required = requirements_data.get('certifications_required', False)
-            job_leadership_required = requirements_data.get('leadership_required', False)
-
-            # Calculate scores using job-specific requirements
-            weights = {
-                'skills': job.weight_skills or 0.4,
-                'experience': job.weight_experience or 0.3,
-                'education': job.weight_education or 0.2,
-                'certification': job.weight_certifications or 0.05,
-                'leadership': job.weight_leadership or 0.05
-            }
-
-            # Normalize skills for consistent matching (use module-level function)
+            # Normalize candidate skills for consistent matching (use module-level function)
             candidate_skills_normalized = [normalize_skill(s) for s in processed_data['extracted_skills']]
-            required_skills_normalized = [normalize_skill(s) for s in required_skills]
-            preferred_skills_normalized = [normalize_skill(s) for s in preferred_skills]
 
             # TWO-STAGE SCORING: Requirements check → Ranking
             scores = calculate_final_score(
@@ -785,25 +1188,14 @@ def generate_random_applications(
                 candidate_has_certifications=processed_data['has_certifications'],
                 candidate_has_leadership=processed_data['has_leadership'],
                 candidate_skill_diversity=processed_data['skill_diversity'],
-                # Job requirements (hard filters)
-                job_required_skills=required_skills_normalized,
-                job_preferred_skills=preferred_skills_normalized,
-                job_min_experience=job.min_experience or 0,
-                job_min_education=job_min_education,
-                job_certifications_required=job_certifications_required,
-                job_leadership_required=job_leadership_required,
-                # Weights for ranking
-                weights=weights
+                # Job requirements (normalized the same way) and weights for ranking
+                **profile.scoring_kwargs(normalized=True)
             )
 
-            # Get all scores for percentile calculation
-            all_scores = [app.final_score for app in db.query(Application.final_score).filter(
-                Application.job_id == job_id,
-                Application.final_score.isnot(None)
-            ).all()]
-            all_scores.append(scores['final_score'])
-
-            overall_percentile = calculate_percentile(scores['final_score'], all_scores)
+            # Add the scores to the job's distribution, then rank against it
+            applied_at = datetime.utcnow()
+            record_score_change(db, job.id, job.category, None, scores, application_day(applied_at))
+            overall_percentile = store_percentile(db, "job", str(job_id), "final_score", scores['final_score'])
 
             # Assign cluster
             cluster_info = assign_cluster(
@@ -815,8 +1207,8 @@ def generate_random_applications(
             # Analyze skill gap (using normalized skills)
             gap_analysis = analyze_skill_gap(
                 candidate_skills=candidate_skills_normalized,
-                required_skills=required_skills_normalized,
-                preferred_skills=preferred_skills_normalized
+                required_skills=list(profile.required_skills_normalized),
+                preferred_skills=list(profile.preferred_skills_normalized)
             )
 
             # Create application (use recruiter as fake candidate for testing)
@@ -824,9 +1216,11 @@ def generate_random_applications(
                 job_id=job_id,
                 candidate_id=current_user.id,  # Using recruiter ID for test data
                 resume_file_path=f"test_resume_{job_id}_{i+1}.txt",
+                is_generated=True,
                 resume_text=resume_text,
                 # ML fields
                 extracted_skills=json.dumps(processed_data['extracted_skills']),
+                **application_skill_fields(job_id, processed_data['extracted_skills']),
                 num_skills=processed_data['num_skills'],
                 skill_diversity=processed_data.get('skill_diversity', 0.0),
                 experience_years=processed_data.get('experience_years', 0.0),
@@ -854,13 +1248,19 @@ def generate_random_applications(
                 skill_match_percentage=gap_analysis['overall_match_percentage'],
                 recommendations=json.dumps(gap_analysis['recommendations']),
                 # Status
-                status='pending'
+                status='pending',
+                applied_at=applied_at,
+                scoring_version=job.scoring_version or 1
             )
 
             db.add(new_application)
             created_applications.append(new_application)
 
         db.commit()
+        record_application_scores(job_id, {
+            app.id: app.final_score for app in created_applications
+        })
+        invalidate_skill_bitmaps(job_id)
 
         return {
             "success": True,
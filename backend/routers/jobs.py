@@ -1,19 +1,88 @@
 """Job postings router for recruiters."""
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Select, func, select
 from typing import List
 import json
 
-from database import get_db
+from database import get_db, get_async_db
 from models import User, JobPosting, Application
 from schemas import (
     JobPostingCreate, JobPostingResponse, JobPostingUpdate
 )
-from auth import get_current_user, get_current_recruiter
+from auth import get_current_user, get_current_user_async, get_current_recruiter
+from ml_integration.job_profile import invalidate_job_profile, job_profile_source
+from rescoring import rescore_job_in_background
+from score_index import invalidate_score_indexes
+from skill_bitmap import invalidate_skill_bitmaps
+from skill_index import job_skill_links
+from percentile_store import move_job_distribution
 
 router = APIRouter(prefix="/api/jobs", tags=["Jobs"])
 
+# Async (AsyncSession) versions of the hot read endpoints; main.py includes
+# this router ahead of router when ASYNC_DB_ENDPOINTS is on
+async_router = APIRouter(prefix="/api/jobs", tags=["Jobs"])
+
+
+def _with_application_counts(statement: Select) -> Select:
+    """
+    Extend a select(JobPosting) with each job's application count and recruiter.
+
+    One grouped aggregate (outer-joined) and a joined recruiter load replace
+    a COUNT and a User lookup per job; rows are (job, application_count).
+    """
+    counts = select(
+        Application.job_id,
+        func.count(Application.id).label("application_count")
+    ).group_by(Application.job_id).subquery()
+
+    return statement.outerjoin(
+        counts, counts.c.job_id == JobPosting.id
+    ).options(
+        joinedload(JobPosting.recruiter)
+    ).add_columns(
+        func.coalesce(counts.c.application_count, 0)
+    )
+
+
+def _job_response(job: JobPosting, application_count: int) -> JobPostingResponse:
+    """Response for a job, with its application count and recruiter company info."""
+    job_response = JobPostingResponse.model_validate(job)
+    job_response.application_count = application_count
+
+    # Add company info from recruiter
+    if job.recruiter:
+        job_response.company_name = job.recruiter.company_name
+        job_response.company_logo = job.recruiter.company_logo
+
+    return job_response
+
+
+def _get_job_response(db: Session, job_id: int) -> JobPostingResponse:
+    """Load one job with its application count and recruiter in a single query."""
+    job, application_count = db.execute(_with_application_counts(
+        select(JobPosting).where(JobPosting.id == job_id)
+    )).one()
+    return _job_response(job, application_count)
+
+
+def _job_listing(current_user: User, status_filter: str) -> Select:
+    """Statement for the job list of a user: (job, application_count) rows, newest first."""
+    statement = select(JobPosting)
+
+    if current_user.role == "recruiter":
+        # Recruiters see their own jobs
+        statement = statement.where(JobPosting.recruiter_id == current_user.id)
+        if status_filter:
+            statement = statement.where(JobPosting.status == status_filter)
+    else:
+        # Candidates see all active jobs
+        statement = statement.where(JobPosting.status == "active")
+
+    return _with_application_counts(statement).order_by(JobPosting.created_at.desc())
+
 
 @router.post("", response_model=JobPostingResponse, status_code=status.HTTP_201_CREATED)
 def create_job_posting(
@@ -45,6 +114,7 @@ def create_job_posting(
         category=job_data.category,
         required_skills=json.dumps(job_data.required_skills),
         preferred_skills=json.dumps(job_data.preferred_skills),
+        skill_links=job_skill_links(job_data.required_skills, job_data.preferred_skills),
         min_experience=job_data.min_experience,
         education_level=job_data.education_level,
         requirements=job_data.requirements,  # Store requirements JSON
@@ -76,36 +146,21 @@ def get_jobs(
     - Recruiters: Get their own job postings
     - Candidates: Get all active job postings
     """
-    query = db.query(JobPosting)
+    rows = db.execute(_job_listing(current_user, status_filter)).all()
 
-    if current_user.role == "recruiter":
-        # Recruiters see their own jobs
-        query = query.filter(JobPosting.recruiter_id == current_user.id)
-        if status_filter:
-            query = query.filter(JobPosting.status == status_filter)
-    else:
-        # Candidates see all active jobs
-        query = query.filter(JobPosting.status == "active")
-
-    jobs = query.order_by(JobPosting.created_at.desc()).all()
+    return [_job_response(job, application_count) for job, application_count in rows]
 
-    # Add application counts and company info
-    result = []
-    for job in jobs:
-        job_response = JobPostingResponse.model_validate(job)
-        job_response.application_count = db.query(Application).filter(
-            Application.job_id == job.id
-        ).count()
 
-        # Add company info from recruiter
-        recruiter = db.query(User).filter(User.id == job.recruiter_id).first()
-        if recruiter:
-            job_response.company_name = recruiter.company_name
-            job_response.company_logo = recruiter.company_logo
-
-        result.append(job_response)
+@async_router.get("", response_model=List[JobPostingResponse])
+async def get_jobs_async(
+    status_filter: str = "active",
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """get_jobs on the async session."""
+    rows = (await db.execute(_job_listing(current_user, status_filter))).all()
 
-    return result
+    return [_job_response(job, application_count) for job, application_count in rows]
 
 
 @router.get("/{job_id}", response_model=JobPostingResponse)
@@ -115,13 +170,16 @@ def get_job_by_id(
     db: Session = Depends(get_db)
 ):
     """Get a specific job posting by ID."""
-    job = db.query(JobPosting).filter(JobPosting.id == job_id).first()
+    row = db.execute(_with_application_counts(
+        select(JobPosting).where(JobPosting.id == job_id)
+    )).first()
 
-    if not job:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found"
         )
+    job, application_count = row
 
     # Recruiters can only see their own jobs (unless it's active)
     if current_user.role == "recruiter" and job.recruiter_id != current_user.id:
@@ -131,22 +189,23 @@ def get_job_by_id(
                 detail="You don't have permission to view this job"
             )
 
-    job_response = JobPostingResponse.model_validate(job)
-    job_response.application_count = db.query(Application).filter(
-        Application.job_id == job.id
-    ).count()
-
-    return job_response
+    return _job_response(job, application_count)
 
 
 @router.put("/{job_id}", response_model=JobPostingResponse)
 def update_job_posting(
     job_id: int,
     job_update: JobPostingUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_recruiter),
     db: Session = Depends(get_db)
 ):
-    """Update a job posting (recruiters only)."""
+    """
+    Update a job posting (recruiters only).
+
+    If requirements or weights change, the job's scoring_version is bumped
+    and its applications are re-scored in the background.
+    """
     job = db.query(JobPosting).filter(JobPosting.id == job_id).first()
 
     if not job:
@@ -162,6 +221,9 @@ def update_job_posting(
             detail="You don't have permission to update this job"
         )
 
+    scoring_source_before = job_profile_source(job)
+    category_before = job.category
+
     # Update fields
     update_data = job_update.model_dump(exclude_unset=True)
 
@@ -171,6 +233,9 @@ def update_job_posting(
         else:
             setattr(job, field, value)
 
+    if {'required_skills', 'preferred_skills'} & update_data.keys():
+        job.skill_links = job_skill_links(job.required_skills, job.preferred_skills)
+
     # Validate weights if any were updated
     if any(key.startswith('weight_') for key in update_data.keys()):
         total_weight = (
@@ -186,15 +251,24 @@ def update_job_posting(
                 detail=f"Weights must sum to 1.0 (currently {total_weight})"
             )
 
+    scoring_changed = job_profile_source(job) != scoring_source_before
+    if scoring_changed:
+        job.scoring_version = (job.scoring_version or 1) + 1
+
+    if job.category != category_before:
+        move_job_distribution(db, job.id, category_before, job.category)
+
     db.commit()
-    db.refresh(job)
 
-    job_response = JobPostingResponse.model_validate(job)
-    job_response.application_count = db.query(Application).filter(
-        Application.job_id == job.id
-    ).count()
+    # Scoring paths recompile the job's requirements/weights on next use
+    invalidate_job_profile(job_id)
 
-    return job_response
+    if scoring_changed:
+        # Existing applications were scored against the old version
+        background_tasks.add_task(rescore_job_in_background, job_id)
+
+    # Reloads the committed job together with its count and recruiter
+    return _get_job_response(db, job_id)
 
 
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -221,5 +295,8 @@ def delete_job_posting(
 
     db.delete(job)
     db.commit()
+    invalidate_job_profile(job_id)
+    invalidate_score_indexes(job_id)
+    invalidate_skill_bitmaps(job_id)
 
     return None
@@ -2,20 +2,25 @@
 Resume analysis and job recommendations router
 """
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import List, Dict, Any
-import json
+import os
 import re
-import PyPDF2
-import io
+import tempfile
+import uuid
+from pathlib import Path
 
 from database import get_db
 from auth import get_current_user
 from models import User, JobPosting, Application
 from ml_integration.scoring import check_requirements, calculate_final_score
-from ml_integration.extract_skills import process_resume
+from ml_integration.job_profile import get_job_profile
+from ml_executor import process_resume_on_executor
+from extraction_pool import ExtractionError, extract_resume_file
+from upload_streaming import stream_upload_to_file
 
 router = APIRouter()
 
@@ -51,21 +56,22 @@ async def analyze_resume(
     if not resume_file.filename.endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
 
-    # Read file
-    contents = await resume_file.read()
+    # Stream to a temporary file (type sniffed, size enforced as it arrives)
+    file_path = Path(tempfile.gettempdir()) / f"analyze_{uuid.uuid4().hex}.pdf"
+    await stream_upload_to_file(resume_file, file_path)
 
-    # Extract text from PDF bytes
+    # Parse in a supervised worker (killed if it exceeds its CPU/memory limits)
     try:
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(contents))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        text = text.strip()
+        text = await run_in_threadpool(extract_resume_file, file_path)
+    except ExtractionError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.to_detail())
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to parse PDF: {str(e)}")
+    finally:
+        os.remove(file_path)
 
-    # Use the same process_resume function as the application flow
-    processed = process_resume(text)
+    # Use the same (memoized) process_resume as the application flow
+    processed = await process_resume_on_executor(text)
 
     # Convert to ResumeAnalysis format
     analysis = ResumeAnalysis(
@@ -80,13 +86,16 @@ async def analyze_resume(
 
 
 @router.post("/jobs", response_model=List[JobRecommendation])
-async def get_job_recommendations(
+def get_job_recommendations(
     analysis: ResumeAnalysis,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     Get job recommendations based on resume analysis
+
+    Declared sync so FastAPI runs the DB queries and scoring loop on the
+    threadpool rather than the event loop.
     """
     # Get all active jobs
     jobs = db.query(JobPosting).filter(JobPosting.status == "active").all()
@@ -96,52 +105,33 @@ async def get_job_recommendations(
 
     recommendations = []
 
+    # Candidate side is the same for every job
+    candidate_skills_lower = [s.lower() for s in analysis.skills]
+    candidate_skill_set = set(candidate_skills_lower)
+
     for job in jobs:
-        # Parse JSON fields from job - convert Column types to strings
-        try:
-            required_skills_str: str = str(job.required_skills) if job.required_skills else "[]"
-            required_skills = json.loads(required_skills_str)
-        except (json.JSONDecodeError, TypeError):
-            required_skills = []
-
-        try:
-            preferred_skills_str: str = str(job.preferred_skills) if job.preferred_skills else "[]"
-            preferred_skills = json.loads(preferred_skills_str)
-        except (json.JSONDecodeError, TypeError):
-            preferred_skills = []
-
-        try:
-            requirements_str: str = str(job.requirements) if job.requirements else "{}"
-            requirements = json.loads(requirements_str)
-        except (json.JSONDecodeError, TypeError):
-            requirements = {}
-
-        # Get job requirements from requirements field
-        job_min_education = requirements.get('min_education', 'none')
-        job_certs_required = requirements.get('certifications_required', False)
-        job_leadership_required = requirements.get('leadership_required', False)
+        # Parsed, lower-cased job requirements (compiled once per job and cached)
+        profile = get_job_profile(job)
+        required_skills = profile.required_skills
+        preferred_skills = profile.preferred_skills
 
         # Calculate skills match percentage using simple lowercase comparison (same as application flow)
-        candidate_skills_lower = [s.lower() for s in analysis.skills]
-        required_skills_lower = [s.lower() for s in required_skills]
-        preferred_skills_lower = [s.lower() for s in preferred_skills]
-
         total_skills = len(required_skills) + len(preferred_skills)
         if total_skills > 0:
-            matched_required = len([s for s in required_skills_lower if s in candidate_skills_lower])
-            matched_preferred = len([s for s in preferred_skills_lower if s in candidate_skills_lower])
+            matched_required = len([s for s in profile.required_skills_lower if s in candidate_skill_set])
+            matched_preferred = len([s for s in profile.preferred_skills_lower if s in candidate_skill_set])
             skills_match_pct = ((matched_required + matched_preferred) / total_skills) * 100
         else:
             skills_match_pct = 0
 
         # Find missing skills (return original casing for display)
         missing_required = [
-            required_skills[i] for i, s in enumerate(required_skills_lower)
-            if s not in candidate_skills_lower
+            required_skills[i] for i, s in enumerate(profile.required_skills_lower)
+            if s not in candidate_skill_set
         ]
         missing_preferred = [
-            preferred_skills[i] for i, s in enumerate(preferred_skills_lower)
-            if s not in candidate_skills_lower
+            preferred_skills[i] for i, s in enumerate(profile.preferred_skills_lower)
+            if s not in candidate_skill_set
         ]
 
         # Check if meets requirements using actual scoring function
@@ -151,11 +141,11 @@ async def get_job_recommendations(
             candidate_education=analysis.education_level,
             candidate_has_certifications=analysis.has_certifications,
             candidate_has_leadership=analysis.has_leadership,
-            job_required_skills=required_skills,
-            job_min_experience=job.min_experience or 0,
-            job_min_education=job_min_education,
-            job_certifications_required=job_certs_required,
-            job_leadership_required=job_leadership_required
+            job_required_skills=list(required_skills),
+            job_min_experience=profile.min_experience,
+            job_min_education=profile.min_education,
+            job_certifications_required=profile.certifications_required,
+            job_leadership_required=profile.leadership_required
         )
 
         # Calculate predicted score using actual scoring function
@@ -166,12 +156,12 @@ async def get_job_recommendations(
             candidate_has_certifications=analysis.has_certifications,
             candidate_has_leadership=analysis.has_leadership,
             candidate_skill_diversity=0.5,  # Default diversity score
-            job_required_skills=required_skills,
-            job_preferred_skills=preferred_skills,
-            job_min_experience=job.min_experience or 0,
-            job_min_education=job_min_education,
-            job_certifications_required=job_certs_required,
-            job_leadership_required=job_leadership_required,
+            job_required_skills=list(required_skills),
+            job_preferred_skills=list(preferred_skills),
+            job_min_experience=profile.min_experience,
+            job_min_education=profile.min_education,
+            job_certifications_required=profile.certifications_required,
+            job_leadership_required=profile.leadership_required,
         )
 
         potential_score = score_result['final_score']
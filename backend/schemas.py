@@ -1,6 +1,6 @@
 """Pydantic schemas for request/response validation."""
 from pydantic import BaseModel, EmailStr, Field, field_validator
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 import json
 
@@ -89,6 +89,7 @@ class JobPostingResponse(JobPostingBase):
     weight_education: float
     weight_certifications: float
     weight_leadership: float
+    scoring_version: Optional[int] = 1
     created_at: datetime
     application_count: int = 0
 
@@ -176,6 +177,13 @@ class ApplicationResponse(BaseModel):
     status: str
     applied_at: datetime
 
+    # Background processing state ('processing', 'completed' or 'failed')
+    processing_status: Optional[str] = "completed"
+    processing_error: Optional[str] = None
+
+    # Job scoring version the scores were computed against (stale if lower than the job's)
+    scoring_version: Optional[int] = None
+
     @field_validator('extracted_skills', 'matched_skills', 'missing_skills', 'recommendations', 'missing_requirements',
                       'matched_required_skills', 'matched_preferred_skills', 'missing_required_skills', 'missing_preferred_skills', mode='before')
     @classmethod
@@ -215,6 +223,42 @@ class ApplicationDetailResponse(ApplicationResponse):
     resume_text: str
 
 
+class ApplicationListItem(ApplicationDetailResponse):
+    """One row of a paginated applicant listing; only the requested fields are returned."""
+    job_id: Optional[int] = None
+    candidate_id: Optional[int] = None
+    resume_file_path: Optional[str] = None
+    status: Optional[str] = None
+    applied_at: Optional[datetime] = None
+    candidate_name: Optional[str] = None
+    candidate_email: Optional[str] = None
+    job_title: Optional[str] = None
+    job_category: Optional[str] = None
+    resume_text: Optional[str] = None
+
+
+class ApplicationPage(BaseModel):
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
+    limit: int
+
+
+class JobSkillCount(BaseModel):
+    skill: str
+    category: str
+    applicants: int  # Applicants of the job whose resume lists the skill
+    job_requirement: Optional[str] = None  # 'required', 'preferred' or None
+
+
+class ApplicationProcessingStatus(BaseModel):
+    application_id: int
+    processing_status: str
+    processing_error: Optional[str] = None
+    attempts: int = 0
+    queued_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
 class ApplicationStatusUpdate(BaseModel):
     status: str = Field(..., pattern="^(pending|reviewed|shortlisted|rejected)$")
 
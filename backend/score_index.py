@@ -0,0 +1,235 @@
+"""Sorted final-score indexes for percentile lookups.
+
+calculate_percentile scans a Python list of every comparable score, and the
+routers rebuilt that list from the applications table for every row they
+returned. SortedScoreIndex keeps the final scores of one job in a sorted
+list, so a percentile is a bisect: O(log n) per score, and a whole page of
+scores is ranked against the same snapshot.
+
+Indexes are built lazily from the database, kept per process and updated in
+place when this process inserts, re-scores or changes an application.
+Entries older than SCORE_INDEX_TTL_SECONDS are rebuilt, which bounds how long
+changes made by other processes (queue workers, scripts) go unseen.
+
+There is no per-category index. category_percentile is only ranked when an
+application is scored or re-scored, and those writes go through
+percentile_store's "category" histograms (which also cover scoring windows).
+Reads return the stored column, so an in-memory category index would only be
+kept up to date, never queried.
+"""
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from models import Application
+
+# Score index configuration - load from environment variables
+SCORE_INDEX_TTL_SECONDS = float(os.getenv("SCORE_INDEX_TTL_SECONDS", "300"))
+
+# Above this fraction of changed entries, re-sorting beats one insort per change
+_REBUILD_FRACTION = 0.125
+
+
+class _PositionPercentiles:
+    """
+    percentile() for k = 0..size pool scores below, as a lazy sequence.
+
+    bisect's key= argument needs Python 3.10; bisecting this sequence works
+    on 3.9 and still only evaluates O(log n) positions.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size + 1
+
+    def __getitem__(self, k: int) -> float:
+        return round(k / self.size * 100, 2)
+
+
+class SortedScoreIndex:
+    """Final scores of a pool of applications, kept sorted for bisect lookups."""
+
+    def __init__(self, scores_by_id: Dict[int, float]):
+        self._scores_by_id = dict(scores_by_id)
+        self._sorted = sorted(self._scores_by_id.values())
+        self.built_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def percentile(self, score: float, include_score: bool = False) -> float:
+        """
+        Same result as calculate_percentile(score, pool).
+
+        Args:
+            score: Score to rank
+            include_score: Rank as if score were already part of the pool
+                (for an application that is about to be inserted)
+
+        Returns:
+            Percentile (0-100), 50.0 for an empty pool
+        """
+        size = len(self._sorted) + (1 if include_score else 0)
+        if size == 0:
+            return 50.0
+        # Pool scores strictly below this one
+        below_count = bisect_left(self._sorted, score)
+        return round(below_count / size * 100, 2)
+
+    def percentiles(self, scores: Iterable[float], include_score: bool = False) -> List[float]:
+        """percentile() for many scores against the same pool."""
+        return [self.percentile(score, include_score) for score in scores]
+
+    def score_bounds(self, min_percentile: float, max_percentile: float) -> Optional[Tuple[Optional[float], Optional[float]]]:
+        """
+        Score range whose percentile() lies within [min_percentile, max_percentile].
+
+        percentile() only grows with the score, so a percentile range maps
+        to a score range, found with two bisects over pool positions.
+
+        Returns:
+            (exclusive lower bound, inclusive upper bound), either None when
+            unbounded, or None when no score has a percentile in the range
+        """
+        size = len(self._sorted)
+        if size == 0:
+            return (None, None) if min_percentile <= 50.0 <= max_percentile else None
+
+        positions = _PositionPercentiles(size)
+        # Smallest / largest count of pool scores below that is inside the range
+        min_below = bisect_left(positions, min_percentile)
+        max_below = bisect_right(positions, max_percentile) - 1
+        if min_below > max_below:
+            return None
+
+        lower = self._sorted[min_below - 1] if min_below > 0 else None
+        upper = self._sorted[max_below] if max_below < size else None
+        return lower, upper
+
+    def update(self, scores_by_id: Dict[int, Optional[float]]):
+        """
+        Insert, move or (with a None score) remove applications.
+
+        Args:
+            scores_by_id: Application id -> new final score
+        """
+        if len(scores_by_id) > max(16, len(self._sorted) * _REBUILD_FRACTION):
+            for application_id, score in scores_by_id.items():
+                if score is None:
+                    self._scores_by_id.pop(application_id, None)
+                else:
+                    self._scores_by_id[application_id] = score
+            self._sorted = sorted(self._scores_by_id.values())
+            return
+
+        for application_id, score in scores_by_id.items():
+            old_score = self._scores_by_id.pop(application_id, None)
+            if old_score is not None:
+                del self._sorted[bisect_left(self._sorted, old_score)]
+            if score is not None:
+                self._scores_by_id[application_id] = score
+                insort(self._sorted, score)
+
+
+_indexes: Dict[Tuple[str, object], SortedScoreIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _cached_index(key: Tuple[str, object]) -> Optional[SortedScoreIndex]:
+    """Loaded index for key, unless missing or expired."""
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None and time.monotonic() - index.built_at < SCORE_INDEX_TTL_SECONDS:
+            return index
+    return None
+
+
+def _store_index(key: Tuple[str, object], rows) -> SortedScoreIndex:
+    """Build an index from (application id, score) rows and cache it."""
+    index = SortedScoreIndex(dict(rows))
+    with _indexes_lock:
+        _indexes[key] = index
+    return index
+
+
+def _get_index(key: Tuple[str, object], load) -> SortedScoreIndex:
+    """Cached index for key, (re)built with load() when missing or expired."""
+    index = _cached_index(key)
+    if index is not None:
+        return index
+    return _store_index(key, load())
+
+
+def _job_scores(job_id: int):
+    """Statement selecting (application id, final score) of a job's scored applications."""
+    return select(Application.id, Application.final_score).where(
+        Application.job_id == job_id,
+        Application.final_score.isnot(None)
+    )
+
+
+def get_job_score_index(db: Session, job_id: int) -> SortedScoreIndex:
+    """
+    Index of the final scores of a job's applications.
+
+    Args:
+        db: Database session (used only when the index is (re)built)
+        job_id: Job whose applications form the pool
+
+    Returns:
+        SortedScoreIndex over every non-null final_score of the job
+    """
+    return _get_index(("job", job_id), lambda: db.execute(_job_scores(job_id)).all())
+
+
+async def get_job_score_index_async(db: AsyncSession, job_id: int) -> SortedScoreIndex:
+    """get_job_score_index for async endpoints (same cache)."""
+    key = ("job", job_id)
+    index = _cached_index(key)
+    if index is not None:
+        return index
+    return _store_index(key, (await db.execute(_job_scores(job_id))).all())
+
+
+def record_application_scores(job_id: int, scores_by_id: Dict[int, Optional[float]]):
+    """
+    Apply new or changed final scores to the loaded job index.
+
+    Call after the change is committed. An index that isn't loaded is left
+    alone; it reads the committed scores when first used.
+
+    Args:
+        job_id: Job the applications belong to
+        scores_by_id: Application id -> final score (None removes it)
+    """
+    if not scores_by_id:
+        return
+    with _indexes_lock:
+        index = _indexes.get(("job", job_id))
+        if index is not None:
+            index.update(scores_by_id)
+
+
+def record_application(application: Application):
+    """record_application_scores for a single committed application."""
+    record_application_scores(application.job_id, {application.id: application.final_score})
+
+
+def invalidate_score_indexes(job_id: int):
+    """Drop the index of a job (rebuilt on next use)."""
+    with _indexes_lock:
+        _indexes.pop(("job", job_id), None)
+
+
+def clear_score_indexes():
+    """Drop every loaded index."""
+    with _indexes_lock:
+        _indexes.clear()
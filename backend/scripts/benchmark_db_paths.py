@@ -0,0 +1,187 @@
+"""Benchmark the sync (threadpool + Session) and async (aiosqlite) endpoint paths.
+
+Seeds a temporary database, then drives the job listing, applicant page,
+/my and status-update endpoints through an in-process ASGI client with a
+number of concurrent clients, once against the sync routers and once with
+the async routers in front. Reports throughput and latency percentiles.
+
+    python scripts/benchmark_db_paths.py --clients 50 --requests 40
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from auth import create_access_token
+from database import Base, create_async_db_engine, create_db_engine, get_async_db, get_db
+from models import User, JobPosting, Application, ApplicationResume
+from routers import applications, jobs
+from score_index import clear_score_indexes
+
+NUM_RECRUITERS = 10
+NUM_CANDIDATES = 500
+JOBS_PER_RECRUITER = 5
+APPLICATIONS_PER_JOB = 400
+
+
+def seed(url):
+    """Recruiters with jobs, candidates with applications spread over those jobs."""
+    engine = create_db_engine(url)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    rng = random.Random(0)
+
+    db.bulk_insert_mappings(User, [{
+        "id": user_id, "email": f"u{user_id}@example.com", "password_hash": "x", "full_name": f"User {user_id}",
+        "role": "recruiter" if user_id <= NUM_RECRUITERS else "candidate", "company_name": "Acme"
+    } for user_id in range(1, NUM_RECRUITERS + NUM_CANDIDATES + 1)])
+    num_jobs = NUM_RECRUITERS * JOBS_PER_RECRUITER
+    db.bulk_insert_mappings(JobPosting, [{
+        "id": job_id, "recruiter_id": (job_id - 1) // JOBS_PER_RECRUITER + 1, "title": f"Job {job_id}",
+        "description": "d", "category": "backend", "required_skills": json.dumps(["Python"]),
+        "preferred_skills": json.dumps([]), "min_experience": 0, "status": "active"
+    } for job_id in range(1, num_jobs + 1)])
+    db.bulk_insert_mappings(Application, [{
+        "job_id": job_id, "candidate_id": rng.randint(NUM_RECRUITERS + 1, NUM_RECRUITERS + NUM_CANDIDATES),
+        "resume_file_path": "r.pdf", "final_score": round(rng.uniform(0, 100), 2),
+        "extracted_skills": json.dumps(["Python", "SQL"]), "status": "pending"
+    } for job_id in range(1, num_jobs + 1) for _ in range(APPLICATIONS_PER_JOB)])
+    num_applications = num_jobs * APPLICATIONS_PER_JOB
+    db.bulk_insert_mappings(ApplicationResume, [
+        {"application_id": application_id, "resume_text": "resume text " * 300}
+        for application_id in range(1, num_applications + 1)
+    ])
+    db.commit()
+    db.close()
+    return engine
+
+
+def build_app(use_async: bool, engine, async_engine) -> FastAPI:
+    """App with the job and application routers, bound to the benchmark database."""
+    app = FastAPI()
+    if use_async:
+        app.include_router(jobs.async_router)
+        app.include_router(applications.async_router)
+    app.include_router(jobs.router)
+    app.include_router(applications.router)
+
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    AsyncSession = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return app
+
+
+def request_mix(rng):
+    """One request of the workload: (method, path, params, json, user id)."""
+    recruiter_id = rng.randint(1, NUM_RECRUITERS)
+    job_id = (recruiter_id - 1) * JOBS_PER_RECRUITER + rng.randint(1, JOBS_PER_RECRUITER)
+    kind = rng.random()
+    if kind < 0.3:
+        return "GET", "/api/jobs", None, None, rng.randint(NUM_RECRUITERS + 1, NUM_RECRUITERS + NUM_CANDIDATES)
+    if kind < 0.6:
+        return "GET", f"/api/applications/job/{job_id}/page", {"limit": 50}, None, recruiter_id
+    if kind < 0.9:
+        return "GET", "/api/applications/my", None, None, rng.randint(NUM_RECRUITERS + 1, NUM_RECRUITERS + NUM_CANDIDATES)
+    application_id = (job_id - 1) * APPLICATIONS_PER_JOB + rng.randint(1, APPLICATIONS_PER_JOB)
+    status = rng.choice(["reviewed", "shortlisted"])
+    return "PUT", f"/api/applications/{application_id}/status", None, {"status": status}, recruiter_id
+
+
+async def run_clients(app: FastAPI, clients: int, requests_per_client: int, tokens: dict):
+    """Drive the app with concurrent clients; returns (elapsed seconds, latencies, errors)."""
+    latencies = []
+    errors = 0
+
+    async def client(client_id):
+        nonlocal errors
+        rng = random.Random(client_id)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+            for _ in range(requests_per_client):
+                method, path, params, body, user_id = request_mix(rng)
+                start = time.perf_counter()
+                response = await http.request(
+                    method, path, params=params, json=body, headers={"Authorization": f"Bearer {tokens[user_id]}"}
+                )
+                latencies.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(clients)))
+    return time.perf_counter() - start, latencies, errors
+
+
+async def benchmark(app: FastAPI, async_engine, clients: int, requests_per_client: int, tokens: dict):
+    """Warm up (score indexes, connection pools), then measure; one event loop for both."""
+    await run_clients(app, 4, 5, tokens)
+    try:
+        return await run_clients(app, clients, requests_per_client, tokens)
+    finally:
+        # Pooled aiosqlite connections belong to this event loop
+        if async_engine is not None:
+            await async_engine.dispose()
+
+
+def main():
+    """Run the same workload against both paths and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=50, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=40, help="Requests per client")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print("Seeding benchmark database...")
+        engine = seed(f"sqlite:///{directory}/bench.db")
+        async_engine = create_async_db_engine(f"sqlite+aiosqlite:///{directory}/bench.db")
+        tokens = {
+            user_id: create_access_token({"sub": user_id})
+            for user_id in range(1, NUM_RECRUITERS + NUM_CANDIDATES + 1)
+        }
+
+        print(f"{args.clients} clients x {args.requests} requests "
+              f"(30% job list, 30% applicant page, 30% /my, 10% status update)\n")
+        for name, use_async in (("sync", False), ("async", True)):
+            clear_score_indexes()
+            app = build_app(use_async, engine, async_engine)
+            elapsed, latencies, errors = asyncio.run(benchmark(
+                app, async_engine if use_async else None, args.clients, args.requests, tokens
+            ))
+
+            latencies.sort()
+            p95 = latencies[int(len(latencies) * 0.95) - 1]
+            print(f"{name:>5}: {len(latencies) / elapsed:7.1f} req/s  "
+                  f"p50 {statistics.median(latencies) * 1000:6.1f} ms  p95 {p95 * 1000:6.1f} ms  errors {errors}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Database helpers shared by the query-count and query-plan tests."""
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from score_index import clear_score_indexes
+
+
+def make_session():
+    """
+    Empty in-memory database, configured like database.SessionLocal.
+
+    Also drops the loaded score indexes, whose application ids belong to
+    the previous test's database.
+
+    Returns:
+        Tuple of (engine, session)
+    """
+    clear_score_indexes()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+
+@contextmanager
+def _listen(engine, record):
+    """Call record(statement, parameters) for every statement executed inside the block."""
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        record(statement, parameters)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@contextmanager
+def count_queries(engine):
+    """Collect the SQL statements executed inside the block."""
+    statements = []
+    with _listen(engine, lambda statement, parameters: statements.append(statement)):
+        yield statements
+
+
+@contextmanager
+def capture_queries(engine):
+    """Collect the (statement, parameters) pairs of the SELECTs executed inside the block."""
+    queries = []
+
+    def record(statement, parameters):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            queries.append((statement, parameters))
+
+    with _listen(engine, record):
+        yield queries
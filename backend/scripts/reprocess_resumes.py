@@ -0,0 +1,119 @@
+"""Re-run resume extraction for all stored applications using every CPU core, then re-score them."""
+import sys
+import argparse
+import json
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from models import JobPosting, Application, ApplicationResume
+from ml_integration.extract_skills import process_resumes, resume_process_pool
+from rescoring import rescore_job_applications
+from skill_index import replace_application_skill_links, update_skill_bitmaps
+
+
+def reprocess_applications(session, chunk_size: int = 2000, workers=None, executor=None) -> dict:
+    """
+    Re-extract every application's resume fields, then re-score each job.
+
+    Args:
+        session: Database session
+        chunk_size: Applications loaded per batch
+        workers: Worker processes (default: CPU count; 1 = serial)
+        executor: Pool shared by all batches (see resume_process_pool)
+
+    Returns:
+        Dictionary with the number of applications reprocessed and re-scored
+    """
+    total = session.query(Application).count()
+    print(f"Found {total} applications in database")
+
+    processed_count = 0
+    last_id = 0
+
+    while True:
+        # Keyset pagination keeps memory bounded to one chunk of resume text
+        rows = (
+            session.query(Application.id, Application.job_id, ApplicationResume.resume_text)
+            .outerjoin(Application.resume)
+            .filter(Application.id > last_id)
+            .order_by(Application.id)
+            .limit(chunk_size)
+            .all()
+        )
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        results = process_resumes([row.resume_text or "" for row in rows], workers=workers, executor=executor)
+
+        updates = []
+        for row, processed in zip(rows, results):
+            updates.append({
+                "id": row.id,
+                "extracted_skills": json.dumps(processed['extracted_skills']),
+                "num_skills": processed['num_skills'],
+                "skill_diversity": processed['skill_diversity'],
+                "experience_years": processed['experience_years'],
+                "education_level": processed['education_level'],
+                "has_certifications": processed['has_certifications'],
+                "has_leadership": processed['has_leadership'],
+                "skills_by_category": json.dumps({
+                    category: len(skills) for category, skills in processed['skills_by_category'].items()
+                }),
+                "technical_skills_count": processed['technical_skills_count'],
+            })
+
+        session.bulk_update_mappings(Application, updates)
+        replace_application_skill_links(session, [
+            (row.id, row.job_id, processed['extracted_skills']) for row, processed in zip(rows, results)
+        ])
+        update_skill_bitmaps(session, [(row.id, processed['extracted_skills']) for row, processed in zip(rows, results)])
+        session.commit()
+
+        processed_count += len(rows)
+        print(f"   Processed {processed_count}/{total} applications")
+
+    # Scores, matched / missing skills and percentiles were computed from the
+    # old extraction; re-score every job against the new fields
+    rescored_count = 0
+    for job in session.query(JobPosting).order_by(JobPosting.id).all():
+        rescored_count += rescore_job_applications(session, job)["rescored"]
+    print(f"   Re-scored {rescored_count} applications")
+
+    return {"reprocessed": processed_count, "rescored": rescored_count}
+
+
+def main():
+    """Re-extract skills, experience and education from stored resume text."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="Applications loaded per batch")
+    args = parser.parse_args()
+
+    # Connect to database
+    db_path = backend_dir / "ats_database.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    start = time.perf_counter()
+    if args.workers == 1:
+        counts = reprocess_applications(session, args.chunk_size, workers=1)
+    else:
+        # One pool for the whole run: workers start (and import the NLP code) once
+        with resume_process_pool(args.workers) as executor:
+            counts = reprocess_applications(session, args.chunk_size, workers=args.workers, executor=executor)
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ Reprocessed {counts['reprocessed']} applications in {elapsed:.1f}s")
+
+    session.close()
+
+if __name__ == "__main__":
+    main()
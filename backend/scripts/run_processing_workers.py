@@ -0,0 +1,60 @@
+"""Run worker processes that finish queued applications (APPLICATION_PROCESSING_MODE=queue)."""
+import sys
+import os
+import argparse
+import multiprocessing
+import signal
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+
+def worker_main(stop_event, poll_interval):
+    """Entry point of one worker process."""
+    # Resolve the same relative database / upload paths as main.py
+    os.chdir(backend_dir)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    from database import SessionLocal
+    from application_processing import run_worker
+
+    run_worker(SessionLocal, poll_interval=poll_interval, stop_event=stop_event)
+
+
+def main():
+    """Start the worker pool and wait until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="Worker processes")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between polls of an empty queue")
+    args = parser.parse_args()
+
+    # Create missing tables once, before the workers start polling
+    os.chdir(backend_dir)
+    from database import init_db
+    init_db()
+
+    ctx = multiprocessing.get_context("spawn")
+    stop_event = ctx.Event()
+    processes = [
+        ctx.Process(target=worker_main, args=(stop_event, args.poll_interval), name=f"processing-worker-{i}")
+        for i in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    print(f"✓ Started {len(processes)} processing worker(s); press Ctrl+C to stop")
+
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        print("\nStopping workers after their current application...")
+        stop_event.set()
+        for process in processes:
+            process.join()
+
+    print("✓ Workers stopped")
+
+if __name__ == "__main__":
+    main()
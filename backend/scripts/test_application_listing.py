@@ -0,0 +1,145 @@
+"""Test the keyset-paginated, filtered recruiter applicant listing."""
+import json
+import random
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from fastapi import HTTPException
+
+from models import User, JobPosting, Application, ApplicationResume
+from ml_integration.scoring import calculate_percentile
+from routers.applications import get_application_page_for_job
+from db_test_utils import count_queries, make_session
+
+NUM_APPLICATIONS = 3000
+
+
+def seed_session():
+    """One job with applications from 200 candidates; ties and unscored rows included."""
+    engine, db = make_session()
+    rng = random.Random(9)
+
+    db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+    for user_id in range(2, 202):
+        db.add(User(id=user_id, email=f"c{user_id}@example.com", password_hash="x",
+                    full_name=f"Candidate {user_id}", role="candidate"))
+    db.add(JobPosting(id=1, recruiter_id=1, title="Backend Dev", description="d", category="backend",
+                      required_skills=json.dumps([]), preferred_skills=json.dumps([]), min_experience=0))
+    db.flush()
+    db.bulk_insert_mappings(Application, [{
+        "job_id": 1,
+        "candidate_id": rng.randint(2, 201),
+        "resume_file_path": "r.pdf",
+        "final_score": rng.choice([None, 0.0, 75.0, round(rng.uniform(0, 100), 1)]),
+        "status": rng.choice(["pending", "reviewed", "shortlisted"]),
+        "cluster_id": rng.randint(0, 3),
+        "meets_requirements": rng.random() < 0.7,
+        "extracted_skills": json.dumps(["Python"]),
+    } for _ in range(NUM_APPLICATIONS)])
+    db.bulk_insert_mappings(ApplicationResume, [
+        {"application_id": application_id, "resume_text": "resume " * 200}
+        for application_id in range(1, NUM_APPLICATIONS + 1)
+    ])
+    db.commit()
+    return engine, db
+
+
+def list_all(db, **params):
+    """Walk every page; returns the items and the number of pages."""
+    items, cursor, pages = [], None, 0
+    while True:
+        page = get_application_page_for_job(
+            job_id=1, limit=250, cursor=cursor,
+            current_user=db.get(User, 1), db=db,
+            **{key: params.get(key) for key in (
+                "fields", "status_filter", "cluster_id", "meets_requirements",
+                "min_score", "max_score", "min_percentile", "max_percentile"
+            )}
+        )
+        items.extend(page.items)
+        pages += 1
+        if page.next_cursor is None:
+            return items, pages
+        cursor = page.next_cursor
+
+
+def expected_order(db, keep):
+    """Application ids in listing order (score desc, unscored last, id desc) that pass keep."""
+    applications = db.query(Application).filter(Application.job_id == 1).all()
+    pool = [app.final_score for app in applications if app.final_score is not None]
+    rows = [
+        app for app in applications
+        if keep(app, calculate_percentile(app.final_score or 0, pool))
+    ]
+    rows.sort(key=lambda app: (app.final_score is not None, app.final_score or 0, app.id), reverse=True)
+    return [app.id for app in rows]
+
+
+def test_pages_cover_the_listing_in_order():
+    """Test that walking the cursor returns every row once, in order, without resume text."""
+    engine, db = seed_session()
+
+    items, pages = list_all(db)
+    assert [item["id"] for item in items] == expected_order(db, lambda app, p: True)
+    assert pages == NUM_APPLICATIONS // 250 + (1 if NUM_APPLICATIONS % 250 else 0)
+    assert "resume_text" not in items[0]
+    assert items[0]["candidate_name"].startswith("Candidate")
+    assert items[0]["extracted_skills"] == ["Python"]
+
+    # Job, page and candidates: the score index is already loaded
+    recruiter = db.get(User, 1)
+    with count_queries(engine) as statements:
+        get_application_page_for_job(job_id=1, limit=250, current_user=recruiter, db=db,
+                                     cursor=None, fields=None, status_filter=None, cluster_id=None,
+                                     meets_requirements=None, min_score=None, max_score=None,
+                                     min_percentile=None, max_percentile=None)
+    print(f"  {NUM_APPLICATIONS} applications in {pages} pages, {len(statements)} queries per page")
+    assert len(statements) == 3
+
+
+def test_filters_and_sparse_fields():
+    """Test the server-side filters against a Python filter over all rows."""
+    engine, db = seed_session()
+
+    items, _ = list_all(db, status_filter="shortlisted", cluster_id=2, meets_requirements=True)
+    assert [item["id"] for item in items] == expected_order(
+        db, lambda app, p: app.status == "shortlisted" and app.cluster_id == 2 and app.meets_requirements
+    )
+
+    items, _ = list_all(db, min_score=20, max_score=75)
+    assert [item["id"] for item in items] == expected_order(
+        db, lambda app, p: app.final_score is not None and 20 <= app.final_score <= 75
+    )
+
+    for low, high in [(50, 90), (0, 10), (0, 0), (80, 100), (33.3, 33.4)]:
+        items, _ = list_all(db, min_percentile=low, max_percentile=high, fields="overall_percentile")
+        assert [item["id"] for item in items] == expected_order(db, lambda app, p: low <= p <= high), (low, high)
+        assert all(low <= item["overall_percentile"] <= high for item in items)
+
+    items, _ = list_all(db, fields="final_score,resume_text")
+    assert set(items[0]) == {"id", "final_score", "resume_text"}
+    assert items[0]["resume_text"].startswith("resume")
+
+    for bad in [dict(fields="final_score,password_hash"), dict(cursor="not-a-cursor")]:
+        try:
+            get_application_page_for_job(
+                job_id=1, limit=10, current_user=db.get(User, 1), db=db,
+                **{"cursor": None, "fields": None, "status_filter": None, "cluster_id": None,
+                   "meets_requirements": None, "min_score": None, "max_score": None,
+                   "min_percentile": None, "max_percentile": None, **bad}
+            )
+            raise AssertionError(f"{bad} accepted")
+        except HTTPException as e:
+            assert e.status_code == 400
+    print("  filters, percentile ranges and sparse fields match a full scan")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing applicant listing\n")
+    test_pages_cover_the_listing_in_order()
+    test_filters_and_sparse_fields()
+    print("\n✅ Applicant listing tests passed")
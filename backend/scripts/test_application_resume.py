@@ -0,0 +1,74 @@
+"""Test that resume text is stored apart from applications and only loaded on demand."""
+import json
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from models import User, JobPosting, Application, ApplicationResume
+from routers.applications import get_applications_for_job
+from db_test_utils import count_queries, make_session
+
+
+def seed_session(num_applications=200):
+    """One job with applications created through the ORM, each with its resume text."""
+    engine, db = make_session()
+
+    db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+    db.add(User(id=2, email="c@example.com", password_hash="x", full_name="C", role="candidate"))
+    db.add(JobPosting(id=1, recruiter_id=1, title="Backend Dev", description="d", category="backend",
+                      required_skills=json.dumps([]), preferred_skills=json.dumps([]), min_experience=0))
+    for i in range(num_applications):
+        db.add(Application(job_id=1, candidate_id=2, resume_file_path=f"r{i}.pdf",
+                           resume_text=f"resume {i} " * 500, final_score=float(i % 100)))
+    db.commit()
+    return engine, db
+
+
+def test_resume_text_is_loaded_on_demand():
+    """Test that loading applications leaves the resume table alone until the text is read."""
+    engine, db = seed_session()
+    assert db.query(ApplicationResume).count() == 200
+    db.expunge_all()
+
+    with count_queries(engine) as statements:
+        applications = db.query(Application).order_by(Application.id).all()
+    assert len(statements) == 1
+    assert "resume_text" not in statements[0]
+
+    with count_queries(engine) as statements:
+        assert applications[3].resume_text.startswith("resume 3 ")
+    assert len(statements) == 1 and "application_resumes" in statements[0]
+
+    # Setting the proxy updates the existing row; deleting cascades
+    applications[3].resume_text = "updated"
+    db.delete(applications[4])
+    db.commit()
+    assert db.get(ApplicationResume, 4).resume_text == "updated"
+    assert db.get(ApplicationResume, 5) is None
+    print("  resume text is read only when accessed")
+
+
+def test_job_listing_loads_resumes_in_one_query():
+    """Test that the full job listing doesn't load resume text per application."""
+    engine, db = seed_session()
+    recruiter = db.get(User, 1)
+    db.expunge_all()
+    db.add(recruiter)
+
+    with count_queries(engine) as statements:
+        results = get_applications_for_job(job_id=1, current_user=recruiter, db=db)
+    assert len(results) == 200
+    assert all(result.resume_text.startswith(f"resume {result.id - 1} ") for result in results)
+    # Job, applications, resumes, score index, candidates
+    print(f"  200 applications with resume text in {len(statements)} queries")
+    assert len(statements) == 5
+
+
+if __name__ == "__main__":
+    print("🧪 Testing resume text storage\n")
+    test_resume_text_is_loaded_on_demand()
+    test_job_listing_loads_resumes_in_one_query()
+    print("\n✅ Resume text storage tests passed")
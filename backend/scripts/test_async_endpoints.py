@@ -0,0 +1,159 @@
+"""Test that the async endpoints return what their sync versions return."""
+import asyncio
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, create_async_db_engine, create_db_engine
+from models import User, JobPosting, Application, ApplicationResume
+from schemas import ApplicationStatusUpdate
+from routers.applications import (
+    get_application_page_for_job, get_application_page_for_job_async, get_applications_for_job,
+    get_applications_for_job_async, get_my_applications, get_my_applications_async,
+    update_application_status, update_application_status_async
+)
+from routers.jobs import get_jobs, get_jobs_async
+from score_index import clear_score_indexes
+
+PAGE_PARAMS = dict(
+    limit=25, cursor=None, fields=None, status_filter=None, cluster_id=None, meets_requirements=None,
+    min_score=None, max_score=None, min_percentile=None, max_percentile=None
+)
+
+
+def seed(directory):
+    """File database (shared by both engines) with 2 recruiters, 6 jobs and 300 applications."""
+    url = f"sqlite:///{directory}/async.db"
+    engine = create_db_engine(url)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    rng = random.Random(3)
+
+    for user_id in range(1, 23):
+        db.add(User(id=user_id, email=f"u{user_id}@example.com", password_hash="x", full_name=f"U{user_id}",
+                    role="recruiter" if user_id <= 2 else "candidate", company_name="Acme"))
+    for job_id in range(1, 7):
+        db.add(JobPosting(id=job_id, recruiter_id=job_id % 2 + 1, title=f"Job {job_id}", description="d",
+                          category="backend", required_skills=json.dumps([]), preferred_skills=json.dumps([]),
+                          min_experience=0, status="closed" if job_id == 6 else "active"))
+    db.flush()
+    db.bulk_insert_mappings(Application, [{
+        "job_id": rng.randint(1, 6), "candidate_id": rng.randint(3, 22), "resume_file_path": "r.pdf",
+        "final_score": rng.choice([None, 50.0, round(rng.uniform(0, 100), 1)]),
+        "extracted_skills": json.dumps(["Python"]),
+    } for _ in range(300)])
+    db.bulk_insert_mappings(ApplicationResume, [
+        {"application_id": application_id, "resume_text": f"resume {application_id}"}
+        for application_id in range(1, 301)
+    ])
+    db.commit()
+    db.close()
+
+    async_engine = create_async_db_engine(f"sqlite+aiosqlite:///{directory}/async.db")
+    return engine, async_engine
+
+
+def dump(results):
+    """Comparable form of a response model or a list of them."""
+    if isinstance(results, list):
+        return [result.model_dump() for result in results]
+    return results.model_dump()
+
+
+def test_async_endpoints_match_sync():
+    """Test job listing, both applicant listings, /my and status updates on both paths."""
+    clear_score_indexes()
+    with tempfile.TemporaryDirectory() as directory:
+        engine, async_engine = seed(directory)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        AsyncSession = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+        async def compare():
+            checked = 0
+            for user_id in (1, 2, 3, 7):
+                with Session() as db:
+                    user = db.get(User, user_id)
+                    expected = [dump(get_jobs(status_filter="active", current_user=user, db=db))]
+                    if user.role == "candidate":
+                        expected.append(dump(get_my_applications(current_user=user, db=db)))
+                    else:
+                        job_id = user_id + 1
+                        expected.append(dump(get_applications_for_job(job_id=job_id, current_user=user, db=db)))
+                        page = get_application_page_for_job(job_id=job_id, current_user=user, db=db, **PAGE_PARAMS)
+                        cursor_params = dict(PAGE_PARAMS, cursor=page.next_cursor, fields="final_score,resume_text")
+                        expected.append(dump(page))
+                        expected.append(dump(get_application_page_for_job(
+                            job_id=job_id, current_user=user, db=db, **cursor_params
+                        )))
+
+                async with AsyncSession() as db:
+                    user = await db.get(User, user_id)
+                    actual = [dump(await get_jobs_async(status_filter="active", current_user=user, db=db))]
+                    if user.role == "candidate":
+                        actual.append(dump(await get_my_applications_async(current_user=user, db=db)))
+                    else:
+                        job_id = user_id + 1
+                        actual.append(dump(await get_applications_for_job_async(
+                            job_id=job_id, current_user=user, db=db
+                        )))
+                        actual.append(dump(await get_application_page_for_job_async(
+                            job_id=job_id, current_user=user, db=db, **PAGE_PARAMS
+                        )))
+                        actual.append(dump(await get_application_page_for_job_async(
+                            job_id=job_id, current_user=user, db=db, **cursor_params
+                        )))
+
+                assert actual == expected, user_id
+                checked += len(actual)
+            return checked
+
+        checked = asyncio.run(compare())
+
+        async def update_status():
+            async with AsyncSession() as db:
+                recruiter = await db.get(User, 2)
+                application = (await get_applications_for_job_async(job_id=3, current_user=recruiter, db=db))[0]
+                response = await update_application_status_async(
+                    application_id=application.id, status_update=ApplicationStatusUpdate(status="shortlisted"),
+                    current_user=recruiter, db=db
+                )
+                assert response.status == "shortlisted"
+                try:
+                    # Job 3 belongs to recruiter 2, not 1
+                    await update_application_status_async(
+                        application_id=application.id, status_update=ApplicationStatusUpdate(status="rejected"),
+                        current_user=await db.get(User, 1), db=db
+                    )
+                    raise AssertionError("other recruiter allowed")
+                except HTTPException as e:
+                    assert e.status_code == 403
+                return application.id
+
+        application_id = asyncio.run(update_status())
+        with Session() as db:
+            assert db.get(Application, application_id).status == "shortlisted"
+            response = update_application_status(
+                application_id=application_id, status_update=ApplicationStatusUpdate(status="reviewed"),
+                current_user=db.get(User, 2), db=db
+            )
+            assert response.status == "reviewed"
+
+        asyncio.run(async_engine.dispose())
+        engine.dispose()
+    print(f"  {checked} async responses equal to the sync ones; status updates agree")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing async endpoints\n")
+    test_async_endpoints_match_sync()
+    print("\n✅ Async endpoint tests passed")
@@ -0,0 +1,91 @@
+"""Test that vectorized batch scoring matches the scalar scoring functions."""
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from ml_integration.batch_scoring import CandidateBatch, score_batch
+from ml_integration.scoring import calculate_final_score
+
+SKILLS = ['Python', 'JavaScript', 'React', 'SQL', 'Docker', 'AWS', 'Go', 'Java', 'C++', 'Kubernetes', 'Git', 'Node.js']
+EDUCATION = ["PhD", "Master's", "Bachelor's", "Diploma", "Not Specified", "", None]
+
+JOBS = [
+    {"job_required_skills": [], "job_preferred_skills": [], "job_min_experience": 0},
+    {"job_required_skills": ["python", "SQL"], "job_preferred_skills": ["Docker", "aws", "AWS", "Rust"],
+     "job_min_experience": 3, "job_min_education": "bachelors"},
+    {"job_required_skills": ["React"], "job_preferred_skills": ["Node.js"], "job_min_experience": 2,
+     "job_certifications_required": True, "job_leadership_required": True,
+     "weights": {"skills": 0.5, "experience": 0.2, "education": 0.1, "certification": 0.1, "leadership": 0.1}},
+    {"job_required_skills": ["Haskell"], "job_preferred_skills": ["Go"], "job_min_experience": 1},
+]
+
+
+def random_candidates(n, seed=7):
+    rng = random.Random(seed)
+    return [{
+        "extracted_skills": rng.sample(SKILLS, rng.randint(0, len(SKILLS))) + (['Python'] if rng.random() < 0.1 else []),
+        # Include exact boundaries of the experience score piecewise function
+        "experience_years": rng.choice([0, 1, 2, 3, 5, 7, 8, 10, 12.5, 20]) if rng.random() < 0.5 else round(rng.uniform(0, 25), 1),
+        "education_level": rng.choice(EDUCATION),
+        "has_certifications": rng.random() < 0.5,
+        "has_leadership": rng.random() < 0.5,
+        "skill_diversity": rng.choice([0, 0.125, 0.375, 1.0, rng.random()]),
+    } for _ in range(n)]
+
+
+def scalar_scores(candidates, job):
+    return [calculate_final_score(
+        candidate_skills=c["extracted_skills"],
+        candidate_experience=c["experience_years"],
+        candidate_education=c["education_level"],
+        candidate_has_certifications=c["has_certifications"],
+        candidate_has_leadership=c["has_leadership"],
+        candidate_skill_diversity=c["skill_diversity"],
+        **job
+    ) for c in candidates]
+
+
+def test_batch_matches_scalar():
+    """Test every output of score_batch against calculate_final_score."""
+    print("🧪 Testing batch scoring against scalar scoring\n")
+    candidates = random_candidates(3000)
+    batch = CandidateBatch.from_processed(candidates)
+
+    for job in JOBS:
+        expected = scalar_scores(candidates, job)
+        actual = score_batch(batch, **job)
+        for i, scores in enumerate(expected):
+            for field in ["meets_requirements", "final_score", "skills_score",
+                          "experience_score", "education_score", "bonus_score"]:
+                assert actual[field][i] == scores[field], (field, i, actual[field][i], scores[field])
+        print(f"  {sum(s['meets_requirements'] for s in expected)}/{len(expected)} pass, all fields identical")
+
+
+def test_batch_speed():
+    """Report batch vs scalar scoring time for a large pool."""
+    candidates = random_candidates(50000, seed=3)
+    job = JOBS[1]
+
+    start = time.perf_counter()
+    scalar_scores(candidates, job)
+    scalar_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    batch = CandidateBatch.from_processed(candidates)
+    build_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    score_batch(batch, **job)
+    batch_ms = (time.perf_counter() - start) * 1000
+
+    print(f"\n⏱️  50,000 candidates: scalar {scalar_ms:.0f} ms, batch {batch_ms:.1f} ms (+{build_ms:.0f} ms to build columns)\n")
+
+
+if __name__ == "__main__":
+    test_batch_matches_scalar()
+    test_batch_speed()
+    print("✅ Batch scoring tests passed")
@@ -0,0 +1,152 @@
+"""Test the SQLite engine configuration under concurrent reads and writes."""
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, create_db_engine
+from models import User, JobPosting, Application
+
+WRITERS = 4
+READERS = 4
+WRITES_PER_WRITER = 150
+
+
+def make_engine(directory):
+    """File database with one job, created through create_db_engine."""
+    engine = create_db_engine(f"sqlite:///{directory}/concurrency.db")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with Session() as db:
+        db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+        db.add(JobPosting(id=1, recruiter_id=1, title="Job", description="d", category="backend",
+                          required_skills=json.dumps([]), preferred_skills=json.dumps([]), min_experience=0))
+        db.commit()
+    return engine, Session
+
+
+def test_connections_get_pragmas():
+    """Test that every pooled connection is configured."""
+    with tempfile.TemporaryDirectory() as directory:
+        engine, _ = make_engine(directory)
+        connections = [engine.connect() for _ in range(3)]
+        try:
+            for conn in connections:
+                pragma = lambda name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+                assert pragma("journal_mode") == "wal"
+                assert pragma("synchronous") == 1  # NORMAL
+                assert pragma("busy_timeout") > 0
+                assert pragma("cache_size") < 0
+        finally:
+            for conn in connections:
+                conn.close()
+            engine.dispose()
+    print("  WAL, synchronous=NORMAL, busy_timeout and cache_size set on every connection")
+
+
+def test_readers_and_writers_do_not_block_each_other():
+    """Test reads during an open write transaction and a commit during an open read transaction."""
+    with tempfile.TemporaryDirectory() as directory:
+        engine, Session = make_engine(directory)
+        writer = Session()
+        reader = engine.raw_connection()
+        try:
+            writer.add(Application(job_id=1, candidate_id=1, resume_file_path="r.pdf", resume_text=""))
+            writer.flush()  # write lock held until commit
+
+            start = time.perf_counter()
+            assert reader.execute("SELECT count(*) FROM applications").fetchone() == (0,)
+            assert time.perf_counter() - start < 1.0
+            writer.commit()
+
+            # A read transaction keeps its snapshot while a writer commits;
+            # with a rollback journal the commit would wait for the reader
+            reader.execute("BEGIN")
+            assert reader.execute("SELECT count(*) FROM applications").fetchone() == (1,)
+            start = time.perf_counter()
+            writer.add(Application(job_id=1, candidate_id=1, resume_file_path="r2.pdf", resume_text=""))
+            writer.commit()
+            assert time.perf_counter() - start < 1.0
+            assert reader.execute("SELECT count(*) FROM applications").fetchone() == (1,)
+            reader.rollback()
+            assert reader.execute("SELECT count(*) FROM applications").fetchone() == (2,)
+        finally:
+            reader.close()
+            writer.close()
+            engine.dispose()
+    print("  readers and writers don't wait for each other")
+
+
+def test_concurrent_reads_and_writes():
+    """Test writer and reader threads hammering the same database without lock errors."""
+    errors = []
+    stop = threading.Event()
+    reads = [0] * READERS
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine, Session = make_engine(directory)
+
+        def write(writer_id):
+            try:
+                for i in range(WRITES_PER_WRITER):
+                    with Session() as db:
+                        application = Application(job_id=1, candidate_id=1, resume_file_path=f"w{writer_id}-{i}.pdf",
+                                                  resume_text="text " * 50, final_score=float(i % 100))
+                        db.add(application)
+                        db.commit()
+                        # Read-modify-write in a second transaction (reloads the expired row)
+                        application.status = "reviewed" if application.status == "pending" else "rejected"
+                        db.commit()
+            except Exception as e:
+                errors.append(e)
+
+        def read(reader_id):
+            try:
+                while not stop.is_set():
+                    with Session() as db:
+                        db.query(Application.id, Application.final_score).filter(
+                            Application.job_id == 1
+                        ).order_by(Application.final_score.desc()).limit(50).all()
+                        db.query(func.count(Application.id)).scalar()
+                    reads[reader_id] += 1
+            except Exception as e:
+                errors.append(e)
+
+        writers = [threading.Thread(target=write, args=(i,)) for i in range(WRITERS)]
+        readers = [threading.Thread(target=read, args=(i,)) for i in range(READERS)]
+        start = time.perf_counter()
+        for thread in writers + readers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        stop.set()
+        for thread in readers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        with Session() as db:
+            total = db.query(func.count(Application.id)).scalar()
+            reviewed = db.query(func.count(Application.id)).filter(Application.status == "reviewed").scalar()
+        engine.dispose()
+
+    print(f"  {WRITERS * WRITES_PER_WRITER} inserts, {sum(reads)} read rounds in {elapsed:.1f}s")
+    assert not errors, errors[:3]
+    assert total == reviewed == WRITERS * WRITES_PER_WRITER
+    assert all(reads)
+
+
+if __name__ == "__main__":
+    print("🧪 Testing database concurrency\n")
+    test_connections_get_pragmas()
+    test_readers_and_writers_do_not_block_each_other()
+    test_concurrent_reads_and_writes()
+    print("\n✅ Database concurrency tests passed")
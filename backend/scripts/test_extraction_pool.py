@@ -0,0 +1,69 @@
+"""Test supervised, resource-limited resume extraction workers."""
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from extraction_pool import ExtractionPool, ExtractionError
+
+SAMPLE_RESUME = backend_dir / "uploads" / "resumes" / "user_2_job_2.pdf"
+
+
+def spin_forever():
+    """Stand-in for a PDF that keeps the parser busy."""
+    while True:
+        pass
+
+
+def allocate_forever():
+    """Stand-in for a PDF that makes the parser allocate without bound."""
+    chunks = []
+    while True:
+        chunks.append(bytearray(64 * 1024 * 1024))
+
+
+def fail_to_parse():
+    raise Exception("Error extracting text from PDF: EOF marker not found")
+
+
+def expect_extraction_error(pool, fn, code):
+    try:
+        pool.run(fn)
+    except ExtractionError as e:
+        print(f"  {fn.__name__}: {e.code} ({e.message})")
+        assert e.code == code
+        return
+    raise AssertionError(f"{fn.__name__} was not stopped")
+
+
+def test_limits_kill_and_recycle_workers():
+    """Test that runaway documents are stopped and the pool keeps working."""
+    print("🧪 Testing extraction limits\n")
+    pool = ExtractionPool(workers=1, cpu_seconds=1, memory_mb=512, timeout_seconds=5)
+    try:
+        expect_extraction_error(pool, spin_forever, "extraction_timeout")
+        expect_extraction_error(pool, allocate_forever, "extraction_memory_exceeded")
+
+        # Ordinary parse errors keep their message and don't kill the worker
+        try:
+            pool.run(fail_to_parse)
+            raise AssertionError("parse error was swallowed")
+        except ValueError as e:
+            assert "EOF marker" in str(e)
+
+        text = pool.extract_file(SAMPLE_RESUME)
+        print(f"  Extracted {len(text)} characters after recycling\n")
+        assert text
+
+        stats = pool.stats()
+        print(f"  Stats: {stats}\n")
+        assert stats["timeouts"] == 1 and stats["memory_kills"] == 1
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    test_limits_kill_and_recycle_workers()
+    print("✅ Extraction pool tests passed")
@@ -0,0 +1,73 @@
+"""Test compiled, cached job scoring profiles."""
+import json
+import pickle
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from ml_integration.job_profile import get_job_profile, invalidate_job_profile
+
+
+def make_job(**overrides):
+    """Stand-in for a JobPosting row."""
+    job = dict(
+        id=9001,
+        required_skills=json.dumps(["Python", "Next.js"]),
+        preferred_skills=json.dumps(["Docker", "docker"]),
+        requirements=json.dumps({"min_education": "bachelors", "leadership_required": True}),
+        min_experience=None,
+        weight_skills=0.5, weight_experience=0.2, weight_education=0.2,
+        weight_certifications=0.1, weight_leadership=None,
+    )
+    job.update(overrides)
+    return SimpleNamespace(**job)
+
+
+def test_profile_contents():
+    """Test that the profile holds the parsed, normalized job requirements."""
+    profile = get_job_profile(make_job())
+    print(f"  Compiled: {profile.scoring_kwargs()}")
+
+    assert profile.required_skills_lower == ("python", "next.js")
+    assert profile.required_skills_normalized == ("python", "nextjs")
+    assert profile.preferred_skills_lower == ("docker", "docker")
+    assert profile.min_experience == 0
+    assert profile.min_education == "bachelors"
+    assert profile.leadership_required and not profile.certifications_required
+    assert profile.weights["leadership"] == 0.05  # column default for a missing weight
+
+    # Immutable, and picklable for the ML worker processes
+    try:
+        profile.min_experience = 3
+        raise AssertionError("profile was mutated")
+    except AttributeError:
+        pass
+    assert pickle.loads(pickle.dumps(profile)).scoring_kwargs() == profile.scoring_kwargs()
+
+
+def test_profile_cache():
+    """Test that profiles are reused until the job's scoring columns change."""
+    job = make_job()
+    invalidate_job_profile(job.id)
+
+    first = get_job_profile(job)
+    assert get_job_profile(job) is first
+
+    job.min_experience = 4
+    changed = get_job_profile(job)
+    assert changed is not first and changed.min_experience == 4
+
+    invalidate_job_profile(job.id)
+    assert get_job_profile(job) is not changed
+    print("  Cache reuses profiles and recompiles on change\n")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing job scoring profiles\n")
+    test_profile_contents()
+    test_profile_cache()
+    print("✅ Job profile tests passed")
@@ -0,0 +1,92 @@
+"""Test that the job endpoints load counts and recruiters without N+1 queries."""
+import json
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from fastapi import BackgroundTasks
+
+from models import User, JobPosting, Application
+from schemas import JobPostingUpdate
+from routers.jobs import get_jobs, get_job_by_id, update_job_posting
+from db_test_utils import count_queries, make_session
+
+
+def seed_session():
+    """In-memory database with 3 recruiters, 300 jobs and uneven application counts."""
+    engine, db = make_session()
+
+    for user_id in (1, 2, 3):
+        db.add(User(id=user_id, email=f"r{user_id}@example.com", password_hash="x", full_name=f"R{user_id}",
+                    role="recruiter", company_name=f"Company {user_id}", company_logo=f"logo{user_id}.png"))
+    db.add(User(id=4, email="c@example.com", password_hash="x", full_name="C", role="candidate"))
+    for job_id in range(1, 301):
+        db.add(JobPosting(
+            id=job_id, recruiter_id=job_id % 3 + 1, title=f"Job {job_id}", description="d", category="backend",
+            required_skills=json.dumps(["Python"]), preferred_skills=json.dumps([]), min_experience=0,
+            status="closed" if job_id % 10 == 0 else "active"
+        ))
+    db.flush()
+    db.bulk_insert_mappings(Application, [
+        {"job_id": job_id, "candidate_id": 4, "resume_file_path": "r.pdf"}
+        for job_id in range(1, 301) for _ in range(job_id % 7)
+    ])
+    db.commit()
+    return engine, db
+
+
+def test_get_jobs_runs_one_query():
+    """Test that listing jobs is one query whatever the number of jobs."""
+    engine, db = seed_session()
+    candidate = db.get(User, 4)
+    recruiter = db.get(User, 2)
+
+    with count_queries(engine) as statements:
+        jobs = get_jobs(status_filter="active", current_user=candidate, db=db)
+    print(f"  candidate listing: {len(jobs)} jobs in {len(statements)} query")
+    assert len(jobs) == 270
+    assert len(statements) == 1
+
+    for job in jobs:
+        assert job.application_count == job.id % 7
+        assert job.company_name == f"Company {job.recruiter_id}"
+        assert job.company_logo == f"logo{job.recruiter_id}.png"
+
+    db.expunge_all()
+    with count_queries(engine) as statements:
+        jobs = get_jobs(status_filter="closed", current_user=recruiter, db=db)
+    assert {job.id for job in jobs} == {job_id for job_id in range(10, 301, 10) if job_id % 3 + 1 == 2}
+    assert len(statements) == 1
+
+
+def test_single_job_endpoints_share_the_count_query():
+    """Test get_job_by_id and update_job_posting against pinned query counts."""
+    engine, db = seed_session()
+    recruiter = db.get(User, 2)
+    db.expunge_all()
+
+    with count_queries(engine) as statements:
+        job = get_job_by_id(job_id=13, current_user=recruiter, db=db)
+    assert (job.application_count, job.company_name) == (13 % 7, "Company 2")
+    assert len(statements) == 1
+
+    db.expunge_all()
+    with count_queries(engine) as statements:
+        job = update_job_posting(
+            job_id=13, job_update=JobPostingUpdate(title="Renamed"), background_tasks=BackgroundTasks(),
+            current_user=recruiter, db=db
+        )
+    assert (job.title, job.application_count, job.company_name) == ("Renamed", 13 % 7, "Company 2")
+    # Load, UPDATE, reload with count and recruiter
+    print(f"  get_job_by_id: 1 query, update_job_posting: {len(statements)} queries")
+    assert len(statements) == 3
+
+
+if __name__ == "__main__":
+    print("🧪 Testing job endpoint query counts\n")
+    test_get_jobs_runs_one_query()
+    test_single_job_endpoints_share_the_count_query()
+    print("\n✅ Job endpoint query tests passed")
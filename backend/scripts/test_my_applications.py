@@ -0,0 +1,62 @@
+"""Test GET /api/applications/my: one query, percentiles equal to calculate_percentile."""
+import json
+import random
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from models import User, JobPosting, Application
+from ml_integration.scoring import calculate_percentile
+from routers.applications import get_my_applications
+from db_test_utils import count_queries, make_session
+
+
+def test_my_applications_in_one_query():
+    """Test a candidate with 100 applications across 100 jobs."""
+    engine, db = make_session()
+    rng = random.Random(4)
+
+    db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+    db.add(User(id=2, email="c@example.com", password_hash="x", full_name="C", role="candidate"))
+    for job_id in range(1, 121):
+        db.add(JobPosting(
+            id=job_id, recruiter_id=1, title=f"Job {job_id}", description="d", category="backend",
+            required_skills=json.dumps([]), preferred_skills=json.dumps([]), min_experience=0
+        ))
+    db.flush()
+
+    def score():
+        # Ties, rejected (0) and unscored (None) applications included
+        return rng.choice([None, 0.0, 50.0, round(rng.uniform(0, 100), 1)])
+
+    db.bulk_insert_mappings(Application, [
+        {"job_id": job_id, "candidate_id": 1, "resume_file_path": "r.pdf", "final_score": score()}
+        for job_id in range(1, 121) for _ in range(rng.randint(0, 40))
+    ] + [
+        {"job_id": job_id, "candidate_id": 2, "resume_file_path": "r.pdf", "final_score": score()}
+        for job_id in range(1, 101)
+    ])
+    db.commit()
+    candidate = db.get(User, 2)
+
+    with count_queries(engine) as statements:
+        results = get_my_applications(current_user=candidate, db=db)
+    print(f"  {len(results)} applications in {len(statements)} query")
+    assert len(results) == 100
+    assert len(statements) == 1
+
+    for result in results:
+        assert result.job_title == f"Job {result.job_id}"
+        pool = [s for (s,) in db.query(Application.final_score).filter(
+            Application.job_id == result.job_id, Application.final_score.isnot(None)
+        ).all()]
+        assert result.overall_percentile == calculate_percentile(result.final_score or 0, pool), result.id
+
+
+if __name__ == "__main__":
+    print("🧪 Testing /my applications\n")
+    test_my_applications_in_one_query()
+    print("\n✅ /my applications tests passed")
@@ -0,0 +1,172 @@
+"""Test page-by-page PDF extraction: page order, page cap, early exit and page-parallel shards."""
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from extraction_pool import ExtractionPool
+from ml_integration import resume_parser
+from ml_integration.resume_parser import extract_pdf_pages, extract_text_from_file
+
+NUM_PAGES = 12
+
+
+def make_pdf(page_texts) -> bytes:
+    """Minimal PDF with one line of Helvetica text per page."""
+    objects = {1: b"<< /Type /Catalog /Pages 2 0 R >>", 3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    kids = []
+    for i, text in enumerate(page_texts):
+        page_id, content_id = 4 + 2 * i, 5 + 2 * i
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+        objects[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        objects[page_id] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(b"%d 0 R" % page_id)
+    objects[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    pdf = b"%PDF-1.4\n"
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = len(pdf)
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (object_id, objects[object_id])
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offsets[object_id] for object_id in sorted(objects))
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return pdf
+
+
+def page_text(index: int) -> str:
+    """Text of the fixture's page index (0-based)."""
+    return f"Page {index + 1} Python Docker publication {index + 1:03d}"
+
+
+def write_fixture(directory) -> str:
+    """Write the NUM_PAGES-page fixture CV and return its path."""
+    path = Path(directory) / "long_cv.pdf"
+    path.write_bytes(make_pdf([page_text(i) for i in range(NUM_PAGES)]))
+    return str(path)
+
+
+def assert_pages_in_order(result, count):
+    """The first count pages, in document order, with a timing each."""
+    lines = result["text"].splitlines()
+    assert lines == [page_text(i) for i in range(count)], lines
+    assert [timing["page"] for timing in result["page_timings"]] == list(range(1, count + 1))
+    assert all(timing["seconds"] >= 0 for timing in result["page_timings"])
+
+
+def test_serial_extraction():
+    """Test page order, the page cap and the character early exit."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_fixture(directory)
+
+        result = extract_pdf_pages(path, max_pages=None, min_chars=None, workers=0)
+        assert_pages_in_order(result, NUM_PAGES)
+        assert result["total_pages"] == result["pages_extracted"] == NUM_PAGES
+        assert not result["truncated"] and result["truncated_by"] is None
+
+        capped = extract_pdf_pages(path, max_pages=5, min_chars=None, workers=0)
+        assert_pages_in_order(capped, 5)
+        assert capped["truncated"] and capped["truncated_by"] == "max_pages" and capped["total_pages"] == NUM_PAGES
+
+        # Each page has ~40 characters: stop on the page that reaches 100
+        early = extract_pdf_pages(path, max_pages=None, min_chars=100, workers=0)
+        assert_pages_in_order(early, 3)
+        assert early["truncated"] and early["truncated_by"] == "min_chars"
+    print(f"  serial: {NUM_PAGES} pages in order, cap at 5, early exit after 3")
+
+
+def test_parallel_extraction():
+    """Test that page-parallel shards assemble pages in document order and honour the limits."""
+    original = resume_parser.PDF_PAGES_PER_SHARD, resume_parser.PDF_PARALLEL_MIN_PAGES
+    resume_parser.PDF_PAGES_PER_SHARD, resume_parser.PDF_PARALLEL_MIN_PAGES = 3, 4
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = write_fixture(directory)
+            serial = extract_pdf_pages(path, max_pages=None, min_chars=None, workers=0)
+
+            parallel = extract_pdf_pages(path, max_pages=None, min_chars=None, workers=2)
+            assert parallel["text"] == serial["text"]
+            assert_pages_in_order(parallel, NUM_PAGES)
+
+            capped = extract_pdf_pages(path, max_pages=7, min_chars=None, workers=2)
+            assert_pages_in_order(capped, 7)
+            assert capped["truncated_by"] == "max_pages"
+
+            early = extract_pdf_pages(path, max_pages=None, min_chars=100, workers=2)
+            assert_pages_in_order(early, 3)
+            assert early["truncated_by"] == "min_chars"
+    finally:
+        resume_parser.PDF_PAGES_PER_SHARD, resume_parser.PDF_PARALLEL_MIN_PAGES = original
+    print("  parallel: shards of 3 pages reassembled in document order")
+
+
+def test_parallel_settings_in_isolated_workers():
+    """Test that long PDFs extract in daemonic extraction workers with page-parallel mode enabled."""
+    # Spawned extraction workers read the settings from the environment
+    settings = {"PDF_PARALLEL_WORKERS": "2", "PDF_PARALLEL_MIN_PAGES": "4", "PDF_PAGES_PER_SHARD": "3"}
+    original = {name: os.environ.get(name) for name in settings}
+    os.environ.update(settings)
+    pool = ExtractionPool(workers=1, cpu_seconds=20, memory_mb=0, timeout_seconds=60)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = write_fixture(directory)
+            text = pool.extract_file(path)
+            assert text.splitlines() == [page_text(i) for i in range(NUM_PAGES)]
+            assert pool.stats()["crashes"] == 0
+    finally:
+        pool.shutdown()
+        for name, value in original.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+    print(f"  isolated worker extracted all {NUM_PAGES} pages with PDF_PARALLEL_WORKERS=2")
+
+
+def test_extraction_is_reported():
+    """Test that extract_text_from_file logs page counts, early exit and the slowest page."""
+    records = []
+
+    class Collect(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    handler = Collect(level=logging.DEBUG)
+    resume_parser.logger.addHandler(handler)
+    resume_parser.logger.setLevel(logging.DEBUG)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = write_fixture(directory)
+            text = extract_text_from_file(path)
+            assert text.splitlines() == [page_text(i) for i in range(NUM_PAGES)]
+            summary = records[0].getMessage()
+            assert f"Extracted {NUM_PAGES} of {NUM_PAGES} pages of long_cv.pdf" in summary, summary
+            assert "slowest page" in summary and "stopped" not in summary
+            assert "Page timings" in records[1].getMessage()
+
+            records.clear()
+            resume_parser._log_pdf_extraction(path, extract_pdf_pages(path, max_pages=4, min_chars=None, workers=0))
+            assert "Extracted 4 of 12 pages" in records[0].getMessage()
+            assert "(stopped at max_pages)" in records[0].getMessage()
+    finally:
+        resume_parser.logger.removeHandler(handler)
+        resume_parser.logger.setLevel(logging.NOTSET)
+    print("  page counts, early exit and page timings are logged")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing PDF extraction\n")
+    test_serial_extraction()
+    test_parallel_extraction()
+    test_parallel_settings_in_isolated_workers()
+    test_extraction_is_reported()
+    print("\n✅ PDF extraction tests passed")
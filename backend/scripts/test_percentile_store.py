@@ -0,0 +1,153 @@
+"""Test the stored score distributions used for percentile rankings."""
+import json
+import random
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import User, JobPosting, Application, ScoreHistogramBucket, ScoreSketchRecord
+from ml_integration.scoring import calculate_percentile
+from ml_integration.score_sketch import ScoreSketch
+from percentile_store import (
+    DISTRIBUTION_FIELDS, application_day, move_job_distribution, rebuild_score_distributions,
+    record_score_change, store_percentile, store_percentiles, window_sketch
+)
+
+JOBS = [(1, "backend"), (2, "backend"), (3, "frontend")]
+
+
+def make_session():
+    """Fresh in-memory database with three jobs."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+    for job_id, category in JOBS:
+        db.add(JobPosting(
+            id=job_id, recruiter_id=1, title=f"Job {job_id}", description="d", category=category,
+            required_skills=json.dumps([]), preferred_skills=json.dumps([]), min_experience=0
+        ))
+    db.commit()
+    return db
+
+
+def random_scores(rng):
+    """Scores as stored on an application (rejected candidates score 0)."""
+    if rng.random() < 0.2:
+        return {field: 0.0 for field in DISTRIBUTION_FIELDS}
+    return {field: round(rng.uniform(0, 100), 2) for field in DISTRIBUTION_FIELDS}
+
+
+def stored_buckets(db):
+    """Every stored bucket, for comparing with a rebuild."""
+    return sorted(db.query(
+        ScoreHistogramBucket.scope, ScoreHistogramBucket.scope_key, ScoreHistogramBucket.field,
+        ScoreHistogramBucket.bucket, ScoreHistogramBucket.count
+    ).all())
+
+
+def stored_sketches(db):
+    """Every stored day sketch, decoded."""
+    return {
+        (record.scope, record.scope_key, record.field, record.day): (ScoreSketch.from_bytes(record.sketch).counts, record.count)
+        for record in db.query(ScoreSketchRecord).all()
+    }
+
+
+def assert_matches_rebuild(db):
+    """The incrementally maintained buckets and sketches equal a rebuild from the applications."""
+    stored, sketches = stored_buckets(db), stored_sketches(db)
+    rebuild_score_distributions(db)
+    assert stored == stored_buckets(db)
+    assert sketches == stored_sketches(db)
+    db.rollback()
+
+
+def submit(db, rng, job_id, category, applied_at=None):
+    """Insert an application the way _store_application does."""
+    scores = random_scores(rng)
+    applied_at = applied_at or datetime.utcnow()
+    application = Application(
+        job_id=job_id, candidate_id=1, resume_file_path="r.pdf", resume_text="", applied_at=applied_at, **scores
+    )
+    db.add(application)
+    record_score_change(db, job_id, category, None, scores, application_day(applied_at))
+    db.commit()
+    return application
+
+
+def test_incremental_store_matches_list_scans():
+    """Test submissions, re-scores and a category move against calculate_percentile."""
+    db = make_session()
+    rng = random.Random(5)
+
+    start = datetime(2026, 3, 1, 12)
+    applications = [
+        submit(db, rng, *rng.choice(JOBS), applied_at=start + timedelta(days=rng.randint(0, 30)))
+        for _ in range(600)
+    ]
+
+    # Re-score some applications in place
+    for application in rng.sample(applications, 100):
+        old = {field: getattr(application, field) for field in DISTRIBUTION_FIELDS}
+        new = random_scores(rng)
+        for field, value in new.items():
+            setattr(application, field, value)
+        category = "backend" if application.job_id < 3 else "frontend"
+        record_score_change(db, application.job_id, category, old, new, application_day(application.applied_at))
+    db.commit()
+    assert_matches_rebuild(db)
+
+    def pool(field, *filters, exclude_zero=False):
+        values = [v for (v,) in db.query(getattr(Application, field)).join(JobPosting).filter(*filters).all()]
+        return [v for v in values if v] if exclude_zero else values
+
+    queries = [0.0, 12.5, 50.0, 99.99, 100.0] + [round(rng.uniform(0, 100), 2) for _ in range(50)]
+    for field in DISTRIBUTION_FIELDS:
+        everyone = pool(field, exclude_zero=True)
+        assert list(store_percentiles(db, "all", "", field, queries, exclude_zero=True)) == [
+            calculate_percentile(q, everyone) for q in queries
+        ]
+    backend = pool("final_score", JobPosting.category == "backend")
+    job_3 = pool("final_score", JobPosting.id == 3)
+    for q in queries:
+        assert store_percentile(db, "category", "backend", "final_score", q) == calculate_percentile(q, backend)
+        assert store_percentile(db, "job", "3", "final_score", q) == calculate_percentile(q, job_3)
+
+    # Job 3 moves to the backend category
+    db.get(JobPosting, 3).category = "backend"
+    move_job_distribution(db, 3, "frontend", "backend")
+    db.commit()
+    backend = pool("final_score", JobPosting.category == "backend")
+    for q in queries:
+        assert store_percentile(db, "category", "backend", "final_score", q) == calculate_percentile(q, backend)
+    assert store_percentile(db, "category", "frontend", "final_score", 50.0) == 50.0
+
+    # Emptied buckets are dropped, so the store matches a rebuild exactly
+    assert_matches_rebuild(db)
+    print(f"  {len(stored_buckets(db))} buckets match percentiles of 600 applications")
+
+    # Any window is the merge of its day sketches
+    first, last = date(2026, 3, 8), date(2026, 3, 14)
+    window = [
+        app.final_score for app in db.query(Application).join(JobPosting).filter(JobPosting.category == "backend").all()
+        if first <= app.applied_at.date() <= last
+    ]
+    sketch = window_sketch(db, "category", "backend", "final_score", first, last)
+    assert len(sketch) == len(window)
+    assert list(sketch.percentiles(queries)) == [calculate_percentile(q, window) for q in queries]
+    print(f"  one-week window: {len(window)} scores from {len(stored_sketches(db))} day sketches")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing percentile store\n")
+    test_incremental_store_matches_list_scans()
+    print("\n✅ Percentile store tests passed")
@@ -0,0 +1,215 @@
+"""Test the durable processing queue: claim races, retries, max attempts and stale-claim reclaim."""
+import json
+import sys
+import tempfile
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy.orm import sessionmaker
+
+import application_processing
+from application_processing import (
+    PROCESSING_MAX_ATTEMPTS, PROCESSING_STALE_SECONDS, claim_next_task, enqueue_application, process_task, run_worker
+)
+from database import Base, create_db_engine
+from extraction_pool import ExtractionError
+from models import User, JobPosting, Application, ProcessingTask
+from score_index import clear_score_indexes
+
+SAMPLE_RESUME = """
+Jane Doe
+Backend engineer with 4 years of experience.
+Skills: Python, Docker, SQL, Kubernetes
+Master of Science in Computer Science
+"""
+
+CLAIMING_THREADS = 6
+
+
+def make_queue(directory, num_tasks):
+    """File database with one job and num_tasks queued applications."""
+    clear_score_indexes()
+    engine = create_db_engine(f"sqlite:///{directory}/queue.db")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with Session() as db:
+        db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+        db.add(User(id=2, email="c@example.com", password_hash="x", full_name="C", role="candidate"))
+        db.add(JobPosting(id=1, recruiter_id=1, title="Job", description="d", category="backend",
+                          required_skills=json.dumps(["Python"]), preferred_skills=json.dumps(["Docker"]),
+                          min_experience=0))
+        for i in range(num_tasks):
+            application = Application(job_id=1, candidate_id=2, resume_file_path=f"r{i}.pdf", resume_text="",
+                                      processing_status="processing")
+            db.add(application)
+            db.flush()
+            enqueue_application(db, application)
+        db.commit()
+    return engine, Session
+
+
+def patch_extraction(fn):
+    """Replace the worker's text extraction; returns the original."""
+    original = application_processing.extract_resume_file
+    application_processing.extract_resume_file = fn
+    return original
+
+
+def test_claim_race():
+    """Test that concurrent workers claim every task exactly once."""
+    with tempfile.TemporaryDirectory() as directory:
+        engine, Session = make_queue(directory, 60)
+        claims = []
+        claims_lock = threading.Lock()
+        start = threading.Barrier(CLAIMING_THREADS)
+
+        def claim_until_empty():
+            start.wait()
+            while True:
+                with Session() as db:
+                    task = claim_next_task(db)
+                    if task is None:
+                        return
+                    with claims_lock:
+                        claims.append(task.id)
+
+        threads = [threading.Thread(target=claim_until_empty) for _ in range(CLAIMING_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        counts = Counter(claims)
+        assert len(counts) == 60 and set(counts.values()) == {1}, counts.most_common(3)
+        with Session() as db:
+            tasks = db.query(ProcessingTask).all()
+            assert {task.status for task in tasks} == {"running"}
+            assert {task.attempts for task in tasks} == {1}
+            assert all(task.locked_at is not None for task in tasks)
+        engine.dispose()
+    print(f"  {CLAIMING_THREADS} workers claimed 60 tasks, each exactly once")
+
+
+def test_stale_claim_reclaim():
+    """Test that a running task is only reclaimed once its claim is stale."""
+    with tempfile.TemporaryDirectory() as directory:
+        engine, Session = make_queue(directory, 2)
+        with Session() as db, Session() as other:
+            first = claim_next_task(db)
+            # A fresh claim is skipped: the other worker gets the next task, then nothing
+            assert claim_next_task(other).id == first.id + 1
+            assert claim_next_task(other) is None
+
+            # The first worker died; its claim goes stale
+            stale = datetime.utcnow() - timedelta(seconds=PROCESSING_STALE_SECONDS + 1)
+            db.query(ProcessingTask).filter(ProcessingTask.id == first.id).update({ProcessingTask.locked_at: stale})
+            db.commit()
+            reclaimed = claim_next_task(other)
+            assert reclaimed.id == first.id and reclaimed.attempts == 2
+            assert reclaimed.locked_at > stale
+
+            # A task whose workers kept dying is failed instead of being run again
+            other.query(ProcessingTask).filter(ProcessingTask.id == first.id).update(
+                {ProcessingTask.attempts: PROCESSING_MAX_ATTEMPTS + 1}
+            )
+            other.commit()
+            reclaimed = other.get(ProcessingTask, first.id)
+            process_task(other, reclaimed)
+            application = other.get(Application, reclaimed.application_id)
+            assert reclaimed.status == "failed" and application.processing_status == "failed"
+            assert "did not finish" in application.processing_error
+        engine.dispose()
+    print("  stale claims are reclaimed, then failed after too many attempts")
+
+
+def test_retries_and_failures():
+    """Test retry on errors, failure after PROCESSING_MAX_ATTEMPTS and no retry on extraction limits."""
+    calls = []
+
+    def failing_extraction(path):
+        calls.append(path)
+        raise RuntimeError("parser crashed")
+
+    original = patch_extraction(failing_extraction)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            engine, Session = make_queue(directory, 2)
+            with Session() as db:
+                for attempt in range(1, PROCESSING_MAX_ATTEMPTS + 1):
+                    task = claim_next_task(db)
+                    assert task.application_id == 1 and task.attempts == attempt
+                    process_task(db, task)
+                    assert "parser crashed" in task.last_error
+                    expected = "failed" if attempt == PROCESSING_MAX_ATTEMPTS else "queued"
+                    assert task.status == expected, (attempt, task.status)
+                application = db.get(Application, 1)
+                assert application.processing_status == "failed"
+                assert application.processing_error == "Error processing resume: parser crashed"
+                assert len(calls) == PROCESSING_MAX_ATTEMPTS
+
+                # Limits hit by the extraction workers fail the task on the first attempt
+                def too_slow(path):
+                    raise ExtractionError("timeout", "Resume parsing took too long")
+
+                patch_extraction(too_slow)
+                task = claim_next_task(db)
+                process_task(db, task)
+                assert task.status == "failed" and task.attempts == 1
+                assert db.get(Application, 2).processing_error == "timeout: Resume parsing took too long"
+                assert claim_next_task(db) is None
+            engine.dispose()
+    finally:
+        patch_extraction(original)
+    print(f"  errors are retried {PROCESSING_MAX_ATTEMPTS} times; extraction limits fail at once")
+
+
+def test_workers_drain_queue():
+    """Test run_worker threads finishing every queued application."""
+    original = patch_extraction(lambda path: SAMPLE_RESUME)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            engine, Session = make_queue(directory, 8)
+            stop = threading.Event()
+            workers = [
+                threading.Thread(target=run_worker, args=(Session,), kwargs={"poll_interval": 0.05, "stop_event": stop})
+                for _ in range(3)
+            ]
+            for worker in workers:
+                worker.start()
+            try:
+                for _ in range(400):
+                    with Session() as db:
+                        if db.query(ProcessingTask).filter(ProcessingTask.status != "done").count() == 0:
+                            break
+                    stop.wait(0.05)
+            finally:
+                stop.set()
+                for worker in workers:
+                    worker.join()
+
+            with Session() as db:
+                assert {task.status for task in db.query(ProcessingTask)} == {"done"}
+                applications = db.query(Application).all()
+                assert {application.processing_status for application in applications} == {"completed"}
+                assert all(application.final_score is not None for application in applications)
+                assert all("Python" in json.loads(application.extracted_skills) for application in applications)
+            engine.dispose()
+    finally:
+        patch_extraction(original)
+        clear_score_indexes()
+    print("  3 workers finished 8 queued applications")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing processing queue\n")
+    test_claim_race()
+    test_stale_claim_reclaim()
+    test_retries_and_failures()
+    test_workers_drain_queue()
+    print("\n✅ Processing queue tests passed")
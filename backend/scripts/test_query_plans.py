@@ -0,0 +1,111 @@
+"""Test that the hot router queries use indexes (EXPLAIN QUERY PLAN, no full table scans)."""
+import json
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from fastapi import HTTPException
+
+from models import User, JobPosting, Application, ApplicationResume
+from routers.applications import (
+    _encode_cursor, _get_open_job_for_candidate, get_application_details,
+    get_application_page_for_job, get_applications_for_job, get_my_applications
+)
+from routers.jobs import get_job_by_id, get_jobs
+from db_test_utils import capture_queries, make_session
+
+# Tables that grow with usage; a plain "SCAN <table>" over one fails the test
+LARGE_TABLES = ("applications", "job_postings", "users", "application_resumes")
+
+
+def full_scans(engine, queries):
+    """
+    EXPLAIN QUERY PLAN every captured query.
+
+    Returns:
+        List of (plan detail, statement) for full scans of LARGE_TABLES
+    """
+    scans = []
+    with engine.connect() as conn:
+        for statement, parameters in queries:
+            for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all():
+                detail = row[-1]
+                words = detail.split()
+                # "SCAN applications" reads every row; "SCAN applications USING
+                # [COVERING] INDEX ..." walks an index instead
+                if words[:1] == ["SCAN"] and words[1] in LARGE_TABLES and "USING" not in words:
+                    scans.append((detail, statement))
+    return scans
+
+
+def seed_session():
+    """Three recruiters' jobs with applications from many candidates."""
+    engine, db = make_session()
+
+    for user_id in range(1, 104):
+        db.add(User(id=user_id, email=f"u{user_id}@example.com", password_hash="x", full_name=f"U{user_id}",
+                    role="recruiter" if user_id <= 3 else "candidate"))
+    for job_id in range(1, 31):
+        db.add(JobPosting(id=job_id, recruiter_id=job_id % 3 + 1, title=f"Job {job_id}", description="d",
+                          category="backend", required_skills=json.dumps([]), preferred_skills=json.dumps([]),
+                          min_experience=0, status="closed" if job_id % 5 == 0 else "active"))
+    db.flush()
+    db.bulk_insert_mappings(Application, [
+        {"job_id": job_id, "candidate_id": candidate_id, "resume_file_path": "r.pdf",
+         "final_score": float((job_id * candidate_id) % 100), "status": "pending"}
+        for job_id in range(1, 31) for candidate_id in range(4, 104, job_id % 4 + 1)
+    ])
+    db.execute(ApplicationResume.__table__.insert().from_select(
+        ["application_id", "resume_text"], db.query(Application.id, Application.resume_file_path)
+    ))
+    db.commit()
+    return engine, db
+
+
+def test_hot_queries_use_indexes():
+    """Test the job board, dashboards, listings and duplicate check against full scans."""
+    engine, db = seed_session()
+    recruiter = db.get(User, 2)
+    candidate = db.get(User, 10)
+    application = db.query(Application).filter(Application.job_id == 4).first()
+
+    with capture_queries(engine) as queries:
+        get_jobs(status_filter="active", current_user=candidate, db=db)
+        get_jobs(status_filter="closed", current_user=recruiter, db=db)
+        get_job_by_id(job_id=4, current_user=recruiter, db=db)
+        get_my_applications(current_user=candidate, db=db)
+        get_applications_for_job(job_id=4, current_user=recruiter, db=db)
+        get_application_details(application_id=application.id, current_user=recruiter, db=db)
+        get_application_page_for_job(
+            job_id=4, limit=20, cursor=_encode_cursor(50.0, 60), fields="final_score,resume_text",
+            status_filter="pending", cluster_id=None, meets_requirements=None, min_score=10, max_score=None,
+            min_percentile=None, max_percentile=90, current_user=recruiter, db=db
+        )
+        try:
+            _get_open_job_for_candidate(db, job_id=4, candidate_id=10)
+        except HTTPException:
+            pass
+
+    scans = full_scans(engine, queries)
+    for detail, statement in scans:
+        print(f"  {detail}:\n{statement}\n")
+    print(f"  {len(queries)} queries explained, {len(scans)} full scans")
+    assert not scans
+
+
+def test_harness_reports_full_scans():
+    """Test that an unindexed filter is reported."""
+    engine, db = seed_session()
+    with capture_queries(engine) as queries:
+        db.query(Application.id).filter(Application.cluster_id == 1).all()
+    assert [detail for detail, _ in full_scans(engine, queries)] == ["SCAN applications"]
+
+
+if __name__ == "__main__":
+    print("🧪 Testing query plans\n")
+    test_hot_queries_use_indexes()
+    test_harness_reports_full_scans()
+    print("\n✅ Query plan tests passed")
@@ -0,0 +1,101 @@
+"""Test batch resume processing on a shared process pool and the reprocessing script."""
+import json
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import User, JobPosting, Application, ApplicationResume, ApplicationSkill
+from ml_integration.extract_skills import process_resume, process_resumes, resume_process_pool
+from percentile_store import rebuild_score_distributions
+from reprocess_resumes import reprocess_applications
+from score_index import clear_score_indexes
+from skill_index import sync_skills
+
+RESUMES = [
+    "Backend engineer with 4 years of experience. Skills: Python, Docker, SQL. Master of Science",
+    "Frontend developer, 2 years of experience with React, TypeScript and CSS. Bachelor of Arts",
+    "Team lead with 9 years of experience in Java, Kubernetes and AWS. PhD in Computer Science",
+    "Data analyst: SQL, Excel, Tableau. 1 year of experience.",
+    "",
+]
+
+
+def make_session():
+    """In-memory database with one job and an application per resume, all with stale fields."""
+    clear_score_indexes()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    sync_skills(db)
+    db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+    db.add(User(id=2, email="c@example.com", password_hash="x", full_name="C", role="candidate"))
+    db.add(JobPosting(id=1, recruiter_id=1, title="Job", description="d", category="backend",
+                      required_skills=json.dumps(["Python"]), preferred_skills=json.dumps(["Docker", "SQL"]),
+                      min_experience=0))
+    for i, text in enumerate(RESUMES):
+        db.add(Application(id=i + 1, job_id=1, candidate_id=2, resume_file_path=f"r{i}.pdf",
+                           extracted_skills=json.dumps(["Cobol"]), matched_skills=json.dumps(["Cobol"]),
+                           final_score=1.0, processing_status="completed"))
+        db.add(ApplicationResume(application_id=i + 1, resume_text=text))
+    db.flush()
+    rebuild_score_distributions(db)
+    db.commit()
+    return db
+
+
+def test_process_resumes_matches_serial():
+    """Test that pooled results equal process_resume's, in input order, on a pool reused across calls."""
+    texts = RESUMES * 3
+    expected = [process_resume(text) for text in texts]
+
+    with resume_process_pool(2) as pool:
+        assert process_resumes(texts, workers=2, executor=pool) == expected
+        assert process_resumes(texts[:4], workers=2, chunksize=1, executor=pool) == expected[:4]
+        # The caller's pool is left running for the next batch
+        assert pool.submit(len, "still running").result() == 13
+
+    assert process_resumes(texts, workers=1) == expected
+    assert process_resumes(texts, workers=2) == expected
+    print(f"  {len(texts)} resumes: pooled results match serial ones, pool reused across calls")
+
+
+def test_reprocess_rescores():
+    """Test that reprocessing refreshes extraction, skill links and the scores derived from them."""
+    for workers in (1, 2):
+        db = make_session()
+        if workers == 1:
+            counts = reprocess_applications(db, chunk_size=2, workers=1)
+        else:
+            with resume_process_pool(2) as pool:
+                counts = reprocess_applications(db, chunk_size=2, workers=2, executor=pool)
+        assert counts == {"reprocessed": len(RESUMES), "rescored": len(RESUMES)}, counts
+
+        applications = db.query(Application).order_by(Application.id).all()
+        for application, text in zip(applications, RESUMES):
+            skills = process_resume(text)["extracted_skills"]
+            assert json.loads(application.extracted_skills) == skills
+            # Scores and matches are no longer those of the stale "Cobol" extraction
+            assert "Cobol" not in json.loads(application.matched_skills)
+            assert application.final_score != 1.0 and application.scoring_version == 1
+        assert "Python" in json.loads(applications[0].matched_skills)
+        assert db.query(ApplicationSkill).filter(ApplicationSkill.application_id == 1).count() == len(
+            json.loads(applications[0].extracted_skills)
+        )
+        db.close()
+    clear_score_indexes()
+    print("  reprocessing rewrites extraction and re-scores every job, serially and on a shared pool")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing resume reprocessing\n")
+    test_process_resumes_matches_serial()
+    test_reprocess_rescores()
+    print("\n✅ Resume reprocessing tests passed")
@@ -0,0 +1,267 @@
+"""Test bulk re-scoring of a job's applications after a job update."""
+import json
+import random
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import User, JobPosting, Application, ScoreHistogramBucket
+import rescoring
+from routers.applications import _store_application
+from rescoring import rescore_job_applications, rescore_job_in_background
+from percentile_store import rebuild_score_distributions
+from ml_integration.job_profile import get_job_profile
+from ml_integration.pipeline import score_resume_for_job
+from ml_integration.scoring import calculate_final_score, calculate_percentile
+from ml_integration.skill_gap import analyze_skill_gap
+from ml_integration.skills_database import normalize_skill
+
+SKILLS = ['Python', 'JavaScript', 'React', 'SQL', 'Docker', 'AWS', 'Go', 'Java', 'Kubernetes', 'Git']
+EDUCATION = ["PhD", "Master's", "Bachelor's", "Diploma", "Not Specified"]
+
+
+def make_session():
+    """Fresh in-memory database (configured like database.SessionLocal)."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+
+def seed(db, num_applications, seed=11):
+    """One recruiter, two jobs in the same category, random applications on both."""
+    rng = random.Random(seed)
+    db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+    for job_id in (1, 2):
+        db.add(JobPosting(
+            id=job_id, recruiter_id=1, title=f"Job {job_id}", description="d", category="backend",
+            required_skills=json.dumps(["Python"]), preferred_skills=json.dumps(["Docker", "AWS"]),
+            min_experience=1, requirements=json.dumps({"min_education": "none"})
+        ))
+    db.bulk_insert_mappings(Application, [{
+        "job_id": 1 if i % 4 else 2,
+        "candidate_id": 1,
+        "resume_file_path": f"r{i}.pdf",
+        "extracted_skills": json.dumps(rng.sample(SKILLS, rng.randint(1, len(SKILLS)))),
+        "experience_years": round(rng.uniform(0, 15), 1),
+        "education_level": rng.choice(EDUCATION),
+        "has_certifications": rng.random() < 0.4,
+        "has_leadership": rng.random() < 0.4,
+        "skill_diversity": rng.random(),
+        "final_score": round(rng.uniform(0, 100), 2),
+        "skills_score": round(rng.uniform(0, 100), 2),
+        "experience_score": 70.0,
+        "education_score": 70.0,
+    } for i in range(num_applications)])
+    rebuild_score_distributions(db)
+    db.commit()
+
+
+def test_rescore_after_job_update():
+    """Test that stored scores match scalar scoring against the updated job."""
+    print("🧪 Testing bulk re-scoring\n")
+    db = make_session()
+    seed(db, 20000)
+
+    job = db.get(JobPosting, 1)
+    job.required_skills = json.dumps(["Python", "SQL"])
+    job.min_experience = 3
+    job.weight_skills, job.weight_experience = 0.3, 0.4
+    job.scoring_version = 2
+    db.commit()
+
+    result = rescore_job_applications(db, job, chunk_size=4000)
+    print(f"  {result}")
+    assert result["rescored"] == 15000 and not result["superseded"]
+
+    kwargs = get_job_profile(job).scoring_kwargs()
+    applications = db.query(Application).filter(Application.job_id == 1).all()
+    for app in applications:
+        expected = calculate_final_score(
+            candidate_skills=json.loads(app.extracted_skills),
+            candidate_experience=app.experience_years,
+            candidate_education=app.education_level,
+            candidate_has_certifications=app.has_certifications,
+            candidate_has_leadership=app.has_leadership,
+            candidate_skill_diversity=app.skill_diversity,
+            **kwargs
+        )
+        assert app.scoring_version == 2
+        assert app.meets_requirements == expected["meets_requirements"]
+        assert json.loads(app.missing_requirements) == expected["missing_requirements"]
+        for field in ["final_score", "skills_score", "experience_score", "education_score", "bonus_score"]:
+            assert getattr(app, field) == expected[field], (app.id, field)
+
+    # Spot-check percentiles against the scalar helper: like a submission,
+    # each application is ranked against the pool without itself
+    def without(pool, score):
+        pool = list(pool)
+        if score in pool:
+            pool.remove(score)
+        return pool
+
+    all_scores = [s for (s,) in db.query(Application.final_score).all() if s]
+    category_scores = [s for (s,) in db.query(Application.final_score).all()]
+    skills_scores = [s for (s,) in db.query(Application.skills_score).all() if s]
+    for app in applications[:50]:
+        assert app.overall_percentile == calculate_percentile(app.final_score, without(all_scores, app.final_score))
+        assert app.category_percentile == calculate_percentile(
+            app.final_score, without(category_scores, app.final_score)
+        )
+        assert app.skills_percentile == calculate_percentile(app.skills_score, without(skills_scores, app.skills_score))
+
+    # The stored distributions now match the applications table
+    stored = sorted(db.query(ScoreHistogramBucket.scope, ScoreHistogramBucket.scope_key, ScoreHistogramBucket.field,
+                             ScoreHistogramBucket.bucket, ScoreHistogramBucket.count).all())
+    rebuild_score_distributions(db)
+    assert stored == sorted(db.query(ScoreHistogramBucket.scope, ScoreHistogramBucket.scope_key,
+                                     ScoreHistogramBucket.field, ScoreHistogramBucket.bucket,
+                                     ScoreHistogramBucket.count).all())
+    db.rollback()
+
+    # The other job's applications are untouched
+    assert db.query(Application).filter(Application.job_id == 2, Application.scoring_version == 2).count() == 0
+    print(f"  {len(applications)} applications match scalar scoring\n")
+
+
+def test_superseded_rescore_is_discarded():
+    """Test that a re-score for an outdated scoring_version doesn't write."""
+    db = make_session()
+    seed(db, 100)
+
+    job = db.get(JobPosting, 1)
+    job.scoring_version = 3
+    db.commit()
+
+    # Simulate a newer update committed by another request mid-way
+    job.scoring_version = 2
+    result = rescore_job_applications(db, job)
+    assert result["superseded"]
+    assert db.query(Application).filter(Application.scoring_version == 2).count() == 0
+
+
+def test_generated_applications_match_normalized():
+    """Test that generate-random's applications are re-matched on normalize_skill forms, uploads raw."""
+    db = make_session()
+    db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+    job = JobPosting(id=1, recruiter_id=1, title="Job", description="d", category="frontend",
+                     required_skills=json.dumps(["NodeJS", "React"]), preferred_skills=json.dumps(["Vue JS"]),
+                     min_experience=0, scoring_version=2)
+    db.add(job)
+    skills = ["Node.js", "React", "Vue.js"]
+    # The upload's file name looks like generated data; only the flag counts
+    for app_id, is_generated in [(1, True), (2, False)]:
+        db.add(Application(id=app_id, job_id=1, candidate_id=1, resume_file_path="test_resume_1_1.txt",
+                           is_generated=is_generated,
+                           extracted_skills=json.dumps(skills), experience_years=3.0, education_level="Bachelor's",
+                           has_certifications=False, has_leadership=False, skill_diversity=0.5, final_score=0.0))
+    rebuild_score_distributions(db)
+    db.commit()
+
+    assert rescore_job_applications(db, job)["rescored"] == 2
+    generated, uploaded = db.get(Application, 1), db.get(Application, 2)
+
+    # Scored exactly like generate_random_applications scores them
+    normalized_skills = [normalize_skill(s) for s in skills]
+    kwargs = get_job_profile(job).scoring_kwargs(normalized=True)
+    expected = calculate_final_score(
+        candidate_skills=normalized_skills, candidate_experience=3.0, candidate_education="Bachelor's",
+        candidate_has_certifications=False, candidate_has_leadership=False, candidate_skill_diversity=0.5, **kwargs
+    )
+    gap = analyze_skill_gap(normalized_skills, kwargs["job_required_skills"], kwargs["job_preferred_skills"])
+    assert generated.meets_requirements and expected["meets_requirements"]
+    assert generated.final_score == expected["final_score"] and generated.bonus_score == expected["bonus_score"]
+    assert json.loads(generated.matched_skills) == gap["matched_skills"] == ["nodejs", "react", "vuejs"]
+
+    # Uploads were scored on raw names: "Node.js" doesn't match "NodeJS"
+    assert not uploaded.meets_requirements and uploaded.final_score == 0.0
+    assert json.loads(uploaded.missing_requirements) == ["Missing required skills: nodejs"]
+    print("  generate-random applications keep normalized matching, uploads raw")
+
+
+def test_rescore_keeps_submitted_percentiles():
+    """Test that re-scoring an unchanged job reproduces the percentiles stored at submission."""
+    db = make_session()
+    db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+    job = JobPosting(id=1, recruiter_id=1, title="Job", description="d", category="backend",
+                     required_skills=json.dumps(["Python"]), preferred_skills=json.dumps(["Docker", "SQL"]),
+                     min_experience=2)
+    db.add(job)
+    db.commit()
+
+    resumes = [
+        f"Backend developer, {years} years of experience. Skills: {skills}. {degree}"
+        for years, skills, degree in [
+            (5, "Python, Docker, SQL", "Master of Science"), (3, "Python, Docker", "Bachelor of Science"),
+            (1, "Python", "Diploma"), (8, "Java, Go", "PhD"), (4, "Python, SQL, Kubernetes", "Bachelor of Arts"),
+            (4, "Python, SQL, Kubernetes", "Bachelor of Arts"),
+        ]
+    ]
+    for i, text in enumerate(resumes):
+        _store_application(db, job, 1, Path(f"cv{i}.pdf"), score_resume_for_job(text, get_job_profile(job)))
+
+    # The last submission was ranked against every other application
+    fields = ["overall_percentile", "category_percentile", "skills_percentile",
+              "experience_percentile", "education_percentile"]
+    last = db.query(Application).order_by(Application.id.desc()).first()
+    submitted = {field: getattr(last, field) for field in fields}
+
+    job.scoring_version = 2
+    db.commit()
+    assert rescore_job_applications(db, job)["rescored"] == len(resumes)
+    db.refresh(last)
+    assert {field: getattr(last, field) for field in fields} == submitted, submitted
+    print(f"  re-scored percentiles match the submission's: {submitted['overall_percentile']}")
+
+
+def test_background_rescore_retries():
+    """Test that a failing background re-score is retried, then given up on."""
+    db = make_session()
+    seed(db, 50)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=db.get_bind())
+    db.get(JobPosting, 1).scoring_version = 2
+    db.commit()
+
+    original = rescoring.rescore_job_applications, rescoring.RESCORE_RETRY_SECONDS
+    rescoring.RESCORE_RETRY_SECONDS = 0
+    calls = []
+
+    def flaky(session, job, *args, **kwargs):
+        calls.append(job.id)
+        if len(calls) < rescoring.RESCORE_MAX_ATTEMPTS:
+            raise RuntimeError("database is locked")
+        return original[0](session, job, *args, **kwargs)
+
+    def broken(session, job, *args, **kwargs):
+        calls.append(job.id)
+        raise RuntimeError("database is locked")
+
+    try:
+        rescoring.rescore_job_applications = flaky
+        result = rescore_job_in_background(1, session_factory=Session)
+        assert len(calls) == rescoring.RESCORE_MAX_ATTEMPTS and result["rescored"] == 37
+        assert db.query(Application).filter(Application.scoring_version == 2).count() == 37
+
+        calls.clear()
+        rescoring.rescore_job_applications = broken
+        assert rescore_job_in_background(2, session_factory=Session) is None
+        assert len(calls) == rescoring.RESCORE_MAX_ATTEMPTS
+        assert rescore_job_in_background(99, session_factory=Session) is None
+    finally:
+        rescoring.rescore_job_applications, rescoring.RESCORE_RETRY_SECONDS = original
+    print(f"  failed background re-scores are retried {rescoring.RESCORE_MAX_ATTEMPTS} times")
+
+
+if __name__ == "__main__":
+    test_rescore_after_job_update()
+    test_superseded_rescore_is_discarded()
+    test_generated_applications_match_normalized()
+    test_rescore_keeps_submitted_percentiles()
+    test_background_rescore_retries()
+    print("✅ Re-scoring tests passed")
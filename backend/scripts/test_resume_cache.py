@@ -0,0 +1,142 @@
+"""Test the two-tier resume cache: hits, misses, LRU eviction, fallthrough and disk pruning."""
+import asyncio
+import sqlite3
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import ml_executor
+import ml_integration.resume_cache as resume_cache
+from ml_executor import BoundedExecutor, process_resume_on_executor
+from ml_integration.resume_cache import ResumeCache, process_resume_cached, resume_cache_key
+
+SAMPLE_RESUME = """
+John Doe
+Senior Python developer with 5 years of experience.
+Skills: Python, Docker, Kubernetes, PostgreSQL, React
+Bachelor of Science in Computer Science
+"""
+
+
+def disk_rows(db_path):
+    """Keys stored in the SQLite tier."""
+    with sqlite3.connect(db_path) as conn:
+        return {row[0] for row in conn.execute("SELECT cache_key FROM resume_cache")}
+
+
+def test_memory_tier():
+    """Test hits, misses, LRU order and eviction of the in-memory tier."""
+    cache = ResumeCache(max_entries=2)
+    assert cache.get("a") is None
+    cache.put("a", {"skills": ["Python"]})
+    cache.put("b", {"skills": ["Docker"]})
+
+    # Results are copies: callers can't corrupt the cached entry
+    result = cache.get("a")
+    result["skills"].append("Mutated")
+    assert cache.get("a") == {"skills": ["Python"]}
+
+    # "a" was used last, so adding "c" evicts "b"
+    cache.put("c", {"skills": []})
+    assert cache.get("b") is None and cache.get("a") is not None
+
+    stats = cache.stats()
+    assert stats["memory_hits"] == 3 and stats["misses"] == 2 and stats["evictions"] == 1
+    assert stats["hits"] == 3 and stats["memory_entries"] == 2 and stats["disk_hits"] == 0
+    print(f"  memory tier: {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} eviction")
+
+
+def test_disk_fallthrough():
+    """Test that entries evicted from memory (or written by another process) are served from SQLite."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "cache.db"
+        cache = ResumeCache(db_path=str(db_path), max_entries=1)
+        cache.put("a", {"skills": ["Python"]})
+        cache.put("b", {"skills": ["Docker"]})
+
+        # "a" fell out of memory but is still on disk; the hit promotes it
+        assert cache.get("a") == {"skills": ["Python"]}
+        assert cache.stats()["disk_hits"] == 1
+        assert cache.get("a") == {"skills": ["Python"]}
+        assert cache.stats()["memory_hits"] == 1
+
+        # A second process sees the first one's entries through the shared file
+        other = ResumeCache(db_path=str(db_path), max_entries=1)
+        assert other.get("b") == {"skills": ["Docker"]} and other.stats()["disk_hits"] == 1
+
+        cache.clear()
+        assert cache.get("a") is None and disk_rows(db_path) == set()
+    print("  memory misses fall through to the SQLite tier")
+
+
+def test_disk_pruning():
+    """Test the row cap and the age limit of the SQLite tier."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "cache.db"
+        cache = ResumeCache(db_path=str(db_path), max_entries=1, max_disk_entries=5, prune_every=4)
+        for i in range(8):
+            cache.put(f"k{i}", {"i": i})
+        # Pruned after the 4th (nothing over the cap) and the 8th write
+        assert disk_rows(db_path) == {f"k{i}" for i in range(3, 8)}
+        assert cache.stats()["disk_evictions"] == 3 and cache.prune() == 0
+        assert cache.get("k7") == {"i": 7} and cache.get("k0") is None
+
+        # Rows older than max_disk_age_days are dropped when the cache is opened
+        old = (datetime.utcnow() - timedelta(days=100)).isoformat()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE resume_cache SET created_at = ? WHERE cache_key IN ('k3', 'k4')", (old,))
+        reopened = ResumeCache(db_path=str(db_path), max_disk_entries=5, max_disk_age_days=90)
+        assert disk_rows(db_path) == {"k5", "k6", "k7"}
+        assert reopened.stats()["disk_evictions"] == 2 and reopened.get("k3") is None
+    print("  SQLite tier is capped by row count and age")
+
+
+def test_process_resume_cached():
+    """Test that the memoized process_resume runs NLP once per text and version."""
+    original = resume_cache._resume_cache
+    resume_cache._resume_cache = ResumeCache(max_entries=8)
+    try:
+        first = process_resume_cached(SAMPLE_RESUME)
+        second = process_resume_cached(SAMPLE_RESUME)
+        assert first == second and "Python" in first["extracted_skills"]
+        stats = resume_cache.get_resume_cache().stats()
+        assert stats["misses"] == 1 and stats["memory_hits"] == 1
+        assert resume_cache_key(SAMPLE_RESUME) != resume_cache_key(SAMPLE_RESUME + " ")
+    finally:
+        resume_cache._resume_cache = original
+    print(f"  process_resume ran once for two identical submissions ({len(first['extracted_skills'])} skills)")
+
+
+def test_cache_in_front_of_process_pool():
+    """Test that async endpoints hit the API process's cache and only send misses to the pool."""
+    original_cache, original_executor = resume_cache._resume_cache, ml_executor.ml_executor
+    resume_cache._resume_cache = ResumeCache(max_entries=8)
+    ml_executor.ml_executor = BoundedExecutor(max_workers=1, max_queue=1, kind="process")
+    try:
+        async def analyze_twice():
+            return [await process_resume_on_executor(SAMPLE_RESUME) for _ in range(2)]
+
+        first, second = asyncio.run(analyze_twice())
+        assert first == second and "Python" in first["extracted_skills"]
+        # Counted here, where GET /metrics/resume-cache reads them, not in the worker
+        stats = resume_cache.get_resume_cache().stats()
+        assert stats["misses"] == 1 and stats["memory_hits"] == 1
+    finally:
+        ml_executor.ml_executor.shutdown()
+        resume_cache._resume_cache, ml_executor.ml_executor = original_cache, original_executor
+    print("  process pool misses are cached and counted in the API process")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing resume cache\n")
+    test_memory_tier()
+    test_disk_fallthrough()
+    test_disk_pruning()
+    test_process_resume_cached()
+    test_cache_in_front_of_process_pool()
+    print("\n✅ Resume cache tests passed")
@@ -0,0 +1,139 @@
+"""Test the sorted score indexes used for percentile lookups."""
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import User, JobPosting, Application
+from ml_integration.scoring import calculate_percentile
+from score_index import SortedScoreIndex, clear_score_indexes, get_job_score_index, record_application_scores
+
+
+def test_percentiles_match_calculate_percentile():
+    """Test lookups, include_score and in-place updates against the list scan."""
+    rng = random.Random(3)
+    scores = {i: rng.choice([0.0, round(rng.uniform(0, 100), 2)]) for i in range(2000)}
+    index = SortedScoreIndex(scores)
+
+    queries = [round(rng.uniform(0, 100), 2) for _ in range(200)] + [0.0, 100.0] + list(scores.values())[:50]
+    pool = list(scores.values())
+    assert index.percentiles(queries) == [calculate_percentile(q, pool) for q in queries]
+    assert index.percentile(42.0, include_score=True) == calculate_percentile(42.0, pool + [42.0])
+
+    # Small updates go through insort, large ones re-sort
+    for changes in (
+        {5: 99.5, 6: None, 5000: 12.25},
+        {i: round(rng.uniform(0, 100), 2) for i in range(0, 2000, 3)},
+    ):
+        index.update(changes)
+        for application_id, score in changes.items():
+            if score is None:
+                scores.pop(application_id, None)
+            else:
+                scores[application_id] = score
+        pool = list(scores.values())
+        assert len(index) == len(pool)
+        assert index.percentiles(queries) == [calculate_percentile(q, pool) for q in queries]
+
+    assert SortedScoreIndex({}).percentile(70.0) == 50.0
+    print("  lookups and updates match calculate_percentile")
+
+
+def test_score_bounds_match_percentiles():
+    """Test that score_bounds selects exactly the scores whose percentile is in range."""
+    rng = random.Random(8)
+    for size in (0, 1, 7, 300):
+        index = SortedScoreIndex({i: round(rng.uniform(0, 100), 1) for i in range(size)})
+        candidates = [round(rng.uniform(-1, 101), 1) for _ in range(300)] + list(index._sorted)
+        for min_p, max_p in [(0, 100), (50, 50), (25, 75), (90, 100), (0, 10), (33.3, 33.4), (80, 20)]:
+            expected = {score for score in candidates if min_p <= index.percentile(score) <= max_p}
+            bounds = index.score_bounds(min_p, max_p)
+            if bounds is None:
+                assert not expected, (size, min_p, max_p)
+                continue
+            lower, upper = bounds
+            selected = {
+                score for score in candidates
+                if (lower is None or score > lower) and (upper is None or score <= upper)
+            }
+            assert selected == expected, (size, min_p, max_p)
+    print("  score bounds match percentile filters")
+
+
+def test_indexes_built_from_database():
+    """Test per-job pools and maintenance after a committed change."""
+    clear_score_indexes()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+    rng = random.Random(7)
+    db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+    for job_id, category in [(1, "backend"), (2, "backend"), (3, "frontend")]:
+        db.add(JobPosting(
+            id=job_id, recruiter_id=1, title=f"Job {job_id}", description="d", category=category,
+            required_skills=json.dumps([]), preferred_skills=json.dumps([]), min_experience=0
+        ))
+    db.bulk_insert_mappings(Application, [{
+        "job_id": i % 3 + 1,
+        "candidate_id": 1,
+        "resume_file_path": f"r{i}.pdf",
+        "final_score": None if i % 10 == 0 else round(rng.uniform(0, 100), 2),
+    } for i in range(30000)])
+    db.commit()
+
+    def job_pool(job_id):
+        return [s for (s,) in db.query(Application.final_score).filter(
+            Application.job_id == job_id, Application.final_score.isnot(None)
+        ).all()]
+
+    job_index = get_job_score_index(db, 1)
+    other_index = get_job_score_index(db, 2)
+    assert len(job_index) == len(job_pool(1))
+    assert len(other_index) == len(job_pool(2))
+
+    # A page of 1000 percentiles: list scan per row vs one bisect per row
+    page = job_pool(1)[:1000]
+    started = time.perf_counter()
+    scanned = [calculate_percentile(s, job_pool(1)) for s in page[:50]]
+    scan_seconds = (time.perf_counter() - started) / 50 * len(page)
+    started = time.perf_counter()
+    indexed = job_index.percentiles(page)
+    index_seconds = time.perf_counter() - started
+    assert indexed[:50] == scanned
+    print(f"  1000 percentiles: list scan ~{scan_seconds:.2f}s, index {index_seconds * 1000:.1f}ms")
+
+    # Re-score a few applications and add a new one
+    app_ids = [app_id for (app_id,) in db.query(Application.id).filter(Application.job_id == 1).limit(3).all()]
+    for app_id, score in zip(app_ids, [1.5, 99.9, None]):
+        db.get(Application, app_id).final_score = score
+    new_app = Application(job_id=1, candidate_id=1, resume_file_path="new.pdf", resume_text="", final_score=64.0)
+    db.add(new_app)
+    db.commit()
+    record_application_scores(1, {app_ids[0]: 1.5, app_ids[1]: 99.9, app_ids[2]: None, new_app.id: 64.0})
+
+    pool = job_pool(1)
+    for score in [0.0, 1.5, 50.0, 64.0, 99.9]:
+        assert get_job_score_index(db, 1).percentile(score) == calculate_percentile(score, pool)
+
+    # The other job's index never saw the change
+    assert get_job_score_index(db, 2) is other_index and len(other_index) == len(job_pool(2))
+    clear_score_indexes()
+    print("  database-built indexes stay in sync after changes")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing score indexes\n")
+    test_percentiles_match_calculate_percentile()
+    test_score_bounds_match_percentiles()
+    test_indexes_built_from_database()
+    print("\n✅ Score index tests passed")
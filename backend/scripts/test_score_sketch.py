@@ -0,0 +1,59 @@
+"""Test the mergeable score sketch."""
+import math
+import random
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from ml_integration.scoring import calculate_percentile
+from ml_integration.score_sketch import ScoreSketch
+
+
+def test_sketch_is_exact_for_stored_scores():
+    """Test percentiles, exclude_zero and quantiles against the list scan."""
+    rng = random.Random(1)
+    scores = [0.0] * 300 + [round(rng.uniform(0, 100), 2) for _ in range(20000)]
+    sketch = ScoreSketch.from_scores(scores)
+
+    queries = [0.0, 0.01, 50.0, 100.0] + scores[::997]
+    assert list(sketch.percentiles(queries)) == [calculate_percentile(q, scores) for q in queries]
+    nonzero = [s for s in scores if s]
+    assert list(sketch.percentiles(queries, exclude_zero=True)) == [calculate_percentile(q, nonzero) for q in queries]
+
+    ordered = sorted(scores)
+    for q in (0.01, 0.25, 0.5, 0.9, 1.0):
+        assert sketch.quantile(q) == ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+    assert ScoreSketch().percentile(70.0) == 50.0
+    assert ScoreSketch().quantile(0.5) is None
+    print(f"  {len(scores)} scores in {len(sketch.to_bytes())} bytes, exact ranks")
+
+
+def test_sketches_merge_and_round_trip():
+    """Test that merged day sketches equal the sketch of the union."""
+    rng = random.Random(2)
+    days = [[round(rng.uniform(0, 100), 2) for _ in range(rng.randint(0, 500))] for _ in range(30)]
+
+    merged = ScoreSketch()
+    for day in days:
+        merged.merge(ScoreSketch.from_bytes(ScoreSketch.from_scores(day).to_bytes()))
+
+    union = [s for day in days for s in day]
+    assert merged.counts == ScoreSketch.from_scores(union).counts
+    assert len(merged) == len(union)
+
+    # Removing scores again (re-scores) leaves no empty buckets behind
+    for score in days[0]:
+        merged.add(score, -1)
+    assert merged.counts == ScoreSketch.from_scores(union[len(days[0]):]).counts
+    print("  30 day sketches merge into the sketch of their union")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing score sketches\n")
+    test_sketch_is_exact_for_stored_scores()
+    test_sketches_merge_and_round_trip()
+    print("\n✅ Score sketch tests passed")
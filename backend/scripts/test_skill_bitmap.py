@@ -0,0 +1,304 @@
+"""Test skill bitmaps, the boolean skill query language and ?skill_query= on the applicant page."""
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+import ml_integration.skills_database as skills_database
+from database import Base
+from models import User, JobPosting, Application
+from routers.applications import get_application_page_for_job
+from score_index import clear_score_indexes
+from skill_bitmap import (
+    SKILL_QUERY_MAX_DEPTH, SKILL_QUERY_MAX_LENGTH, SkillQueryError, bitmap_width, build_skill_bitmap_index, decode_skill_bitmap, encode_skill_bitmap,
+    invalidate_skill_bitmaps, parse_skill_query
+)
+from skill_index import application_skill_fields, skill_ids, stored_vocabulary_version, sync_skills
+from ml_integration.skills_database import SKILL_IDS, SKILLS_DATABASE, SkillsRegistry, get_skills_registry
+
+SKILL_POOL = ["Python", "Docker", "Kubernetes", "PHP", "React", "SQL", "AWS", "Machine Learning", "C++", "Node.js"]
+
+QUERIES = [
+    "Python",
+    "Python AND (Docker OR Kubernetes) AND NOT PHP",
+    "python and docker or kubernetes",  # AND binds tighter than OR
+    "NOT (React OR SQL)",
+    'not not "Machine Learning" AND C++',
+    "Machine Learning OR nodejs",
+]
+
+PAGE_PARAMS = dict(
+    cursor=None, fields="id,final_score", status_filter=None, cluster_id=None, meets_requirements=None,
+    min_score=None, max_score=None, min_percentile=None, max_percentile=None, skills=None
+)
+
+
+def brute_force(tree, skills: set) -> bool:
+    """Evaluate a parsed query against one set of 0-based skill bits."""
+    kind = tree[0]
+    if kind == "skill":
+        return tree[1] in skills
+    if kind == "not":
+        return not brute_force(tree[1], skills)
+    children = [brute_force(child, skills) for child in tree[1:]]
+    return all(children) if kind == "and" else any(children)
+
+
+def random_pool(num_applications, rng, pool=SKILL_POOL):
+    """(application id, bitmap) rows and application id -> 0-based skill bits."""
+    rows, bits = [], {}
+    for application_id in range(1, num_applications + 1):
+        ids = skill_ids(rng.sample(pool, rng.randint(0, min(len(pool), 6))))
+        rows.append((application_id, encode_skill_bitmap(ids)))
+        bits[application_id] = {skill_id - 1 for skill_id in ids}
+    return rows, bits
+
+
+def bitmap_rows():
+    """Statement selecting every (application id, stored bitmap)."""
+    return select(Application.id, Application.skill_bitmap).order_by(Application.id)
+
+
+def test_bitmap_encoding():
+    """Test the fixed-width encoding and that short (older) bitmaps still load."""
+    registry = get_skills_registry()
+    ids = [registry.skill_ids[name] for name in ("Python", "Kubernetes", registry.skill_names[-1])]
+    bitmap = encode_skill_bitmap(ids)
+    assert len(bitmap) == bitmap_width() == (max(registry.skill_ids.values()) + 7) // 8
+    assert decode_skill_bitmap(bitmap) == sorted(ids)
+    assert decode_skill_bitmap(None) == []
+
+    index = build_skill_bitmap_index([(1, bitmap), (2, bitmap[:4]), (3, None)])
+    assert index.match("Python").tolist() == [1, 2]
+    assert index.match("Kubernetes").tolist() == [1]
+    assert index.match("NOT Python").tolist() == [3]
+    print(f"  {bitmap_width()}-byte bitmaps for {len(registry.skill_names)} skills")
+
+
+def test_vocabulary_change_keeps_bits():
+    """Test that adding skills keeps every stored bit and that sync_skills re-encodes the bitmaps."""
+    invalidate_skill_bitmaps()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    sync_skills(db)
+    db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+    db.add(User(id=2, email="c@example.com", password_hash="x", full_name="C", role="candidate"))
+    db.add(JobPosting(id=1, recruiter_id=1, title="Job", description="d", category="backend",
+                      required_skills="[]", preferred_skills="[]", min_experience=0))
+    for i, skills in enumerate([["Python", "Made Up"], ["Docker"], ["Made Up"]]):
+        db.add(Application(id=i + 1, job_id=1, candidate_id=2, resume_file_path=f"r{i}.pdf",
+                           extracted_skills=json.dumps(skills), **application_skill_fields(1, skills)))
+    db.commit()
+    old_width = bitmap_width()
+    assert build_skill_bitmap_index(db.execute(bitmap_rows()).all()).match("Python").tolist() == [1]
+
+    # A new skill in front of every other one, with an id past the current width
+    grown = dict(SKILLS_DATABASE, programming_languages=["Made Up"] + SKILLS_DATABASE["programming_languages"])
+    original = skills_database.SKILLS_REGISTRY
+    skills_database.SKILLS_REGISTRY = SkillsRegistry(grown, dict(SKILL_IDS, **{"Made Up": old_width * 8 + 1}))
+    invalidate_skill_bitmaps()
+    try:
+        # Old bitmaps still answer queries on existing skills
+        index = build_skill_bitmap_index(db.execute(bitmap_rows()).all())
+        assert index.match("Python").tolist() == [1] and index.match("Docker").tolist() == [2]
+        assert index.match("Made Up").tolist() == []
+
+        assert sync_skills(db)["applications"] == 3
+        assert stored_vocabulary_version(db) == get_skills_registry().version
+        rows = db.execute(bitmap_rows()).all()
+        assert {len(bitmap) for _, bitmap in rows} == {bitmap_width()} and bitmap_width() == old_width + 1
+        index = build_skill_bitmap_index(rows)
+        assert index.match("Made Up").tolist() == [1, 3]
+        assert index.match("Python AND NOT Made Up").tolist() == []
+        assert index.match("Docker").tolist() == [2]
+    finally:
+        skills_database.SKILLS_REGISTRY = original
+        invalidate_skill_bitmaps()
+    print(f"  bitmaps grew from {old_width} to {old_width + 1} bytes without moving bits")
+
+
+def test_query_parsing():
+    """Test precedence, spellings, quoting and error messages."""
+    ids = get_skills_registry().skill_ids
+    python, docker, php = ids["Python"] - 1, ids["Docker"] - 1, ids["PHP"] - 1
+    assert parse_skill_query("Python OR Docker AND NOT PHP") == (
+        "or", ("skill", python), ("and", ("skill", docker), ("not", ("skill", php)))
+    )
+    assert parse_skill_query("(python OR docker) and not php") == (
+        "and", ("or", ("skill", python), ("skill", docker)), ("not", ("skill", php))
+    )
+    machine_learning = ("skill", ids["Machine Learning"] - 1)
+    assert parse_skill_query("Machine Learning") == parse_skill_query('"machine learning"') == machine_learning
+    assert parse_skill_query("NextJS OR C#")[1] == ("skill", ids["Next.js"] - 1)
+
+    for query, message in [
+        ("", "Empty"), ("Python AND", "end of query"), ("(Python OR Docker", "Missing ')'"),
+        ("Python)", "Unexpected ')'"), ("Cobol OR Python", "Unknown skills: Cobol"),
+        ('"Python', "quote"), ("AND Python", "Unexpected 'AND'"), ("Python (Docker)", "Unexpected '('"),
+    ]:
+        try:
+            parse_skill_query(query)
+            raise AssertionError(f"accepted {query!r}")
+        except SkillQueryError as e:
+            assert message in str(e), (query, str(e))
+    print("  precedence, spellings and errors")
+
+
+def test_query_nesting_limit():
+    """Test that deeply nested queries are rejected instead of exhausting the stack."""
+    python = ("skill", get_skills_registry().skill_id("Python") - 1)
+    depth = SKILL_QUERY_MAX_DEPTH
+    assert parse_skill_query("(" * depth + "Python" + ")" * depth) == python
+    assert parse_skill_query("NOT " * depth + "Python")[0] == "not"
+
+    # Both fit in SKILL_QUERY_MAX_LENGTH; the first used to raise RecursionError
+    for query in ["(" * 245 + "Python" + ")" * 245, "(" * (depth + 1) + "Python" + ")" * (depth + 1),
+                  "NOT " * (depth + 1) + "Python", "(NOT " * 60 + "Python" + ")" * 60]:
+        assert len(query) <= SKILL_QUERY_MAX_LENGTH
+        try:
+            parse_skill_query(query)
+            raise AssertionError(f"accepted {query[:20]!r}...")
+        except SkillQueryError as e:
+            assert "nested deeper" in str(e)
+
+    # AND / OR chains don't nest: one n-ary node however long
+    chain = " AND ".join(["Go"] * 70)
+    assert len(parse_skill_query(chain)) == 71
+    go = get_skills_registry().skill_id("Go")
+    index = build_skill_bitmap_index([(1, encode_skill_bitmap([go])), (2, encode_skill_bitmap([]))])
+    assert index.match(chain).tolist() == [1]
+    print(f"  queries nested deeper than {depth} levels are rejected")
+
+
+def test_bitmap_matches_brute_force():
+    """Test the vectorized evaluation against a per-application evaluation."""
+    rng = random.Random(11)
+    # Sizes around the 64-bit word boundaries
+    for size in (0, 1, 63, 64, 65, 1000):
+        rows, bits = random_pool(size, rng)
+        index = build_skill_bitmap_index(rows)
+        for query in QUERIES:
+            tree = parse_skill_query(query)
+            expected = [application_id for application_id, skills in bits.items() if brute_force(tree, skills)]
+            assert index.match(query).tolist() == expected, (size, query)
+    print(f"  {len(QUERIES)} queries agree with per-application evaluation")
+
+
+def test_filtering_100k_applicants():
+    """Test that a query over 100k applications is evaluated in well under 10ms."""
+    rng = random.Random(2)
+    rows, bits = random_pool(100_000, rng, pool=list(get_skills_registry().skill_names))
+    index = build_skill_bitmap_index(rows)
+    query = QUERIES[1]
+    index.match(query)
+
+    timings = []
+    for _ in range(20):
+        start = time.perf_counter()
+        matched = index.match(query)
+        timings.append(time.perf_counter() - start)
+    median = sorted(timings)[len(timings) // 2]
+
+    tree = parse_skill_query(query)
+    assert len(matched) == sum(brute_force(tree, skills) for skills in bits.values())
+    print(f"  {len(matched)} of 100000 applicants matched in {median * 1000:.2f} ms")
+    assert median < 0.010
+
+
+def test_skill_query_on_application_page():
+    """Test ?skill_query= with pagination and other filters on the recruiter listing."""
+    clear_score_indexes()
+    invalidate_skill_bitmaps()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    rng = random.Random(4)
+
+    db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+    db.add(User(id=2, email="c@example.com", password_hash="x", full_name="C", role="candidate"))
+    for job_id in (1, 2):
+        db.add(JobPosting(id=job_id, recruiter_id=1, title=f"Job {job_id}", description="d", category="backend",
+                          required_skills=json.dumps([]), preferred_skills=json.dumps([]), min_experience=0))
+    skills_by_id = {}
+    for i in range(600):
+        job_id = i % 2 + 1
+        skills = rng.sample(SKILL_POOL, rng.randint(0, 5))
+        application = Application(job_id=job_id, candidate_id=2, resume_file_path=f"r{i}.pdf",
+                                  extracted_skills=json.dumps(skills), **application_skill_fields(job_id, skills),
+                                  final_score=rng.choice([None, round(rng.uniform(0, 100), 1)]),
+                                  status=rng.choice(["pending", "reviewed"]))
+        db.add(application)
+        db.flush()
+        skills_by_id[application.id] = (job_id, application.status, {s - 1 for s in skill_ids(skills)})
+    db.commit()
+    recruiter = db.get(User, 1)
+
+    def page_ids(query, status_filter=None):
+        ids, cursor = [], None
+        while True:
+            page = get_application_page_for_job(
+                job_id=1, limit=40, skill_query=query, current_user=recruiter, db=db,
+                **dict(PAGE_PARAMS, cursor=cursor, status_filter=status_filter)
+            )
+            ids.extend(item["id"] for item in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                return ids
+
+    for query in QUERIES:
+        tree = parse_skill_query(query)
+        for status_filter in (None, "reviewed"):
+            expected = {
+                application_id for application_id, (job_id, status, skills) in skills_by_id.items()
+                if job_id == 1 and brute_force(tree, skills) and status_filter in (None, status)
+            }
+            ids = page_ids(query, status_filter)
+            assert len(ids) == len(set(ids)) and set(ids) == expected, (query, status_filter)
+
+    # Nothing matches: empty page without touching the listing
+    assert page_ids("Python AND NOT Python") == []
+
+    try:
+        get_application_page_for_job(job_id=1, limit=10, skill_query="Python AND", current_user=recruiter, db=db,
+                                     **PAGE_PARAMS)
+        raise AssertionError("invalid query accepted")
+    except HTTPException as e:
+        assert e.status_code == 400 and "end of query" in e.detail
+
+    try:
+        get_application_page_for_job(job_id=1, limit=10, skill_query="(" * 245 + "Python" + ")" * 245,
+                                     current_user=recruiter, db=db, **PAGE_PARAMS)
+        raise AssertionError("deeply nested query accepted")
+    except HTTPException as e:
+        assert e.status_code == 400 and "nested deeper" in e.detail
+
+    # Applications added by this process show up once the job's bitmaps are dropped
+    db.add(Application(job_id=1, candidate_id=2, resume_file_path="new.pdf", final_score=50.0,
+                       extracted_skills=json.dumps(["Rust"]), **application_skill_fields(1, ["Rust"])))
+    db.commit()
+    assert page_ids("Rust") == []
+    invalidate_skill_bitmaps(1)
+    assert len(page_ids("Rust")) == 1
+    print(f"  {len(QUERIES)} skill queries page through the applicant listing")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing skill bitmaps\n")
+    test_bitmap_encoding()
+    test_vocabulary_change_keeps_bits()
+    test_query_parsing()
+    test_query_nesting_limit()
+    test_bitmap_matches_brute_force()
+    test_filtering_100k_applicants()
+    test_skill_query_on_application_page()
+    print("\n✅ Skill bitmap tests passed")
@@ -0,0 +1,61 @@
+"""Test single-pass skill extraction."""
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from ml_integration.extract_skills import extract_skills_from_text
+from ml_integration.skill_matcher import get_skill_matcher
+from ml_integration.skills_database import SKILLS_DATABASE_VERSION
+
+
+def test_special_spellings():
+    """Test skills whose names contain special characters or variants."""
+    print("🧪 Testing special skill spellings\n")
+
+    skills, _ = extract_skills_from_text("Built APIs with NodeJS, NextJS and ASP.NET; fluent in C++ and C#.")
+    print(f"  Extracted: {skills}\n")
+    for expected in ["C++", "C#", "Node.js", "Next.js", "ASP.NET"]:
+        assert expected in skills, f"{expected} not extracted"
+
+
+def test_overlapping_skills():
+    """Test skills that overlap other skills in the text."""
+    print("🧪 Testing overlapping skills\n")
+
+    skills, skills_by_category = extract_skills_from_text(
+        "React Native developer. Unit Testing with SQL Server. Java, not JavaScript-only."
+    )
+    print(f"  Extracted: {skills}")
+    print(f"  Mobile: {skills_by_category['mobile']}\n")
+    for expected in ["React", "React Native", "Unit Testing", "Testing", "SQL", "SQL Server", "Java", "JavaScript"]:
+        assert expected in skills, f"{expected} not extracted"
+    assert "Go" not in skills
+
+
+def test_matcher_speed():
+    """Report extraction time for a long resume."""
+    print(f"⏱️  Skills database version: {SKILLS_DATABASE_VERSION}")
+    matcher = get_skill_matcher()
+    resume = " ".join(matcher.all_skills) * 20
+
+    start = time.perf_counter()
+    for _ in range(50):
+        extract_skills_from_text(resume)
+    elapsed = (time.perf_counter() - start) / 50 * 1000
+    print(f"  {len(resume)} characters: {elapsed:.2f} ms per resume\n")
+
+
+if __name__ == "__main__":
+    try:
+        test_special_spellings()
+        test_overlapping_skills()
+        test_matcher_speed()
+        print("\n✅ All skill extraction tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,208 @@
+"""Test the relational skill tables: ids, ingest, backfill, vocabulary changes, skill filters and counts."""
+import json
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from fastapi import BackgroundTasks, HTTPException
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+import ml_integration.skills_database as skills_database
+from database import Base
+from models import User, JobPosting, Application, ApplicationSkill, JobSkill, Skill
+from schemas import JobPostingUpdate
+from routers.applications import get_application_page_for_job, get_skill_counts_for_job
+from routers.jobs import update_job_posting
+from score_index import clear_score_indexes
+from skill_index import (
+    application_skill_fields, applications_with_skills, backfill_skill_links, job_skill_links, skill_ids,
+    stored_vocabulary_version, sync_skills
+)
+from ml_integration.skills_database import SKILL_IDS, SKILLS_DATABASE, SkillsRegistry, get_skills_registry
+
+SKILL_POOL = ["Python", "Docker", "Kubernetes", "PHP", "React", "SQL", "AWS", "Go", "Rust", "Node.js"]
+
+PAGE_PARAMS = dict(
+    limit=500, cursor=None, fields="id", status_filter=None, cluster_id=None, meets_requirements=None,
+    min_score=None, max_score=None, min_percentile=None, max_percentile=None
+)
+
+
+def make_session(num_applications=400):
+    """Two jobs; applications with random skills, linked at ingest."""
+    clear_score_indexes()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    sync_skills(db)
+    rng = random.Random(5)
+
+    db.add(User(id=1, email="r@example.com", password_hash="x", full_name="R", role="recruiter"))
+    db.add(User(id=2, email="c@example.com", password_hash="x", full_name="C", role="candidate"))
+    for job_id, required, preferred in [(1, ["python", "Docker"], ["Kubernetes", "Made Up"]), (2, ["PHP"], [])]:
+        db.add(JobPosting(id=job_id, recruiter_id=1, title=f"Job {job_id}", description="d", category="backend",
+                          required_skills=json.dumps(required), preferred_skills=json.dumps(preferred),
+                          skill_links=job_skill_links(required, preferred), min_experience=0))
+    for i in range(num_applications):
+        job_id = i % 2 + 1
+        skills = rng.sample(SKILL_POOL, rng.randint(0, 5))
+        db.add(Application(job_id=job_id, candidate_id=2, resume_file_path=f"r{i}.pdf",
+                           extracted_skills=json.dumps(skills), **application_skill_fields(job_id, skills),
+                           final_score=round(rng.uniform(0, 100), 1)))
+    db.commit()
+    return engine, db
+
+
+def json_skills(db, job_id):
+    """Application id -> lower-cased extracted skills, from the JSON column."""
+    return {
+        row.id: {skill.lower() for skill in json.loads(row.extracted_skills)}
+        for row in db.execute(select(Application.id, Application.extracted_skills).where(Application.job_id == job_id))
+    }
+
+
+def link_rows(db):
+    """All link rows, for comparing ingest with backfill."""
+    return (
+        sorted(db.execute(select(ApplicationSkill.application_id, ApplicationSkill.skill_id, ApplicationSkill.job_id))),
+        sorted(db.execute(select(JobSkill.job_id, JobSkill.skill_id, JobSkill.kind))),
+    )
+
+
+def test_skill_ids():
+    """Test that every canonical skill has one id and spellings resolve to it."""
+    registry = get_skills_registry()
+    assert len(set(registry.skill_ids.values())) == len(registry.skill_names)
+    assert sorted(registry.skill_ids.values()) == list(range(1, len(registry.skill_names) + 1))
+    assert registry.skill_id("nodejs") == registry.skill_id("Node.js") == registry.skill_ids["Node.js"]
+    # Listed under two categories, one id
+    assert registry.all_skills.count("Swift") == 2 and "Swift" in registry.skill_ids
+    assert registry.skill_id("Not A Skill") is None
+    assert skill_ids(json.dumps(["Python", "python", "Made Up", "Docker"])) == [
+        registry.skill_ids["Python"], registry.skill_ids["Docker"]
+    ]
+    print(f"  {len(registry.skill_names)} canonical skill ids")
+
+
+def test_ingest_matches_backfill():
+    """Test that the links written at ingest equal a backfill from the JSON columns."""
+    engine, db = make_session()
+    assert db.query(Skill).count() == len(get_skills_registry().skill_names)
+    ingested = link_rows(db)
+    assert ingested[0] and ingested[1]
+    # "Made Up" isn't in SKILLS_DATABASE and only lives in the JSON column
+    assert len([row for row in ingested[1] if row[0] == 1]) == 3
+
+    counts = backfill_skill_links(db)
+    assert counts["applications"] == 400 and counts["jobs"] == 2
+    assert link_rows(db) == ingested
+
+    # Re-linking happens when skills change: job update, application delete
+    recruiter = db.get(User, 1)
+    update_job_posting(job_id=2, job_update=JobPostingUpdate(preferred_skills=["AWS"]),
+                       background_tasks=BackgroundTasks(), current_user=recruiter, db=db)
+    aws = get_skills_registry().skill_ids["AWS"]
+    assert sorted(db.execute(select(JobSkill.skill_id, JobSkill.kind).where(JobSkill.job_id == 2))) == sorted([
+        (get_skills_registry().skill_ids["PHP"], "required"), (aws, "preferred")
+    ])
+    application = db.get(Application, 1)
+    db.delete(application)
+    db.commit()
+    assert db.query(ApplicationSkill).filter(ApplicationSkill.application_id == 1).count() == 0
+    print(f"  {counts['application_skills']} application and {counts['job_skills']} job skill links")
+
+
+def test_vocabulary_change():
+    """Test that new skills keep existing ids and that a vocabulary change re-links applications."""
+    engine, db = make_session()
+    assert stored_vocabulary_version(db) == get_skills_registry().version
+    assert sync_skills(db) == {"skills": 0, "applications": 0}
+    before = link_rows(db)
+    python = get_skills_registry().skill_ids["Python"]
+
+    # A new skill at the front of the first category (a positional id would shift every other id)
+    grown = dict(SKILLS_DATABASE, programming_languages=["Made Up"] + SKILLS_DATABASE["programming_languages"])
+    original = skills_database.SKILLS_REGISTRY
+    skills_database.SKILLS_REGISTRY = SkillsRegistry(grown, dict(SKILL_IDS, **{"Made Up": max(SKILL_IDS.values()) + 1}))
+    try:
+        counts = sync_skills(db)
+        assert counts == {"skills": 1, "applications": 400}
+        assert stored_vocabulary_version(db) == get_skills_registry().version != original.version
+        assert db.get(Skill, python).name == "Python"
+        made_up = get_skills_registry().skill_ids["Made Up"]
+        applications, jobs = link_rows(db)
+        # Existing links are unchanged; job 1's "Made Up" is now linked too
+        assert applications == before[0]
+        assert sorted(set(jobs) - set(before[1])) == [(1, made_up, "preferred")]
+
+        # Ids are never reassigned
+        swapped = dict(SKILL_IDS, **{"Made Up": made_up, "Python": SKILL_IDS["Java"], "Java": SKILL_IDS["Python"]})
+        skills_database.SKILLS_REGISTRY = SkillsRegistry(grown, swapped)
+        try:
+            sync_skills(db)
+            raise AssertionError("reassigned skill id accepted")
+        except ValueError as e:
+            assert "SKILL_IDS" in str(e)
+        db.rollback()
+        assert db.get(Skill, python).name == "Python"
+    finally:
+        skills_database.SKILLS_REGISTRY = original
+
+    try:
+        SkillsRegistry(grown, SKILL_IDS)
+        raise AssertionError("skill without an id accepted")
+    except ValueError as e:
+        assert "Made Up" in str(e)
+    print(f"  vocabulary change re-linked {counts['applications']} applications without moving ids")
+
+
+def test_skill_filter_and_counts():
+    """Test ?skills= on the applicant page and the per-skill counts against the JSON columns."""
+    engine, db = make_session()
+    recruiter = db.get(User, 1)
+    applications = json_skills(db, 1)
+
+    for skills in ["Python", "python,docker", "Kubernetes,Node.js,SQL"]:
+        wanted = {skill.strip().lower() for skill in skills.split(",")}
+        wanted = {get_skills_registry().canonical(skill).lower() for skill in wanted}
+        page = get_application_page_for_job(job_id=1, skills=skills, current_user=recruiter, db=db, **PAGE_PARAMS)
+        expected = {application_id for application_id, have in applications.items() if wanted <= have}
+        assert {item["id"] for item in page.items} == expected, skills
+        assert expected
+
+    try:
+        get_application_page_for_job(job_id=1, skills="Python,Cobol", current_user=recruiter, db=db, **PAGE_PARAMS)
+        raise AssertionError("unknown skill accepted")
+    except HTTPException as e:
+        assert e.status_code == 400 and "Cobol" in e.detail
+
+    counts = get_skill_counts_for_job(job_id=1, current_user=recruiter, db=db)
+    expected = Counter(skill for have in applications.values() for skill in have)
+    assert {count.skill.lower(): count.applicants for count in counts} == dict(expected)
+    assert [count.applicants for count in counts] == sorted((count.applicants for count in counts), reverse=True)
+    requirements = {count.skill: count.job_requirement for count in counts}
+    assert requirements["Python"] == "required" and requirements["Kubernetes"] == "preferred"
+    assert requirements["PHP"] is None
+
+    # The filter is answered from the covering job/skill index
+    statement = applications_with_skills(1, [1, 2])
+    compiled = statement.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        plan = [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")]
+    assert any("COVERING INDEX ix_application_skills_job_id_skill_id" in detail for detail in plan), plan
+    print(f"  skill filters and {len(counts)} skill counts agree with the JSON columns")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing skill index\n")
+    test_skill_ids()
+    test_ingest_matches_backfill()
+    test_vocabulary_change()
+    test_skill_filter_and_counts()
+    print("\n✅ Skill index tests passed")
@@ -0,0 +1,67 @@
+"""Test chunked, size-enforced resume uploads."""
+import asyncio
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from fastapi import HTTPException, UploadFile
+
+from upload_streaming import stream_upload_to_file
+
+SAMPLE_RESUME = backend_dir / "uploads" / "resumes" / "user_2_job_2.pdf"
+
+
+def store(filename: str, content: bytes, max_size_mb: int = 1):
+    """Stream content to a fresh directory; returns (status_code or size, files left behind)."""
+    with tempfile.TemporaryDirectory() as upload_dir:
+        file_path = Path(upload_dir) / f"resume{Path(filename).suffix}"
+        upload = UploadFile(file=io.BytesIO(content), filename=filename)
+        try:
+            outcome = asyncio.run(stream_upload_to_file(upload, file_path, max_size_mb=max_size_mb))
+        except HTTPException as e:
+            outcome = e.status_code
+        return outcome, sorted(p.name for p in Path(upload_dir).iterdir())
+
+
+def test_valid_upload_is_stored():
+    """Test that a valid PDF is copied intact."""
+    content = SAMPLE_RESUME.read_bytes()
+    outcome, files = store("resume.pdf", content)
+    print(f"  valid: {outcome} bytes -> {files}")
+    assert outcome == len(content)
+    assert files == ["resume.pdf"]
+
+
+def test_oversized_upload_is_rejected():
+    """Test that the size cap is enforced and nothing is left on disk."""
+    content = b"%PDF-1.4\n" + b"0" * (2 * 1024 * 1024)
+    outcome, files = store("resume.pdf", content)
+    print(f"  oversized: {outcome} -> {files}")
+    assert outcome == 413
+    assert files == []
+
+
+def test_mismatched_content_is_rejected():
+    """Test magic-byte sniffing of the first chunk."""
+    for filename, content in [
+        ("resume.pdf", b"<html>not a pdf</html>"),
+        ("resume.docx", b"%PDF-1.4 renamed"),
+        ("resume.pdf", b""),
+    ]:
+        outcome, files = store(filename, content)
+        print(f"  {filename} {content[:12]!r}: {outcome} -> {files}")
+        assert outcome == 400
+        assert files == []
+
+
+if __name__ == "__main__":
+    print("🧪 Testing upload streaming\n")
+    test_valid_upload_is_stored()
+    test_oversized_upload_is_rejected()
+    test_mismatched_content_is_rejected()
+    print("\n✅ Upload streaming tests passed")
@@ -8,7 +8,7 @@ sys.path.insert(0, str(backend_dir))
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from models import Application
+from models import ApplicationResume
 from ml_integration.tfidf_matching import train_tfidf_vectorizer, get_top_terms
 
 def main():
@@ -19,11 +19,11 @@ def main():
     Session = sessionmaker(bind=engine)
     session = Session()
 
-    # Load all applications
-    applications = session.query(Application).all()
-    print(f"Found {len(applications)} applications in database")
+    # Load the resume texts only (they live outside the applications table)
+    rows = session.query(ApplicationResume.resume_text).all()
+    print(f"Found {len(rows)} applications in database")
 
-    if len(applications) < 10:
+    if len(rows) < 10:
         print("⚠️  Warning: Less than 10 applications found. TF-IDF works best with more data.")
         print("   Using default vectorizer initialization.")
         session.close()
@@ -31,9 +31,9 @@ def main():
 
     # Extract resume texts
     resume_texts = []
-    for app in applications:
-        if app.resume_text and len(app.resume_text.strip()) > 0:
-            resume_texts.append(app.resume_text)
+    for (resume_text,) in rows:
+        if resume_text and len(resume_text.strip()) > 0:
+            resume_texts.append(resume_text)
 
     print(f"Prepared {len(resume_texts)} resume texts for training")
 
@@ -0,0 +1,330 @@
+"""Skill bitmaps and boolean skill queries over a job's applicant pool.
+
+Recruiters filter applicants with expressions such as
+
+    Python AND (Docker OR Kubernetes) AND NOT PHP
+
+Every application stores its canonical skills as a fixed-width bitset
+(Application.skill_bitmap: bit skill_id - 1 of the stable SKILL_IDS id in
+little-endian bit order, so the 124 skills of SKILLS_DATABASE take 16
+bytes). Bits never move when skills are added; skill_index.sync_skills
+re-encodes the stored bitmaps when the vocabulary version changes.
+SkillBitmapIndex turns a job's bitsets into a NumPy bit matrix with one
+row per skill and one bit per application, packed into uint64 words, so a
+query is a handful of vectorized AND / OR / NOT operations over n / 64
+words per skill.
+
+Parsing and evaluation recurse once per level of parentheses or NOT;
+queries nested deeper than SKILL_QUERY_MAX_DEPTH are rejected, and chains
+of AND / OR form a single n-ary node instead of a nested one per operator.
+
+Indexes are built lazily per job, kept per process and dropped when this
+process changes a job's applications (invalidate_skill_bitmaps). Entries
+older than SKILL_BITMAP_TTL_SECONDS are rebuilt, which bounds how long
+applications added by other processes go unseen.
+"""
+import os
+import re
+import threading
+import time
+from functools import lru_cache, reduce
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from models import Application
+from ml_integration.skills_database import get_skills_registry
+
+# Skill bitmap configuration - load from environment variables
+SKILL_BITMAP_TTL_SECONDS = float(os.getenv("SKILL_BITMAP_TTL_SECONDS", "300"))
+SKILL_QUERY_MAX_LENGTH = int(os.getenv("SKILL_QUERY_MAX_LENGTH", "500"))
+SKILL_QUERY_MAX_DEPTH = int(os.getenv("SKILL_QUERY_MAX_DEPTH", "32"))
+
+# Parentheses, a "quoted name" or a bare word
+_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+_OPERATORS = ("AND", "OR", "NOT")
+
+
+class SkillQueryError(ValueError):
+    """A skill query that can't be parsed or names unknown skills."""
+
+
+def bitmap_width() -> int:
+    """Bytes per stored bitmap for the current skills vocabulary (up to its highest id)."""
+    return (max(get_skills_registry().skill_ids.values()) + 7) // 8
+
+
+def encode_skill_bitmap(skill_ids: Iterable[int]) -> bytes:
+    """
+    Fixed-width bitset of canonical skill ids.
+
+    Args:
+        skill_ids: Canonical ids (SkillsRegistry.skill_ids), 1-based
+
+    Returns:
+        bitmap_width() bytes with bit skill_id - 1 set for every id
+    """
+    bits = np.zeros(bitmap_width() * 8, dtype=np.uint8)
+    bits[[skill_id - 1 for skill_id in skill_ids]] = 1
+    return np.packbits(bits, bitorder="little").tobytes()
+
+
+def decode_skill_bitmap(bitmap: Optional[bytes]) -> List[int]:
+    """Canonical skill ids set in a stored bitmap."""
+    if not bitmap:
+        return []
+    bits = np.unpackbits(np.frombuffer(bitmap, dtype=np.uint8), bitorder="little")
+    return (np.flatnonzero(bits) + 1).tolist()
+
+
+def _tokenize(query: str) -> List[Tuple[str, str]]:
+    """
+    (kind, value) tokens of a query; kind is '(', ')', 'op' or 'name'.
+
+    Consecutive bare words form one name (Machine Learning); quoted names
+    are taken as they are.
+    """
+    tokens = []
+    position = 0
+    query = query.strip()
+    while position < len(query):
+        match = _TOKEN.match(query, position)
+        if match is None:
+            raise SkillQueryError(f"Unbalanced quote at position {position}")
+        position = match.end()
+        opening, closing, quoted, word = match.groups()
+        if opening or closing:
+            tokens.append((opening or closing, opening or closing))
+        elif quoted is not None:
+            tokens.append(("name", quoted.strip()))
+        elif word.upper() in _OPERATORS:
+            tokens.append(("op", word.upper()))
+        elif tokens and tokens[-1][0] == "word":
+            tokens[-1] = ("word", f"{tokens[-1][1]} {word}")
+        else:
+            tokens.append(("word", word))
+    return [("name", value) if kind == "word" else (kind, value) for kind, value in tokens]
+
+
+class _Parser:
+    """Recursive-descent parser: or := and (OR and)*, and := not (AND not)*, not := NOT not | atom."""
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.position = 0
+        self.depth = 0
+
+    def peek(self) -> Tuple[Optional[str], Optional[str]]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self) -> Tuple[Optional[str], Optional[str]]:
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def descend(self):
+        """Enter a parenthesis or NOT; the recursion is bounded by SKILL_QUERY_MAX_DEPTH."""
+        self.depth += 1
+        if self.depth > SKILL_QUERY_MAX_DEPTH:
+            raise SkillQueryError(f"Skill query nested deeper than {SKILL_QUERY_MAX_DEPTH} levels")
+
+    def parse(self):
+        if not self.tokens:
+            raise SkillQueryError("Empty skill query")
+        node = self.parse_or()
+        if self.position < len(self.tokens):
+            raise SkillQueryError(f"Unexpected '{self.peek()[1]}'; join terms with AND / OR")
+        return node
+
+    def parse_or(self):
+        children = [self.parse_and()]
+        while self.peek() == ("op", "OR"):
+            self.take()
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else ("or",) + tuple(children)
+
+    def parse_and(self):
+        children = [self.parse_not()]
+        while self.peek() == ("op", "AND"):
+            self.take()
+            children.append(self.parse_not())
+        return children[0] if len(children) == 1 else ("and",) + tuple(children)
+
+    def parse_not(self):
+        if self.peek() == ("op", "NOT"):
+            self.take()
+            self.descend()
+            node = ("not", self.parse_not())
+            self.depth -= 1
+            return node
+        return self.parse_atom()
+
+    def parse_atom(self):
+        kind, value = self.take()
+        if kind == "(":
+            self.descend()
+            node = self.parse_or()
+            if self.take()[0] != ")":
+                raise SkillQueryError("Missing ')'")
+            self.depth -= 1
+            return node
+        if kind == "name":
+            return ("skill", value)
+        raise SkillQueryError("Unexpected end of query" if kind is None else f"Unexpected '{value}'")
+
+
+def _resolve(node, unknown: List[str]):
+    """Replace skill names with 0-based bit positions, collecting unknown names."""
+    if node[0] == "skill":
+        skill_id = get_skills_registry().skill_id(node[1])
+        if skill_id is None:
+            unknown.append(node[1])
+            return node
+        return ("skill", skill_id - 1)
+    return (node[0],) + tuple(_resolve(child, unknown) for child in node[1:])
+
+
+@lru_cache(maxsize=256)
+def parse_skill_query(query: str):
+    """
+    Parse a boolean skill query into a tree of ('skill', bit) / ('not', x) /
+    ('and', x, y, ...) / ('or', x, y, ...) tuples.
+
+    Raises:
+        SkillQueryError: Syntax errors, nesting deeper than
+            SKILL_QUERY_MAX_DEPTH and skills not in SKILLS_DATABASE
+    """
+    if len(query) > SKILL_QUERY_MAX_LENGTH:
+        raise SkillQueryError(f"Skill query longer than {SKILL_QUERY_MAX_LENGTH} characters")
+    unknown = []
+    tree = _resolve(_Parser(_tokenize(query)).parse(), unknown)
+    if unknown:
+        raise SkillQueryError(f"Unknown skills: {', '.join(dict.fromkeys(unknown))}")
+    return tree
+
+
+class SkillBitmapIndex:
+    """Bit matrix (skills x applications) of one job's applications."""
+
+    def __init__(self, application_ids: np.ndarray, bitmaps: bytes, width: int):
+        """
+        Args:
+            application_ids: Ids of the applications, in bitmap order
+            bitmaps: Their bitmaps, each exactly width bytes, concatenated
+            width: Bytes per bitmap
+        """
+        self.application_ids = application_ids
+        self.size = len(application_ids)
+        self.built_at = time.monotonic()
+
+        # applications x skill bits -> skill bits x applications, 64 per word
+        rows = np.frombuffer(bitmaps, dtype=np.uint8).reshape(self.size, width)
+        by_skill = np.unpackbits(rows, axis=1, bitorder="little").T
+        words = (self.size + 63) // 64
+        packed = np.zeros((width * 8, words * 8), dtype=np.uint8)
+        packed[:, :(self.size + 7) // 8] = np.packbits(by_skill, axis=1, bitorder="little")
+        self.matrix = packed.view(np.uint64)
+
+        # Bits of existing applications (NOT must not set the padding bits)
+        valid = np.zeros(words * 64, dtype=np.uint8)
+        valid[:self.size] = 1
+        self.valid = np.packbits(valid, bitorder="little").view(np.uint64)
+
+    def evaluate(self, tree) -> np.ndarray:
+        """Packed uint64 bitset of the applications matching a parsed query."""
+        kind = tree[0]
+        if kind == "skill":
+            return self.matrix[tree[1]]
+        if kind == "not":
+            return ~self.evaluate(tree[1]) & self.valid
+        combine = np.bitwise_and if kind == "and" else np.bitwise_or
+        return reduce(combine, (self.evaluate(child) for child in tree[1:]))
+
+    def match(self, query: str) -> np.ndarray:
+        """
+        Ids of the applications matching a skill query.
+
+        Raises:
+            SkillQueryError: Invalid query
+        """
+        matched = self.evaluate(parse_skill_query(query))
+        mask = np.unpackbits(matched.view(np.uint8), count=self.size, bitorder="little").view(bool)
+        return self.application_ids[mask]
+
+
+def _job_bitmaps(job_id: int):
+    """Statement selecting (application id, skill bitmap) of a job's applications."""
+    return select(Application.id, Application.skill_bitmap).where(Application.job_id == job_id)
+
+
+def build_skill_bitmap_index(rows) -> SkillBitmapIndex:
+    """Index over (application id, skill bitmap) rows; bitmaps of other widths are padded / cut."""
+    width = bitmap_width()
+    application_ids = []
+    chunks = []
+    for application_id, bitmap in rows:
+        application_ids.append(application_id)
+        if bitmap is None or len(bitmap) != width:
+            # Stored before the vocabulary grew (or never set)
+            bitmap = (bitmap or b"")[:width].ljust(width, b"\0")
+        chunks.append(bitmap)
+    return SkillBitmapIndex(np.array(application_ids, dtype=np.int64), b"".join(chunks), width)
+
+
+_indexes: Dict[int, SkillBitmapIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _cached_index(job_id: int) -> Optional[SkillBitmapIndex]:
+    """Loaded index of a job, unless missing or expired."""
+    with _indexes_lock:
+        index = _indexes.get(job_id)
+        if index is not None and time.monotonic() - index.built_at < SKILL_BITMAP_TTL_SECONDS:
+            return index
+    return None
+
+
+def _store_index(job_id: int, rows) -> SkillBitmapIndex:
+    """Build a job's index from (application id, bitmap) rows and cache it."""
+    index = build_skill_bitmap_index(rows)
+    with _indexes_lock:
+        _indexes[job_id] = index
+    return index
+
+
+def get_job_skill_bitmaps(db: Session, job_id: int) -> SkillBitmapIndex:
+    """
+    Skill bit matrix of a job's applications.
+
+    Args:
+        db: Database session (used only when the index is (re)built)
+        job_id: Job whose applications form the pool
+
+    Returns:
+        SkillBitmapIndex over every application of the job
+    """
+    index = _cached_index(job_id)
+    if index is not None:
+        return index
+    return _store_index(job_id, db.execute(_job_bitmaps(job_id)).all())
+
+
+async def get_job_skill_bitmaps_async(db: AsyncSession, job_id: int) -> SkillBitmapIndex:
+    """get_job_skill_bitmaps for async endpoints (same cache)."""
+    index = _cached_index(job_id)
+    if index is not None:
+        return index
+    return _store_index(job_id, (await db.execute(_job_bitmaps(job_id))).all())
+
+
+def invalidate_skill_bitmaps(job_id: Optional[int] = None):
+    """Drop a job's index, or every index and parsed query when job_id is None (rebuilt on next use)."""
+    with _indexes_lock:
+        if job_id is None:
+            _indexes.clear()
+            parse_skill_query.cache_clear()
+        else:
+            _indexes.pop(job_id, None)
@@ -0,0 +1,317 @@
+"""Relational skill index: which applications and jobs have which canonical skills.
+
+Application.extracted_skills and JobPosting.required_skills/preferred_skills
+are JSON text, so "which applicants have Kubernetes" meant loading and
+json.loads-ing every row. The skills, application_skills and job_skills
+tables hold the same skills keyed by stable skill id (SKILL_IDS), with
+covering indexes, so skill filters and per-skill counts are index lookups.
+
+The JSON columns stay the source for responses and scoring; the link rows
+(and Application.skill_bitmap, see skill_bitmap.py) are written next to
+them at ingest (application_skill_fields, job_skill_links) and
+migrate_add_skill_tables.py backfills existing rows with
+backfill_skill_links. Which extracted names resolve to which ids depends on
+the vocabulary, so sync_skills rebuilds the links and bitmaps whenever the
+registry version differs from the one recorded in skill_vocabulary.
+"""
+import json
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Select, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from models import JobPosting, Application, Skill, SkillVocabulary, ApplicationSkill, JobSkill
+from ml_integration.skills_database import get_skills_registry
+from skill_bitmap import encode_skill_bitmap, invalidate_skill_bitmaps
+
+JOB_SKILL_KINDS = ("required", "preferred")
+
+
+def _skill_list(value) -> List[str]:
+    """Skill names from a JSON column value or a list."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return []
+    return [skill for skill in value if isinstance(skill, str)]
+
+
+def skill_ids(skills) -> List[int]:
+    """
+    Canonical ids of skill names (any spelling), without duplicates.
+
+    Args:
+        skills: List of skill names or a JSON array column value
+
+    Returns:
+        Ids in first-appearance order; skills not in SKILLS_DATABASE are left out
+    """
+    registry = get_skills_registry()
+    ids = (registry.skill_id(skill) for skill in _skill_list(skills))
+    return list(dict.fromkeys(skill_id for skill_id in ids if skill_id is not None))
+
+
+def resolve_skill_names(names: Iterable[str]) -> Tuple[List[int], List[str]]:
+    """
+    Canonical ids of user-supplied skill names.
+
+    Returns:
+        (ids of the known names, names not in SKILLS_DATABASE)
+    """
+    registry = get_skills_registry()
+    ids, unknown = [], []
+    for name in names:
+        skill_id = registry.skill_id(name)
+        if skill_id is None:
+            unknown.append(name)
+        elif skill_id not in ids:
+            ids.append(skill_id)
+    return ids, unknown
+
+
+def application_skill_fields(job_id: int, skills) -> Dict:
+    """Application skill_links rows and skill_bitmap for an application's extracted skills."""
+    ids = skill_ids(skills)
+    return {
+        "skill_links": [ApplicationSkill(skill_id=skill_id, job_id=job_id) for skill_id in ids],
+        "skill_bitmap": encode_skill_bitmap(ids),
+    }
+
+
+def job_skill_links(required_skills, preferred_skills) -> List[JobSkill]:
+    """JobPosting.skill_links rows for a job's required and preferred skills."""
+    return [
+        JobSkill(skill_id=skill_id, kind=kind)
+        for kind, skills in zip(JOB_SKILL_KINDS, (required_skills, preferred_skills))
+        for skill_id in skill_ids(skills)
+    ]
+
+
+def replace_application_skill_links(db: Session, rows) -> int:
+    """
+    Rewrite the link rows of a batch of applications (not committed).
+
+    Args:
+        db: Database session
+        rows: (application id, job id, extracted skills) tuples or rows
+
+    Returns:
+        Number of link rows written
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+    db.execute(delete(ApplicationSkill).where(ApplicationSkill.application_id.in_([row[0] for row in rows])))
+    link_rows = [
+        {"application_id": application_id, "skill_id": skill_id, "job_id": job_id}
+        for application_id, job_id, skills in rows
+        for skill_id in skill_ids(skills)
+    ]
+    if link_rows:
+        db.execute(insert(ApplicationSkill), link_rows)
+    return len(link_rows)
+
+
+def update_skill_bitmaps(db: Session, rows):
+    """
+    Re-encode Application.skill_bitmap for a batch of applications (not committed).
+
+    Args:
+        db: Database session
+        rows: (application id, extracted skills) tuples or rows
+    """
+    mappings = [
+        {"id": application_id, "skill_bitmap": encode_skill_bitmap(skill_ids(skills))}
+        for application_id, skills in rows
+    ]
+    if mappings:
+        # executemany UPDATE applications SET skill_bitmap = ? WHERE id = ?
+        db.execute(update(Application), mappings)
+
+
+def backfill_skill_bitmaps(db: Session, chunk_size: int = 5000) -> int:
+    """
+    Re-encode Application.skill_bitmap of every application (committed per chunk).
+
+    Returns:
+        Number of applications encoded
+    """
+    encoded = 0
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Application.id, Application.extracted_skills)
+            .where(Application.id > last_id)
+            .order_by(Application.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        update_skill_bitmaps(db, rows)
+        db.commit()
+        encoded += len(rows)
+    invalidate_skill_bitmaps()
+    return encoded
+
+
+def sync_skills(db: Session, rebuild: bool = True) -> Dict[str, int]:
+    """
+    Add new skills of SKILLS_DATABASE to the skills table (committed).
+
+    Ids come from SKILL_IDS and are never reassigned: a stored skill whose
+    id belongs to another name is an error, not an update (only categories
+    are updated). When the registry version differs from the one the links
+    were built from, the links and bitmaps are rebuilt (rebuild_skill_index).
+
+    Args:
+        db: Database session
+        rebuild: Rebuild the links after a vocabulary change (False for
+            migrations that run before applications.skill_bitmap exists)
+
+    Returns:
+        Dictionary with the number of skills added or updated and of
+        applications re-linked
+
+    Raises:
+        ValueError: The stored skills and SKILL_IDS disagree on an id
+    """
+    registry = get_skills_registry()
+    stored = {row.id: row for row in db.execute(select(Skill.id, Skill.name, Skill.category))}
+    stored_ids = {row.name: row.id for row in stored.values()}
+
+    counts = {"skills": 0, "applications": 0}
+    for name in registry.skill_names:
+        skill_id = registry.skill_ids[name]
+        category = registry.category_of(name)
+        row = stored.get(skill_id)
+        if row is not None and row.name != name:
+            raise ValueError(f"Skill id {skill_id} is '{row.name}' in the database but '{name}' in SKILL_IDS")
+        if stored_ids.get(name, skill_id) != skill_id:
+            raise ValueError(f"'{name}' has id {stored_ids[name]} in the database but {skill_id} in SKILL_IDS")
+        if row is None:
+            db.add(Skill(id=skill_id, name=name, category=category))
+        elif row.category != category:
+            db.execute(update(Skill).where(Skill.id == skill_id).values(category=category))
+        else:
+            continue
+        counts["skills"] += 1
+    db.commit()
+
+    if rebuild and stored_vocabulary_version(db) != registry.version:
+        counts["applications"] = rebuild_skill_index(db)["applications"]
+    return counts
+
+
+def stored_vocabulary_version(db: Session) -> Optional[str]:
+    """SkillsRegistry.version the stored skill links were built from, if recorded."""
+    return db.scalar(select(SkillVocabulary.version).where(SkillVocabulary.id == 1))
+
+
+def rebuild_skill_index(db: Session, chunk_size: int = 5000) -> Dict[str, int]:
+    """
+    Rebuild the skill links and bitmaps for the current vocabulary and record its version (committed).
+
+    Returns:
+        backfill_skill_links counts
+    """
+    counts = backfill_skill_links(db, chunk_size)
+    backfill_skill_bitmaps(db, chunk_size)
+    db.merge(SkillVocabulary(id=1, version=get_skills_registry().version, synced_at=datetime.utcnow()))
+    db.commit()
+    return counts
+
+
+def backfill_skill_links(db: Session, chunk_size: int = 5000) -> Dict[str, int]:
+    """
+    Rebuild application_skills and job_skills from the JSON columns (committed).
+
+    Reads id-ordered chunks of only the id / job_id / skill columns and
+    writes each chunk's link rows with one executemany INSERT.
+
+    Returns:
+        Dictionary with the number of applications, jobs and link rows written
+    """
+    counts = {"applications": 0, "application_skills": 0, "jobs": 0, "job_skills": 0}
+
+    db.execute(delete(JobSkill))
+    jobs = db.execute(select(JobPosting.id, JobPosting.required_skills, JobPosting.preferred_skills)).all()
+    job_rows = [
+        {"job_id": job.id, "skill_id": link.skill_id, "kind": link.kind}
+        for job in jobs
+        for link in job_skill_links(job.required_skills, job.preferred_skills)
+    ]
+    if job_rows:
+        db.execute(insert(JobSkill), job_rows)
+    counts["jobs"] = len(jobs)
+    counts["job_skills"] = len(job_rows)
+
+    # Also drops the links of applications that no longer exist
+    db.execute(delete(ApplicationSkill))
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Application.id, Application.job_id, Application.extracted_skills)
+            .where(Application.id > last_id)
+            .order_by(Application.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        counts["applications"] += len(rows)
+        counts["application_skills"] += replace_application_skill_links(db, rows)
+
+    db.commit()
+    return counts
+
+
+def applications_with_skills(job_id: int, skill_ids_all: List[int]) -> Select:
+    """
+    Ids of a job's applications that have every one of the skills.
+
+    One range of ix_application_skills_job_id_skill_id per skill, grouped by
+    application; use as Application.id.in_(...).
+    """
+    return (
+        select(ApplicationSkill.application_id)
+        .where(ApplicationSkill.job_id == job_id, ApplicationSkill.skill_id.in_(skill_ids_all))
+        .group_by(ApplicationSkill.application_id)
+        .having(func.count() == len(skill_ids_all))
+    )
+
+
+def job_skill_counts(job_id: int) -> Select:
+    """
+    Number of a job's applicants with each skill, most common first.
+
+    Counted from the covering job/skill index; rows are (skill_id, name,
+    category, applicants, kind), kind being the job's 'required' /
+    'preferred' for that skill or None.
+    """
+    counts = (
+        select(ApplicationSkill.skill_id, func.count().label("applicants"))
+        .where(ApplicationSkill.job_id == job_id)
+        .group_by(ApplicationSkill.skill_id)
+        .subquery()
+    )
+    # A skill listed as both required and preferred reports 'required'
+    # (max of the two kinds)
+    kinds = (
+        select(JobSkill.skill_id, func.max(JobSkill.kind).label("kind"))
+        .where(JobSkill.job_id == job_id)
+        .group_by(JobSkill.skill_id)
+        .subquery()
+    )
+    return (
+        select(Skill.id.label("skill_id"), Skill.name, Skill.category, counts.c.applicants, kinds.c.kind)
+        .join(counts, counts.c.skill_id == Skill.id)
+        .outerjoin(kinds, kinds.c.skill_id == Skill.id)
+        .order_by(counts.c.applicants.desc(), Skill.name)
+    )
+
@@ -0,0 +1,92 @@
+"""Chunked, size-enforced storage of uploaded resumes.
+
+Uploads are copied to disk UPLOAD_CHUNK_SIZE_KB at a time instead of being
+read into memory whole, so each in-flight upload holds at most one chunk.
+The size cap (MAX_UPLOAD_SIZE_MB) is checked as chunks arrive and the copy
+stops as soon as it is crossed; the first chunk is sniffed for the magic
+bytes of the declared file type before anything else is written.
+"""
+import os
+import uuid
+from pathlib import Path
+
+from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+
+from ml_integration.resume_parser import sniff_resume_type, validate_resume_file
+
+# Upload configuration - load from environment variables
+MAX_UPLOAD_SIZE_MB = int(os.getenv("MAX_UPLOAD_SIZE_MB", "5"))
+UPLOAD_CHUNK_SIZE_KB = int(os.getenv("UPLOAD_CHUNK_SIZE_KB", "64"))
+
+
+def _remove_partial(file_path: Path):
+    """Delete a partially written upload if it exists."""
+    if file_path.exists():
+        os.remove(file_path)
+
+
+async def stream_upload_to_file(
+    upload: UploadFile,
+    file_path: Path,
+    max_size_mb: int = MAX_UPLOAD_SIZE_MB
+) -> int:
+    """
+    Copy an upload to file_path in fixed-size chunks, enforcing type and size.
+
+    The data is written to a temporary name next to file_path and only moved
+    into place once the whole upload has been accepted, so a rejected upload
+    never replaces an existing file.
+
+    Args:
+        upload: Uploaded resume
+        file_path: Destination path
+        max_size_mb: Maximum file size in MB
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        HTTPException: 400 for a wrong/empty file type, 413 once the size cap is crossed
+    """
+    validation_error = validate_resume_file(upload.filename, max_size_mb)
+    if validation_error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=validation_error)
+
+    chunk_size = UPLOAD_CHUNK_SIZE_KB * 1024
+    partial_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.part")
+    written = 0
+
+    out = await run_in_threadpool(open, partial_path, "wb")
+    try:
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+
+            if written == 0:
+                sniff_error = sniff_resume_type(upload.filename, chunk)
+                if sniff_error:
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=sniff_error)
+
+            written += len(chunk)
+            size_error = validate_resume_file(upload.filename, max_size_mb, file_size=written)
+            if size_error:
+                raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=size_error)
+
+            await run_in_threadpool(out.write, chunk)
+    except BaseException:
+        out.close()
+        _remove_partial(partial_path)
+        raise
+    else:
+        await run_in_threadpool(out.close)
+    finally:
+        await upload.close()
+
+    if written == 0:
+        _remove_partial(partial_path)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Uploaded file is empty")
+
+    os.replace(partial_path, file_path)
+    return written